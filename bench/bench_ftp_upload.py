@@ -0,0 +1,67 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file bench_ftp_upload.py
+ * @date 2026-10-18
+'''
+
+'''  FTP upload blocks/sec against a loopback satellite, by window size
+    to run > yarn bench_ftp_upload [latency_ms] [loss_percent] '''
+
+import random
+import sys
+import time
+sys.path.append("./src")
+from dummyUtils import LoopbackHandler
+from system import services
+from windowedSender import WindowedSender
+
+FTP = services['FTP_COMMAND']
+UPLOAD_SUBPORT = FTP['subservice']['FTP_UPLOAD_PACKET']['subPort']
+BLOCKSIZE = 512
+BLOCKS = 200
+TX_TIME = 512 * 8 / 115200 # one block at the UHF radio's 115200 baud
+
+def makeSatellite(lossPercent):
+    def satellite(server, port, buf):
+        # Reply with an error for a fraction of blocks so they get resent
+        err = -1 if random.uniform(0, 100) < lossPercent else 0
+        return [bytearray([UPLOAD_SUBPORT]) + err.to_bytes(1, byteorder='big', signed=True)]
+    return satellite
+
+def makePacket(count):
+    out = bytearray()
+    out.extend(UPLOAD_SUBPORT.to_bytes(1, byteorder='big'))
+    out.extend(int(1).to_bytes(4, byteorder='big'))
+    out.extend(count.to_bytes(4, byteorder='big'))
+    out.extend(BLOCKSIZE.to_bytes(4, byteorder='big'))
+    out.extend(bytes(BLOCKSIZE))
+    return out
+
+def checkReply(count, resp):
+    return WindowedSender.ACK if resp['err'] == 0 else WindowedSender.RETRY
+
+if __name__ == '__main__':
+    latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.1
+    loss = float(sys.argv[2]) if len(sys.argv) > 2 else 2
+    print("{} blocks of {} bytes, {:.0f} ms latency, {}% failed blocks".format(BLOCKS, BLOCKSIZE, latency * 1000, loss))
+    for window in [1, 2, 4, 8, 16, 32]:
+        random.seed(0)
+        link = LoopbackHandler(makeSatellite(loss), latency=latency, txTime=TX_TIME)
+        sender = WindowedSender(link, 1, FTP['port'], window, maxRetries=20)
+        start = time.monotonic()
+        sender.sendBlocks(range(BLOCKS), makePacket, checkReply, holdLast=True)
+        elapsed = time.monotonic() - start
+        print("window {:>3}: {:>7.1f} blocks/s  {:>8.0f} B/s  {:>3} retransmits".format(
+            window, BLOCKS / elapsed, BLOCKS * BLOCKSIZE / elapsed, sender.retransmits))
@@ -0,0 +1,96 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file bench_import.py
+ * @date 2026-10-18
+'''
+
+'''  Startup time of each entry point with the lazily loaded services table.
+    "eager" adds back loading every service and compiling every reply
+    decoder, which is what importing system.py and receiveParser.py used to
+    cost up front. The last row is decoding the first reply after startup,
+    which only loads the service the reply is from; "eager" adds back
+    loading every service, which the by-port lookup used to need.
+    to run > yarn bench_import [runs] '''
+
+import subprocess
+import sys
+
+# (entry point, module it imports at startup). docGen runs on import, and
+# all it imports is system.
+entryPoints = (
+    ("cli", "cli"),
+    ("ftp", "ftp"),
+    ("updater", "updater"),
+    ("beaconDecoder", "beaconDecoder"),
+    ("docGen", "system"),
+)
+
+probe = '''
+import sys, time
+sys.path.insert(0, "./src")
+start = time.perf_counter()
+import {module}
+lazy = time.perf_counter() - start
+start = time.perf_counter()
+from system import services
+services.loadAll()
+if "receiveParser" in sys.modules:
+    sys.modules["receiveParser"].compileDecoders()
+print(lazy, time.perf_counter() - start)
+'''
+
+# GET_TIME reply from EX2, the first thing a pass usually gets back
+firstReplyProbe = '''
+import sys, time
+sys.path.insert(0, "./src")
+from receiveParser import ReceiveParser
+from system import services
+parser = ReceiveParser()
+start = time.perf_counter()
+parser.parseReturnValue(1, 8, bytes([10, 0, 0, 0, 0, 0]))
+lazy = time.perf_counter() - start
+loaded = len(services.loaded)
+start = time.perf_counter()
+services.loadAll()
+print(lazy, time.perf_counter() - start, loaded)
+'''
+
+def measure(probe, runs):
+    best = None
+    for i in range(runs):
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True)
+        if result.returncode != 0:
+            return result.stderr.strip().splitlines()[-1]
+        fields = result.stdout.split()
+        lazy, deferred = float(fields[0]), float(fields[1])
+        if best is None or lazy < best[0]:
+            best = (lazy, deferred) + tuple(int(f) for f in fields[2:])
+    return best
+
+if __name__ == '__main__':
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    rows = [(name, probe.format(module=module)) for name, module in entryPoints]
+    rows.append(("first reply", firstReplyProbe))
+    for name, code in rows:
+        result = measure(code, runs)
+        if isinstance(result, str):
+            print("{:<15} skipped: {}".format(name, result))
+            continue
+        lazy, deferred = result[:2]
+        line = "{:<15} lazy {:>7.1f} ms  eager {:>7.1f} ms  saved {:>5.1f} ms ({:.0%})".format(
+            name, lazy * 1e3, (lazy + deferred) * 1e3, deferred * 1e3, deferred / (lazy + deferred))
+        if len(result) > 2:
+            line += "  {} service(s) loaded".format(result[2])
+        print(line)
@@ -0,0 +1,47 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file bench_receiveParser.py
+ * @date 2026-10-18
+'''
+
+'''  Per-packet reply decode time, field by field vs precompiled decoder
+    to run > yarn bench_receiveParser '''
+
+import os
+import timeit
+import sys
+sys.path.append("./src")
+from receiveParser import ReceiveParser, getDecoder
+from system import services
+
+def makeReply(src, dport, subPort):
+    decoder = getDecoder(src, dport, subPort)
+    return bytearray([subPort]) + bytearray(os.urandom(decoder.minLength - 1))
+
+def bench(name, src, dport, subPort, number=2000):
+    parser = ReceiveParser()
+    data = makeReply(src, dport, subPort)
+    before = timeit.timeit(lambda: parser.parseReturnValueByField(src, dport, data), number=number) / number
+    after = timeit.timeit(lambda: parser.parseReturnValue(src, dport, data), number=number) / number
+    print("{:<30} {:>6} bytes  field by field {:>9.1f} us  compiled {:>7.1f} us  x{:.1f}".format(
+        name, len(data), before * 1e6, after * 1e6, before / after))
+
+if __name__ == '__main__':
+    hk = services['HOUSEKEEPING']
+    time = services['TIME_MANAGEMENT']
+    bench("EX2.HOUSEKEEPING.GET_HK", 1, hk['port'], hk['subservice']['GET_HK']['subPort'], number=200)
+    bench("EX2.TIME_MANAGEMENT.GET_TIME", 1, time['port'], time['subservice']['GET_TIME']['subPort'])
+    beacon = services['BEACON_RX']
+    bench("BEACON.BEACON_RX.BEACON_PCKT_1", 99, beacon['port'], beacon['subservice']['BEACON_PCKT_1']['subPort'])
@@ -0,0 +1,89 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file bench_updater.py
+ * @date 2026-10-18
+'''
+
+'''  Firmware image upload time against a loopback satellite, by window size
+    to run > yarn bench_updater [latency_ms] [corrupt_percent] [image_kb] '''
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+sys.path.append("./src")
+from dummyUtils import LoopbackHandler, UpdaterSatellite
+from firmwareManifest import FirmwareManifest
+from updateJournal import UpdateJournal
+from inputParser import InputParser
+from receiveParser import ReceiveParser
+from system import services
+from updater import updater
+
+ADDRESS = 0x00200000
+BLOCKSIZE = 512
+TX_TIME = (BLOCKSIZE + 9) * 8 / 115200 # one block at the UHF radio's 115200 baud
+
+def makeUpdater(filename, link, window):
+    # Skips GroundStation.__init__, which opens a real CSP interface
+    up = object.__new__(updater)
+    up.services = services
+    up.inParse = InputParser()
+    up.receiveParse = ReceiveParser()
+    up.networkManager = link
+    up.setSatellite("EX2")
+    up.blocksize = BLOCKSIZE
+    up.address = ADDRESS
+    up.start_addr = ADDRESS
+    with contextlib.redirect_stdout(io.StringIO()):
+        up.setFile(filename)
+    up.doresume = False
+    up.window = window
+    up.delta = False
+    up.planOnly = False
+    up.manifest = FirmwareManifest(filename + ".manifest")
+    up.journal = UpdateJournal(filename + ".journal")
+    up.from_journal = False
+    up.skip = 0
+    up.current_block = 0
+    up.total_blocks = 0
+    return up
+
+if __name__ == '__main__':
+    latency = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.1
+    corrupt = float(sys.argv[2]) if len(sys.argv) > 2 else 1
+    size = int(sys.argv[3]) * 1024 if len(sys.argv) > 3 else 64 * 1024
+    with tempfile.NamedTemporaryFile(suffix=".bin") as image:
+        image.write(os.urandom(size))
+        image.flush()
+        print("{} byte image in {} byte blocks, {:.0f} ms latency, {}% corrupted blocks".format(
+            size, BLOCKSIZE, latency * 1000, corrupt))
+        manifest = image.name + ".manifest"
+        for window in [1, 2, 4, 8, 16, 32]:
+            satellite = UpdaterSatellite(corruptRate=corrupt / 100, seed=0)
+            link = LoopbackHandler(satellite, latency=latency, txTime=TX_TIME)
+            up = makeUpdater(image.name, link, window)
+            start = time.monotonic()
+            with contextlib.redirect_stdout(io.StringIO()):
+                up.run()
+            elapsed = time.monotonic() - start
+            if bytes(satellite.flash) != open(image.name, "rb").read():
+                raise Exception("Image on the satellite doesn't match the file")
+            print("window {:>3}: {:>7.2f} s  {:>8.0f} B/s  {:>4} packets".format(
+                window, elapsed, size / elapsed, len(link.sent)))
+        if os.path.exists(manifest):
+            os.remove(manifest)
@@ -0,0 +1,85 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file bench_updater_blocks.py
+ * @date 2026-10-18
+'''
+
+'''  Per-block PROGRAM_BLOCK preparation time, read and parse per block vs mapped image
+    to run > yarn bench_updater_blocks [image_kb] '''
+
+import binascii
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import timeit
+sys.path.append("./src")
+from inputParser import InputParser
+from system import services
+from updater import updater
+
+ADDRESS = 0x00200000
+BLOCKSIZES = [256, 512, 1024]
+
+def readAndParse(f, inParse, blocksize):
+    # What the updater did per block before the image was mapped
+    subservice = services.get('UPDATER').get('subservice').get('PROGRAM_BLOCK').get('subPort')
+    f.seek(0)
+    address = ADDRESS
+    while True:
+        data = f.read(blocksize)
+        if len(data) == 0:
+            break
+        out = bytearray()
+        out.extend(subservice.to_bytes(1, byteorder='big'))
+        out.extend(address.to_bytes(4, byteorder='big'))
+        out.extend(len(data).to_bytes(2, byteorder='big'))
+        out.extend(binascii.crc_hqx(data, 0).to_bytes(2, byteorder='big'))
+        out.extend(data)
+        command = inParse.parseInput("EX2.updater.PROGRAM_BLOCK({},{})".format(address, len(data)))
+        command['args'] = out
+        address += len(data)
+
+def makeUpdater(filename, blocksize):
+    up = object.__new__(updater)
+    up.services = services
+    up.blocksize = blocksize
+    up.address = ADDRESS
+    up.start_addr = ADDRESS
+    with contextlib.redirect_stdout(io.StringIO()):
+        up.setFile(filename)
+    return up
+
+def mapped(up):
+    for offset in range(0, up.filesize, up.blocksize):
+        up._get_block_packet(offset)
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) * 1024 if len(sys.argv) > 1 else 2048
+    with tempfile.NamedTemporaryFile(suffix=".bin") as image:
+        image.write(os.urandom(size))
+        image.flush()
+        inParse = InputParser()
+        print("{} byte image".format(size))
+        for blocksize in BLOCKSIZES:
+            blocks = -(-size // blocksize)
+            with open(image.name, "rb") as f:
+                before = timeit.timeit(lambda: readAndParse(f, inParse, blocksize), number=1) / blocks
+            setup = timeit.timeit(lambda: makeUpdater(image.name, blocksize), number=1)
+            up = makeUpdater(image.name, blocksize)
+            after = timeit.timeit(lambda: mapped(up), number=3) / 3 / blocks
+            print("{:>5} byte blocks: read and parse {:>7.1f} us/block  mapped {:>5.1f} us/block  x{:<6.1f} (setFile {:.0f} ms)".format(
+                blocksize, before * 1e6, after * 1e6, before / after, setup * 1000))
@@ -18,8 +18,9 @@
 '''
 
 import libcsp_py3 as libcsp
-import packetUtils
 from connectionManager import ConnectionManager
+from rttEstimator import RTTTable
+from receiveDispatcher import ReceiveDispatcher
 import serial
 from system import SatelliteNodes
 
@@ -44,6 +45,10 @@ class CSPHandler(object):
     # 'hmacKey' key to use for HMAC authentication
     def __init__(self, addr, interface, device, hmacKey, xteaKey, useFec):
         self.connectionManager = ConnectionManager()
+        self.rtt = RTTTable()
+        self.archive = None # TelemetryStore every reply is appended to, if set
+        self.dispatcher = ReceiveDispatcher(self.connectionManager.getConnections, self.connectionManager.read)
+        self.dispatcher.subscribe(self._onPacket)
         self.usingFec = useFec
         self.myAddr = addr;
         self.numberOfBuffers = 100
@@ -72,23 +77,59 @@ class CSPHandler(object):
         libcsp.rtable_load(stringBuild)
 
         libcsp.route_start_task()
+        self.dispatcher.start()
 
     def send(self, server, port, buf : bytearray):
-        packet = packetUtils.makePacket(buf)
-        conn = self.connectionManager.getConn(server,port)
-        libcsp.send(conn, packet)
-        libcsp.buffer_free(packet)
-
-    def receive(self, server, port, timeout):
-        conn = self.connectionManager.getConn(server,port)
-        packet = libcsp.read(conn, timeout)
-        data = None
-        if packet is None:
+        self.connectionManager.send(server, port, buf)
+        self.rtt.sent(server, port)
+
+    def receive(self, server, port, timeout=None, subPort=None):
+        """Next reply from (server, port), skipping replies for any other subPort if given"""
+        # No timeout given: use the round trip estimate for this port
+        if timeout is None:
+            timeout = self.rtt.getTimeout(server, port)
+        # Opening the connection here puts it on the dispatcher's read list
+        self.connectionManager.getConn(server, port)
+        entry = self.dispatcher.take(server, port, timeout, subPort)
+        if entry is None:
+            self.rtt.timedOut(server, port)
+            self.connectionManager.timedOut(server, port)
             raise Exception("No packet received after {} seconds".format(timeout // 1000))
-        data = packetUtils.breakPacket(packet)
-        libcsp.buffer_free(packet)
+        # Timed from when it arrived, and only once it's known to be a reply
+        # to this request rather than a late one to an earlier request
+        arrival, data = entry
+        self.rtt.received(server, port, arrival)
         return data
 
+    def flush(self, server, port):
+        """Discards replies still queued for (server, port), call before starting a new request"""
+        return self.dispatcher.flush(server, port)
+
+    def subscribe(self, callback, server=None, port=None):
+        """Calls callback(server, port, data) for every packet from (server, port)
+
+        None matches any server or port. Return True from the callback to keep
+        the packet from being queued for receive().
+        """
+        return self.dispatcher.subscribe(callback, server, port)
+
+    def unsubscribe(self, handle):
+        self.dispatcher.unsubscribe(handle)
+
+    def _onPacket(self, server, port, data):
+        # Runs on the dispatcher thread for every packet, late ones included
+        if self.archive is not None:
+            self.archive.append(server, port, data)
+
+    def getRTTStats(self):
+        return self.rtt.getStats()
+
+    def getReceiveStats(self):
+        return self.dispatcher.getStats()
+
+    def getConnectionStats(self):
+        return self.connectionManager.getStats()
+
     def listen(self, port):
         sock = libcsp.socket()
         libcsp.bind(sock, port)
@@ -0,0 +1,81 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file asyncCSPHandler.py
+ * @date 2026-10-18
+'''
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+class AsyncCSPHandler:
+    """asyncio front end for a CSPHandler (or anything with the same send/receive)
+
+    The blocking libcsp calls are run on a thread pool so a coroutine waiting
+    on one port doesn't hold up the others. Replies on a connection carry no
+    transaction id, so only one transaction per (dst, dport) is allowed in
+    flight at a time; transactions to different ports run concurrently.
+    """
+
+    def __init__(self, networkHandler, maxWorkers=8):
+        self.networkHandler = networkHandler
+        self.executor = ThreadPoolExecutor(max_workers=maxWorkers)
+        self.locks = dict()
+        self.pending = dict() # (dst, dport) -> future of the transaction in flight
+
+    def _lock(self, dst, dport):
+        if (dst, dport) not in self.locks:
+            self.locks[(dst, dport)] = asyncio.Lock()
+        return self.locks[(dst, dport)]
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def send(self, dst, dport, buf : bytearray):
+        return await self._run(self.networkHandler.send, dst, dport, buf)
+
+    async def receive(self, dst, dport, timeout):
+        return await self._run(self.networkHandler.receive, dst, dport, timeout)
+
+    async def transact(self, dst, dport, buf : bytearray, timeout):
+        """Sends buf and waits for the reply on the same port"""
+        async with self._lock(dst, dport):
+            self.pending[(dst, dport)] = asyncio.ensure_future(self._transact(dst, dport, buf, timeout))
+            try:
+                return await self.pending[(dst, dport)]
+            finally:
+                del self.pending[(dst, dport)]
+
+    async def _transact(self, dst, dport, buf, timeout):
+        # Anything still queued is a late reply to an earlier transaction
+        await self._run(self.networkHandler.flush, dst, dport)
+        await self.send(dst, dport, buf)
+        return await self.receive(dst, dport, timeout)
+
+    async def execute(self, transactObj):
+        """Runs a transaction object from InteractiveHandler without blocking the loop
+
+        Covers the special transactions (multi-packet HK, sat cli...) that do
+        more than one send and receive.
+        """
+        async with self._lock(transactObj.dst, transactObj.dport):
+            return await self._run(transactObj.execute)
+
+    def getPending(self):
+        """(dst, dport) pairs with a transaction currently in flight"""
+        return list(self.pending.keys())
+
+    def close(self):
+        self.executor.shutdown(wait=False)
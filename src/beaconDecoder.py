@@ -2,10 +2,12 @@ import socket
 import numpy as np
 import base64
 from receiveParser import ReceiveParser
+from telemetryStore import TelemetryStore
 import argparse
 
 parser = argparse.ArgumentParser(prog='beaconDecoder.py', description='Receive beacons from the satellites.')
 parser.add_argument('-d', '--debug', action='store_true', help="print debug output")
+parser.add_argument('-a', '--archive', type=str, default=None, help="directory to archive received beacons in")
 args = parser.parse_args()
 
 class beaconDecoder:
@@ -19,6 +21,7 @@ class beaconDecoder:
             print("Unable to connect to GNURadio. Is it running?")
             exit()
         self.parser = ReceiveParser()
+        self.archive = TelemetryStore(args.archive) if args.archive else None
 
   
     def beaconRunDecoder(self):
@@ -59,9 +62,11 @@ class beaconDecoder:
         try:
             if self.decoded_data[packet_num_offset] == 1:
                 self.decoded_data[:0] = (1).to_bytes(1,'big')
+                self.archiveBeacon(beacon_ID, beacon_port)
                 return self.parser.parseReturnValue(beacon_ID, beacon_port, self.decoded_data)
             elif self.decoded_data[packet_num_offset] == 2:
                 self.decoded_data[:0] = (2).to_bytes(1,'big')
+                self.archiveBeacon(beacon_ID, beacon_port)
                 return self.parser.parseReturnValue(beacon_ID, beacon_port, self.decoded_data)
             else:
                 print("Invalid beacon packet number")
@@ -69,6 +74,10 @@ class beaconDecoder:
             print("Unable to parse packet data")
         return None
 
+    def archiveBeacon(self, beacon_ID, beacon_port):
+        if self.archive is not None:
+            self.archive.append(beacon_ID, beacon_port, self.decoded_data)
+
 if __name__ == '__main__':
     decoder = beaconDecoder()
     while True:
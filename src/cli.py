@@ -17,10 +17,40 @@
  * @date 2022-07-21
 '''
 
+import asyncio
+import json
+import math
+import sys
+import time
+import numpy as np
+
+from asyncCSPHandler import AsyncCSPHandler
 from groundStation import GroundStation
 from options import optionsFactory
 
+def jsonValue(value):
+    """Turns a transaction's return value into something json can write"""
+    if isinstance(value, dict):
+        return {str(key): jsonValue(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [jsonValue(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return jsonValue(value.tolist())
+    if isinstance(value, np.generic):
+        return jsonValue(value.item())
+    if isinstance(value, (bytes, bytearray)):
+        # 'S' fields are zero terminated strings
+        return bytes(value).rstrip(b'\x00').decode('ascii', 'backslashreplace')
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
 class cli(GroundStation):
+    def __init__(self, opts):
+        super().__init__(opts)
+        self.interactive.splitSchedules = opts.split_schedule
+        self.interactive.hkTable = opts.hk_table
+
     def run(self):
         while(1):
             inStr = self.inputHandler.getInput("to send: ")
@@ -42,7 +72,142 @@ class cli(GroundStation):
                 print(e)
                 continue
 
+    def runBatchFile(self, opts):
+        """Batch mode: check every command in opts.batch, then run them
+
+        Nothing is sent unless the whole file parses. Returns the exit status.
+        """
+        if opts.batch == '-':
+            lines = sys.stdin.readlines()
+        else:
+            with open(opts.batch) as f:
+                lines = f.readlines()
+        commands, errors = self.loadBatch(lines)
+        for lineNumber, command, error in errors:
+            print("line {}: {}: {}".format(lineNumber, command, error), file=sys.stderr)
+        if errors:
+            print("{} of {} commands are invalid, nothing sent".format(len(errors), len(commands) + len(errors)), file=sys.stderr)
+            return 1
+        if opts.check:
+            print("{} commands OK".format(len(commands)), file=sys.stderr)
+            return 0
+
+        results = sys.stdout if opts.results == '-' else open(opts.results, 'w')
+        try:
+            start = time.monotonic()
+            records = self.runBatch(commands, results, opts.parallel, opts.stop_on_error)
+            wallTime = time.monotonic() - start
+        finally:
+            if results is not sys.stdout:
+                results.close()
+
+        failed = [r for r in records if not r['ok']]
+        latencies = [r['latency_ms'] for r in records]
+        print("{} commands, {} failed, {} not run, {:.1f} s wall clock".format(
+            len(records), len(failed), len(commands) - len(records), wallTime), file=sys.stderr)
+        if latencies:
+            print("latency ms: mean {:.0f}  max {:.0f}".format(sum(latencies) / len(latencies), max(latencies)), file=sys.stderr)
+        return 0 if not failed and len(records) == len(commands) else 1
+
+    def loadBatch(self, lines):
+        """Parses every command up front
+
+        Returns (commands, errors): (line number, command, transaction) for
+        each good line and (line number, command, message) for each bad one.
+        Blank lines and lines starting with # are skipped.
+        """
+        commands = list()
+        errors = list()
+        for lineNumber, line in enumerate(lines, 1):
+            command = line.strip()
+            if not command or command.startswith('#'):
+                continue
+            try:
+                transactObj = self.interactive.getTransactionObject(command, self.networkManager)
+                commands.append((lineNumber, command, transactObj))
+            except Exception as e:
+                errors.append((lineNumber, command, str(e)))
+        return commands, errors
+
+    def runBatch(self, commands, results, parallel=1, stopOnError=False):
+        """Runs commands from loadBatch, writing one JSON line per command to results
+
+        With parallel > 1 up to that many destination ports are worked on at
+        once; commands to the same port still run in file order. Returns the
+        result records in the order they finished.
+        """
+        if parallel <= 1:
+            records = list()
+            for lineNumber, command, transactObj in commands:
+                record = self._execute(lineNumber, command, transactObj)
+                self._writeResult(results, record, records)
+                if stopOnError and not record['ok']:
+                    break
+            return records
+        return asyncio.run(self._runParallel(commands, results, parallel, stopOnError))
+
+    async def _runParallel(self, commands, results, parallel, stopOnError):
+        handler = AsyncCSPHandler(self.networkManager, maxWorkers=parallel)
+        ports = dict()
+        for entry in commands:
+            ports.setdefault((entry[2].dst, entry[2].dport), list()).append(entry)
+        records = list()
+        slots = asyncio.Semaphore(parallel)
+        stop = asyncio.Event()
+
+        async def runPort(entries):
+            async with slots:
+                for lineNumber, command, transactObj in entries:
+                    if stop.is_set():
+                        return
+                    start = time.monotonic()
+                    try:
+                        ret = await handler.execute(transactObj)
+                        record = self._record(lineNumber, command, transactObj, start, True, ret)
+                    except Exception as e:
+                        record = self._record(lineNumber, command, transactObj, start, False, error=e)
+                    self._writeResult(results, record, records)
+                    if stopOnError and not record['ok']:
+                        stop.set()
+
+        try:
+            await asyncio.gather(*(runPort(entries) for entries in ports.values()))
+        finally:
+            handler.close()
+        return records
+
+    def _execute(self, lineNumber, command, transactObj):
+        start = time.monotonic()
+        try:
+            return self._record(lineNumber, command, transactObj, start, True, transactObj.execute())
+        except Exception as e:
+            return self._record(lineNumber, command, transactObj, start, False, error=e)
+
+    def _record(self, lineNumber, command, transactObj, start, ok, ret=None, error=None):
+        latency = (time.monotonic() - start) * 1000
+        record = {
+            'line': lineNumber,
+            'command': command,
+            'dst': transactObj.dst,
+            'dport': transactObj.dport,
+            'time': time.time() - latency / 1000,
+            'latency_ms': round(latency, 1),
+            'ok': ok,
+        }
+        if ok:
+            record['result'] = jsonValue(ret)
+        else:
+            record['error'] = str(error)
+        return record
+
+    def _writeResult(self, results, record, records):
+        records.append(record)
+        results.write(json.dumps(record, default=repr) + '\n')
+        results.flush()
+
 if __name__ == "__main__":
-    opts = optionsFactory("basic")
-    cliRunner = cli(opts.getOptions())
+    opts = optionsFactory("cli").getOptions()
+    cliRunner = cli(opts)
+    if opts.batch:
+        sys.exit(cliRunner.runBatchFile(opts))
     cliRunner.run()
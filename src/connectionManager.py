@@ -18,23 +18,231 @@
 '''
 
 import time
+import threading
 import libcsp_py3 as libcsp
-from collections import defaultdict
+import packetUtils
+from system import schema
+
+# libcsp connect() arguments by node type, a server address can be used as a
+# key too. EPS doesn't do HMAC/XTEA and answers quickly; anything not listed
+# uses 'default'.
+connectionOptions = {
+    'default': {
+        'prio': libcsp.CSP_PRIO_NORM,
+        'timeout': 1000000000,
+        'opts': libcsp.CSP_SO_HMACREQ | libcsp.CSP_SO_CRC32REQ | libcsp.CSP_SO_XTEAREQ,
+    },
+    'EPS': {
+        'prio': libcsp.CSP_PRIO_NORM,
+        'timeout': 1000,
+        'opts': libcsp.CSP_O_CRC32,
+    },
+}
+
+class PooledConnection:
+    """A libcsp connection plus the bookkeeping the pool needs to manage it"""
+
+    def __init__(self, server, port):
+        self.server = server
+        self.port = port
+        self.conn = None
+        self.lock = threading.Lock() # held while libcsp is using conn
+        self.opened = None
+        self.lastUsed = None
+        self.reconnects = 0
+        self.packetsSent = 0
+        self.bytesSent = 0
+        self.packetsReceived = 0
+        self.bytesReceived = 0
+        self.errors = 0
+        self.failures = 0 # connect failures in a row, for the backoff
+        self.timeouts = 0 # receive timeouts in a row
+        self.retryAt = 0
+
+    def getStats(self):
+        return {
+            'open': self.conn is not None,
+            'opened': self.opened,
+            'lastUsed': self.lastUsed,
+            'reconnects': self.reconnects,
+            'packetsSent': self.packetsSent,
+            'bytesSent': self.bytesSent,
+            'packetsReceived': self.packetsReceived,
+            'bytesReceived': self.bytesReceived,
+            'errors': self.errors,
+        }
 
 class ConnectionManager:
-    def __init__(self):
-        self.server_connection = defaultdict(dict)
+    """Pool of libcsp connections, one per (server, port)
+
+    Connections are opened on first use and reopened when they go bad: after
+    a send error, or after 'maxTimeouts' receive timeouts in a row with
+    nothing received. A connect that fails is retried with exponential
+    backoff between 'minBackoff' and 'maxBackoff' seconds, and raises
+    ConnectionError in the meantime. Connections unused for 'idleTimeout'
+    seconds are closed. Times are in seconds.
+    """
+
+    def __init__(self, options=None, idleTimeout=900, maxTimeouts=3, minBackoff=1, maxBackoff=300):
+        self.options = dict(connectionOptions)
+        if options is not None:
+            self.options.update(options)
+        self.idleTimeout = idleTimeout
+        self.maxTimeouts = maxTimeouts
+        self.minBackoff = minBackoff
+        self.maxBackoff = maxBackoff
+        self.pool = dict() # (server, port) -> PooledConnection
+        self.lastEviction = time.monotonic()
+        self.lock = threading.Lock() # AsyncCSPHandler and the receive thread call in too
+
+    def getOptions(self, server):
+        """connect() arguments for a server address"""
+        if server in self.options:
+            return self.options[server]
+        node = schema.getNodeByAddr(server)
+        if node is not None and node[0] in self.options:
+            return self.options[node[0]]
+        return self.options['default']
 
     def getConn(self, server, port):
-        if server not in self.server_connection or port not in self.server_connection[server]:
+        """Open connection to (server, port), connecting if needed"""
+        entry = self._entry(server, port)
+        with entry.lock:
+            return self._connect(entry)
+
+    def send(self, server, port, buf : bytearray):
+        entry = self._entry(server, port)
+        with entry.lock:
+            conn = self._connect(entry)
+            packet = packetUtils.makePacket(buf)
             try:
-                if server == 4 or server == 5 or server == 6: # I hate this
-                    conn = libcsp.connect(libcsp.CSP_PRIO_NORM, server, port, 1000, libcsp.CSP_O_CRC32)
-                else:
-                    conn = libcsp.connect(libcsp.CSP_PRIO_NORM, server, port, 1000000000, libcsp.CSP_SO_HMACREQ | libcsp.CSP_SO_CRC32REQ | libcsp.CSP_SO_XTEAREQ)
-            except Exception as e:
-                print(e)
+                libcsp.send(conn, packet)
+            except Exception:
+                entry.errors += 1
+                self._close(entry)
+                raise
+            finally:
+                libcsp.buffer_free(packet)
+            entry.packetsSent += 1
+            entry.bytesSent += len(buf)
+            entry.lastUsed = time.monotonic()
+
+    def read(self, server, port):
+        """Next packet's data from (server, port), or None without waiting
+
+        Also returns None while a send holds the connection, rather than
+        making the receive thread wait for it.
+        """
+        entry = self.pool.get((server, port))
+        if entry is None or not entry.lock.acquire(blocking=False):
+            return None
+        try:
+            if entry.conn is None:
                 return None
+            packet = libcsp.read(entry.conn, 0)
+            if packet is None:
+                return None
+            data = packetUtils.takePacketData(packet)
+            entry.packetsReceived += 1
+            entry.bytesReceived += len(data)
+            entry.timeouts = 0
+            entry.lastUsed = time.monotonic()
+            return data
+        finally:
+            entry.lock.release()
+
+    def timedOut(self, server, port):
+        """Called when a receive on (server, port) got nothing
+
+        Enough of these in a row and the connection is assumed dead (an RDP
+        connection closed by the other end, say) and reopened on next use.
+        """
+        entry = self.pool.get((server, port))
+        if entry is None:
+            return
+        with entry.lock:
+            entry.timeouts += 1
+            if entry.timeouts >= self.maxTimeouts:
+                entry.errors += 1
+                self._close(entry)
+
+    def getConnections(self):
+        """(server, port) of every open connection"""
+        self.evictIdle()
+        with self.lock:
+            return [key for key, entry in self.pool.items() if entry.conn is not None]
+
+    def evictIdle(self):
+        """Closes connections that haven't been used for idleTimeout seconds"""
+        now = time.monotonic()
+        if now - self.lastEviction < self.idleTimeout / 10:
+            return
+        self.lastEviction = now
+        with self.lock:
+            entries = list(self.pool.values())
+        for entry in entries:
+            with entry.lock:
+                if entry.conn is not None and now - entry.lastUsed > self.idleTimeout:
+                    self._close(entry)
+
+    def close(self, server, port):
+        entry = self.pool.get((server, port))
+        if entry is not None:
+            with entry.lock:
+                self._close(entry)
+
+    def closeAll(self):
+        with self.lock:
+            entries = list(self.pool.values())
+        for entry in entries:
+            with entry.lock:
+                self._close(entry)
+
+    def getStats(self):
+        """{(server, port): stats dict} for every connection used so far"""
+        with self.lock:
+            return {key: entry.getStats() for key, entry in self.pool.items()}
+
+    def _entry(self, server, port):
+        with self.lock:
+            if (server, port) not in self.pool:
+                self.pool[(server, port)] = PooledConnection(server, port)
+            return self.pool[(server, port)]
+
+    def _connect(self, entry):
+        # Called with entry.lock held
+        if entry.conn is not None:
+            entry.lastUsed = time.monotonic()
+            return entry.conn
+        now = time.monotonic()
+        if now < entry.retryAt:
+            raise ConnectionError("Connection to {} port {} failed, retrying in {:.0f} seconds".format(
+                entry.server, entry.port, entry.retryAt - now))
+        options = self.getOptions(entry.server)
+        reason = "no connection"
+        try:
+            conn = libcsp.connect(options['prio'], entry.server, entry.port, options['timeout'], options['opts'])
+        except Exception as e:
+            conn, reason = None, e
+        if conn is None:
+            entry.errors += 1
+            entry.failures += 1
+            entry.retryAt = now + min(self.maxBackoff, self.minBackoff * 2 ** (entry.failures - 1))
+            raise ConnectionError("Could not connect to {} port {}: {}".format(entry.server, entry.port, reason))
+        if entry.opened is not None:
+            entry.reconnects += 1
+        entry.conn = conn
+        entry.failures = 0
+        entry.timeouts = 0
+        entry.opened = entry.lastUsed = now
+        return conn
 
-            self.server_connection[server][port] = conn
-        return self.server_connection[server][port]
\ No newline at end of file
+    def _close(self, entry):
+        # Called with entry.lock held
+        if entry.conn is None:
+            return
+        try:
+            libcsp.close(entry.conn)
+        except Exception as e:
+            print(e)
+        entry.conn = None
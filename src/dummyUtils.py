@@ -17,8 +17,14 @@
  * @date 2022-07-30
 '''
 
+import binascii
 import random
+import queue
+import struct
+import time
+from collections import defaultdict
 from system import services
+from rttEstimator import RTTTable
 
 def generateFakeHKDict():
     """Returns a fake housekeeping dictionary for dummy responses
@@ -43,3 +49,129 @@ def generateFakeHKDict():
             raise NotImplementedError('Found data type not accounted for!')
 
     return fake_hk
+
+class LoopbackHandler:
+    """Offline stand-in for CSPHandler that answers from a python function
+
+    'responder' is called as responder(server, port, buf) for every packet
+    sent and returns a list of reply packets (or None for no reply). Each reply
+    becomes readable 'latency' seconds after the send, which makes it usable
+    both for offline tests and for measuring pipelining against a fake link.
+    'txTime' is the time the link is busy per packet sent, so back to back
+    packets queue up behind each other like on a real radio.
+    """
+
+    def __init__(self, responder, latency=0, txTime=0):
+        self.responder = responder
+        self.latency = latency
+        self.txTime = txTime
+        self.linkFreeAt = 0
+        self.queues = defaultdict(queue.Queue)
+        self.sent = list()
+        self.stale = 0
+        self.rtt = RTTTable()
+
+    def send(self, server, port, buf : bytearray):
+        self.sent.append((server, port, bytes(buf)))
+        self.rtt.sent(server, port)
+        self.linkFreeAt = max(time.monotonic(), self.linkFreeAt) + self.txTime
+        replies = self.responder(server, port, buf)
+        if replies is None:
+            return
+        readyAt = self.linkFreeAt + self.latency
+        for reply in replies:
+            self.queues[(server, port)].put((readyAt, bytearray(reply)))
+
+    def receive(self, server, port, timeout=None, subPort=None):
+        if timeout is None:
+            timeout = self.rtt.getTimeout(server, port)
+        deadline = time.monotonic() + timeout / 1000
+        replies = self.queues[(server, port)]
+        while True:
+            try:
+                readyAt, data = replies.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                self.rtt.timedOut(server, port)
+                raise Exception("No packet received after {} seconds".format(timeout // 1000))
+            if subPort is None or readyAt > deadline or data[0] == subPort:
+                break
+            self.stale += 1 # Reply to an earlier request
+        if readyAt > deadline:
+            # Arrives too late for this read, leave it for the next one
+            with replies.mutex:
+                replies.queue.appendleft((readyAt, data))
+                replies.not_empty.notify()
+            time.sleep(max(0, deadline - time.monotonic()))
+            self.rtt.timedOut(server, port)
+            raise Exception("No packet received after {} seconds".format(timeout // 1000))
+        delay = readyAt - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.rtt.received(server, port)
+        return data
+
+    def flush(self, server, port):
+        """Discards the replies that have arrived for (server, port), like CSPHandler.flush"""
+        replies = self.queues[(server, port)]
+        now = time.monotonic()
+        flushed = list()
+        with replies.mutex:
+            while replies.queue and replies.queue[0][0] <= now:
+                flushed.append(replies.queue.popleft()[1])
+        self.stale += len(flushed)
+        return flushed
+
+    def getRTTStats(self):
+        return self.rtt.getStats()
+
+class UpdaterSatellite:
+    """Stand-in for the OBC updater service, used as a LoopbackHandler responder
+
+    Like the satellite it only programs blocks in address order: a block that
+    isn't for the next address gets UPDATE_OUTOFORDER and one whose CRC
+    doesn't match gets UPDATE_CRCMISMATCH. 'corruptRate' is the fraction of
+    blocks damaged on the way up.
+    """
+    INITIALIZE_UPDATE = 0
+    PROGRAM_BLOCK = 1
+    GET_PROGRESS = 2
+
+    def __init__(self, corruptRate=0, seed=0):
+        self.corruptRate = corruptRate
+        self.random = random.Random(seed)
+        self.initialized = False
+        self.startAddr = 0
+        self.nextAddr = 0
+        self.crc = 0
+        self.flash = bytearray()
+
+    def __call__(self, server, port, buf):
+        subPort = buf[0]
+        if subPort == self.INITIALIZE_UPDATE:
+            self.startAddr, size, self.crc = struct.unpack_from('>IIH', buf, 1)
+            self.nextAddr = self.startAddr
+            self.flash = bytearray()
+            self.initialized = True
+            return [self._reply(subPort, 0)]
+        if subPort == self.GET_PROGRESS:
+            if not self.initialized:
+                return [self._reply(subPort, -3) + bytes(10)]
+            return [self._reply(subPort, 0) + struct.pack('>IIH', self.startAddr, self.nextAddr, self.crc)]
+        if subPort == self.PROGRAM_BLOCK:
+            address, length, crc = struct.unpack_from('>IHH', buf, 1)
+            data = bytes(buf[9:9 + length])
+            if not self.initialized:
+                return [self._reply(subPort, -3)]
+            if address != self.nextAddr:
+                return [self._reply(subPort, -6)]
+            if self.random.random() < self.corruptRate:
+                data = bytes([data[0] ^ 0xff]) + data[1:]
+            if binascii.crc_hqx(data, 0) != crc:
+                return [self._reply(subPort, -7)]
+            self.flash.extend(data)
+            self.nextAddr += length
+            return [self._reply(subPort, 0)]
+        return [self._reply(subPort, -9)]
+
+    def _reply(self, subPort, err):
+        return bytearray([subPort]) + err.to_bytes(1, byteorder='big', signed=True)
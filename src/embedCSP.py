@@ -17,62 +17,110 @@
  * @date 2022-07-21
 '''
 
-import re
+import struct
 from inputParser import InputParser
 from scheduleParser import ScheduleParser
 
-class EmbedPacket:
-    def __init__(self, commandList, data):
+# Each scheduled command: first, repeat and last times, then the embedded
+# packet's dst, dport and length, followed by the packet itself
+SCHEDULE_ENTRY = struct.Struct('>IIIBBH')
+
+# libcsp buffers are 1024 bytes (see CSPHandler.bufferSize), less room for
+# the HMAC, CRC32 and XTEA nonce libcsp appends to the data
+MAX_SCHEDULE_PACKET = 1024 - 16
+
+class ScheduleCompiler:
+    """Encodes schedule lines into as few SET_SCHEDULE packets as they fit in
+
+    Each distinct command is parsed and encoded once however many lines run
+    it, and the entries are packed in order into packets of at most
+    maxLength bytes, each starting with a copy of the SET_SCHEDULE header.
+    Splitting relies on SET_SCHEDULE adding to the schedule on board rather
+    than replacing it, which isn't confirmed yet, so a schedule that needs
+    more than one packet is refused unless 'split' is set.
+    """
+
+    def __init__(self, maxLength=MAX_SCHEDULE_PACKET):
         self.inputParse = InputParser()
         self.schedParse = ScheduleParser()
+        self.maxLength = maxLength
+        self.payloads = dict() # command string -> (dst, dport, encoded args)
+        self.stats = dict()
+
+    def encodeEntry(self, cronLine):
+        cmd = self.schedParse.parseCmd(cronLine)
+        payload = self.payloads.get(cmd['op'])
+        if payload is None:
+            command = self.inputParse.parseInput(cmd['op'])
+            payload = (command['dst'], command['dport'], bytes(command['args']))
+            self.payloads[cmd['op']] = payload
+        dst, dport, args = payload
+        return SCHEDULE_ENTRY.pack(cmd['first'], cmd['repeat'], cmd['last'], dst, dport, len(args)) + args
+
+    def compile(self, cmdList, header, split=False):
+        """Returns the list of packets for the lines in cmdList
+
+        Raises ValueError if a single entry is too big for a packet, or if
+        the schedule needs several packets and split isn't set.
+        """
+        header = bytes(header)
+        packets = list()
+        packet = None
+        entries = 0
+        for line in cmdList:
+            if line.strip() == "":
+                continue
+            entry = self.encodeEntry(line)
+            entries += 1
+            if len(header) + len(entry) > self.maxLength:
+                raise ValueError("Scheduled command is {} bytes, more than fits in a packet: {}".format(len(entry), line.strip()))
+            if packet is None or len(packet) + len(entry) > self.maxLength:
+                packet = bytearray(header)
+                packets.append(packet)
+            packet.extend(entry)
+        if not packets:
+            packets.append(bytearray(header))
+
+        used = sum(len(packet) for packet in packets)
+        self.stats = {
+            'entries': entries,
+            'uniqueCommands': len(self.payloads),
+            'packets': len(packets),
+            'bytes': used,
+            'packingEfficiency': used / (len(packets) * self.maxLength) if packets else 0,
+        }
+        if len(packets) > 1 and not split:
+            raise ValueError("Schedule needs {} SET_SCHEDULE packets, only one is sent unless splitting is enabled".format(len(packets)))
+        return packets
+
+    def getStats(self):
+        return self.stats
+
+class EmbedPacket:
+    def __init__(self, commandList, data, split=False):
+        self.compiler = ScheduleCompiler()
         self.data = data
         self.cmdList = commandList
-        self.cmds = list()
-        self.schedule = list()
+        self.split = split
 
     def embedCSP(self):
-        self._buildCommandList()
-        self._buildEmbeddedPacket()
+        """Appends the whole schedule to data, for callers that send one packet"""
+        for entry in self.cmdList:
+            if entry.strip() != "":
+                self.data.extend(self.compiler.encodeEntry(entry))
         return self.data
 
-
-    def _buildCommandList(self):
-        if len(self.cmdList) > 0:
-            for i in range(0, len(self.cmdList)):
-                # parse the time and command, then embed the command as a CSP packet
-                cmd = self.schedParse.parseCmd(self.cmdList[i])
-                command = self.inputParse.parseInput(cmd['op'])
-                command['first'] = cmd['first']
-                command['repeat'] = cmd['repeat']
-                command['last'] = cmd['last']
-                # append the list
-                print("Command: {}".format(command))
-                self.schedule.append(command)
-
-    def _buildEmbeddedPacket(self):
-        for cmd in self.schedule:
-            # for each line of command, place the fields into the CSP packet
-            # note that "to_bytes(4, byteorder='big')" == htonl() 
-            scheduledTime = cmd['first'].to_bytes(4, byteorder='big')
-            self.data.extend(scheduledTime)
-            scheduledTime = cmd['repeat'].to_bytes(4, byteorder='big')
-            self.data.extend(scheduledTime)
-            scheduledTime = cmd['last'].to_bytes(4, byteorder='big')
-            self.data.extend(scheduledTime)
-            scheduledDst = cmd['dst']
-            dst = (scheduledDst).to_bytes(1, byteorder='big')
-            self.data.extend(dst)
-            scheduledDport = cmd['dport']
-            dport = (scheduledDport).to_bytes(1, byteorder='big')
-            self.data.extend(dport)
-            packetContent = cmd['args']
-            oplen = len(packetContent).to_bytes(2, byteorder='big')
-            self.data.extend(oplen)
-            self.data.extend(packetContent)
+    def embedPackets(self):
+        """The schedule split into SET_SCHEDULE packets that each fit a CSP buffer"""
+        packets = self.compiler.compile(self.cmdList, self.data, self.split)
+        stats = self.compiler.getStats()
+        print("{} commands ({} distinct) in {} packet(s), {} bytes, {:.0%} packed".format(
+            stats['entries'], stats['uniqueCommands'], stats['packets'], stats['bytes'], stats['packingEfficiency']))
+        return packets
 
 
 if __name__ == "__main__":
-    commandList = ["0        50      1     7   4       5        5    52     ex2.time_management.get_time()"]
+    commandList = ["0        50      1     7   4       5        52     ex2.time_management.get_time()"]
     parser = InputParser()
     command = "EX2.SCHEDULER.SET_SCHEDULE()"
     commandDict = parser.parseInput(command)
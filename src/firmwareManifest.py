@@ -0,0 +1,132 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file firmwareManifest.py
+ * @date 2026-10-18
+'''
+
+import binascii
+import json
+import os
+
+def blockCrcs(data, blocksize):
+    """CRC of each blocksize chunk of data, as sent in PROGRAM_BLOCK"""
+    view = memoryview(data)
+    return [binascii.crc_hqx(view[i:i + blocksize], 0) for i in range(0, len(view), blocksize)]
+
+class FirmwareManifest:
+    """Block CRCs of the last image programmed to each satellite, kept in a JSON file
+
+    Entries are keyed by satellite name and flash address, and only written
+    once an update has gone through, so they describe what is on the
+    satellite as far as this ground station knows.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = dict()
+        if os.path.exists(self.path):
+            with open(self.path, "r") as f:
+                self.entries = json.load(f)
+
+    def _key(self, satellite, address):
+        return "{}@{:#x}".format(satellite, address)
+
+    def get(self, satellite, address):
+        return self.entries.get(self._key(satellite, address))
+
+    def record(self, satellite, address, size, crc, blocksize, blocks):
+        self.entries[self._key(satellite, address)] = {
+            'size': size,
+            'crc': crc,
+            'blocksize': blocksize,
+            'blocks': list(blocks),
+        }
+        # Write then rename, so a crash can't leave a half written manifest
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.entries, f)
+        os.replace(tmp, self.path)
+
+class DeltaPlan:
+    """Which blocks of a new image differ from the image on the satellite
+
+    'previous' is a manifest entry, or None if nothing is known about the
+    satellite, in which case every block counts as changed. So does every
+    block if the previous image used a different blocksize.
+
+    INITIALIZE_UPDATE erases the whole application, so the changed ranges are
+    only informational: the upload is either skipped, when the image is
+    already on the satellite, or the whole image is sent.
+    """
+
+    def __init__(self, blocksize, filesize, blocks, previous=None, crc=None):
+        self.blocksize = blocksize
+        self.filesize = filesize
+        self.previous = previous
+        if previous is None or previous['blocksize'] != blocksize:
+            self.changed = list(range(len(blocks)))
+        else:
+            old = previous['blocks']
+            self.changed = [i for i, crc in enumerate(blocks) if i >= len(old) or old[i] != crc]
+            if len(old) > len(blocks) and len(blocks) > 0 and (len(blocks) - 1) not in self.changed:
+                # The new image is shorter, so its last block is now partial
+                self.changed.append(len(blocks) - 1)
+        # 'crc' is the whole image CRC, checked against the manifest as well if given
+        self.unchanged = previous is not None and not self.changed and \
+            (crc is None or previous['crc'] == crc)
+
+    def _blockLength(self, block):
+        return min(self.blocksize, self.filesize - block * self.blocksize)
+
+    def getRanges(self):
+        """Changed bytes as a list of (offset, length), adjacent blocks merged"""
+        ranges = list()
+        for block in self.changed:
+            offset = block * self.blocksize
+            length = self._blockLength(block)
+            if ranges and ranges[-1][0] + ranges[-1][1] == offset:
+                ranges[-1] = (ranges[-1][0], ranges[-1][1] + length)
+            else:
+                ranges.append((offset, length))
+        return ranges
+
+    def getBytesChanged(self):
+        return sum(self._blockLength(block) for block in self.changed)
+
+    def getBytesToSend(self):
+        """What the upload will actually send"""
+        return 0 if self.unchanged else self.filesize
+
+    def getReport(self):
+        toSend = self.getBytesToSend()
+        return {
+            'known': self.previous is not None,
+            'blocks': -(-self.filesize // self.blocksize),
+            'changedBlocks': len(self.changed),
+            'ranges': self.getRanges(),
+            'bytesChanged': self.getBytesChanged(),
+            'bytesToSend': toSend,
+            'bytesSaved': self.filesize - toSend,
+        }
+
+    def format(self):
+        report = self.getReport()
+        if not report['known']:
+            return "No record of the image on the satellite, all {} bytes will be sent".format(self.filesize)
+        if self.unchanged:
+            return "Image is unchanged, nothing to send ({} bytes saved)".format(report['bytesSaved'])
+        return "{}/{} blocks changed in {} range(s), {} bytes: all {} bytes will be sent".format(
+            report['changedBlocks'], report['blocks'], len(report['ranges']),
+            report['bytesChanged'], report['bytesToSend'])
@@ -25,7 +25,12 @@ from random import randint
 from receiveParser import ReceiveParser
 from system import services
 import signal
-import pickle
+import sys
+import time
+import json
+import base64
+import numpy as np
+from windowedSender import WindowedSender
 
 class FTPData():
     # Stores a single data transaction
@@ -64,45 +69,251 @@ class FTPData():
     def __ne__(self, other):
         return self.blocknum != other.blocknum
 
+class ftpMetrics():
+    """Throughput counters for one download, kept by its ftpTransaction
+
+    Block counts are for this run only, so rates after a resume aren't
+    inflated by what was already on disk. Listeners are called with this
+    object after every block and burst.
+    """
+
+    def __init__(self, totalBlocks, alreadyReceived=0, clock=time.monotonic):
+        self.clock = clock
+        self.totalBlocks = totalBlocks
+        self.alreadyReceived = alreadyReceived
+        self.startTime = clock()
+        self.blocks = 0 # new blocks
+        self.bytes = 0
+        self.duplicates = 0
+        self.outOfOrder = 0 # blocks that arrived after a higher numbered one in the same burst
+        self.requested = 0 # blocks asked for, re-requests included
+        self.rerequested = 0
+        self.requestedFlags = bytearray(totalBlocks)
+        self.burstTimes = list()
+        self.burstStart = None
+        self.lastBlock = -1
+        self.listeners = list()
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def blocksRequested(self, ranges):
+        for skip, count in ranges:
+            self.requested += count
+            self.rerequested += count - self.requestedFlags[skip:skip + count].count(0)
+            self.requestedFlags[skip:skip + count] = b'\x01' * count
+
+    def burstStarted(self):
+        self.burstStart = self.clock()
+        self.lastBlock = -1
+
+    def burstEnded(self):
+        if self.burstStart is not None:
+            self.burstTimes.append(self.clock() - self.burstStart)
+            self.burstStart = None
+        self._notify()
+
+    def blockReceived(self, blocknum, length, new):
+        if new:
+            self.blocks += 1
+            self.bytes += length
+        else:
+            self.duplicates += 1
+        if blocknum < self.lastBlock:
+            self.outOfOrder += 1
+        self.lastBlock = blocknum
+        self._notify()
+
+    def getStats(self):
+        elapsed = self.clock() - self.startTime
+        blocksPerSec = self.blocks / elapsed if elapsed > 0 else 0
+        remaining = self.totalBlocks - self.alreadyReceived - self.blocks
+        return {
+            'elapsed': elapsed,
+            'blocks': self.blocks,
+            'received': self.alreadyReceived + self.blocks,
+            'totalBlocks': self.totalBlocks,
+            'bytes': self.bytes,
+            'blocksPerSec': blocksPerSec,
+            'bytesPerSec': self.bytes / elapsed if elapsed > 0 else 0,
+            'duplicates': self.duplicates,
+            'outOfOrder': self.outOfOrder,
+            'requested': self.requested,
+            'retransmitRatio': self.rerequested / self.requested if self.requested > 0 else 0,
+            'bursts': len(self.burstTimes),
+            'meanBurstTime': sum(self.burstTimes) / len(self.burstTimes) if self.burstTimes else None,
+            'eta': remaining / blocksPerSec if blocksPerSec > 0 else None,
+        }
+
+    def _notify(self):
+        for callback in self.listeners:
+            callback(self)
+
+class ProgressLine():
+    """Metrics listener that redraws one status line, at most every 'interval' seconds"""
+
+    def __init__(self, stream=sys.stdout, interval=0.25):
+        self.stream = stream
+        self.interval = interval
+        self.lastDraw = 0
+
+    def __call__(self, metrics):
+        now = time.monotonic()
+        if now - self.lastDraw < self.interval:
+            return
+        self.lastDraw = now
+        self.stream.write("\r" + self.format(metrics.getStats()) + "\033[K")
+        self.stream.flush()
+
+    def finish(self, metrics):
+        self.stream.write("\r" + self.format(metrics.getStats()) + "\033[K\n")
+        self.stream.flush()
+
+    @staticmethod
+    def format(stats):
+        eta = "--:--" if stats['eta'] is None else "{:02d}:{:02d}".format(*divmod(int(stats['eta']), 60))
+        burst = "-" if stats['meanBurstTime'] is None else "{:.1f}s".format(stats['meanBurstTime'])
+        return "{}/{} blocks {:5.1f}%  {:6.1f} blk/s  {:7.1f} B/s  dup {}  ooo {}  retx {:.0%}  burst {}  ETA {}".format(
+            stats['received'], stats['totalBlocks'], 100 * stats['received'] / max(1, stats['totalBlocks']),
+            stats['blocksPerSec'], stats['bytesPerSec'], stats['duplicates'], stats['outOfOrder'],
+            stats['retransmitRatio'], burst, eta)
+
 class ftpTransaction():
-    def __init__(self, reqID, totalBlocks : int, inFileName, outFileName):
+    # Resume state lives next to the download as a small json sidecar
+    stateDir = ".ftpTransactions"
+
+    def __init__(self, reqID, totalBlocks : int, inFileName, outFileName, blocksize=512, filesize=None, resume=False):
         self.reqID = reqID
-        self.received = list()
         self.totalBlocks = totalBlocks
+        self.blocksize = blocksize
+        self.filesize = filesize if filesize is not None else totalBlocks * blocksize
         self.inputFileName = inFileName
         self.outputFileName = outFileName
+        # One flag per block, and the blocks are written straight into place
+        # in the output file as they arrive
+        self.receivedFlags = bytearray(totalBlocks)
+        self.numReceived = 0
+        self.length = 0 # Only the last block can be short
+        self.metrics = ftpMetrics(totalBlocks)
+        if resume:
+            self.outFile = open(self.outputFileName, "r+b")
+        else:
+            self.outFile = open(self.outputFileName, "w+b")
+            self.outFile.truncate(self.filesize) # sparse until written
 
     def receiveData(self, data : FTPData):
+        """Writes a block to the output file, returns False if it was a duplicate"""
         if (data.getReqId() != self.reqID):
             raise ValueError("Block given does not match my ID!")
-        if data not in self.received:
-            self.received.append(data)
-            self.received.sort()
+        blocknum = int(data.getBlockNum()) # numpy uint16 from the parser would overflow the offset
+        if blocknum >= self.totalBlocks:
+            raise ValueError("Block {} out of range, expected {} blocks".format(blocknum, self.totalBlocks))
+        if self.receivedFlags[blocknum]:
+            self.metrics.blockReceived(blocknum, data.getDataLen(), False)
+            return False
+        offset = blocknum * self.blocksize
+        os.pwrite(self.outFile.fileno(), memoryview(data.getData()).cast('B'), offset)
+        self.length = max(self.length, offset + data.getDataLen())
+        self.receivedFlags[blocknum] = 1
+        self.numReceived += 1
+        self.metrics.blockReceived(blocknum, data.getDataLen(), True)
+        return True
 
     def isDone(self):
-        return len(self.received) == self.totalBlocks # true if finished
+        return self.numReceived == self.totalBlocks # true if finished
 
     def end(self):
-        out = bytearray()
-        for block in self.received:
-            out.extend(block.getData())
-        with open(self.outputFileName, "wb") as f:
-            f.write(out)
+        self.outFile.truncate(self.length)
+        self.outFile.close()
+        if os.path.exists(self.statePath(self.reqID)):
+            os.remove(self.statePath(self.reqID))
+
+    @classmethod
+    def statePath(cls, reqID):
+        return os.path.join(cls.stateDir, "{}.json".format(reqID))
+
+    def save(self):
+        """Writes the resume sidecar: transfer details plus a packed bitmap of received blocks"""
+        if not os.path.exists(self.stateDir):
+            os.mkdir(self.stateDir)
+        self.outFile.flush()
+        state = {
+            'reqID': self.reqID,
+            'totalBlocks': self.totalBlocks,
+            'blocksize': self.blocksize,
+            'filesize': self.filesize,
+            'length': self.length,
+            'inputFileName': self.inputFileName,
+            'outputFileName': self.outputFileName,
+            'received': base64.b64encode(np.packbits(np.frombuffer(self.receivedFlags, dtype=np.uint8)).tobytes()).decode("ascii"),
+        }
+        tmpPath = self.statePath(self.reqID) + ".tmp"
+        with open(tmpPath, "w") as f:
+            json.dump(state, f)
+        os.replace(tmpPath, self.statePath(self.reqID))
+
+    @classmethod
+    def load(cls, reqID):
+        with open(cls.statePath(reqID), "r") as f:
+            state = json.load(f)
+        transaction = cls(state['reqID'], state['totalBlocks'], state['inputFileName'], state['outputFileName'],
+                          state['blocksize'], state['filesize'], resume=True)
+        packed = np.frombuffer(base64.b64decode(state['received']), dtype=np.uint8)
+        flags = np.unpackbits(packed, count=transaction.totalBlocks)
+        transaction.receivedFlags = bytearray(flags.tobytes())
+        transaction.numReceived = int(flags.sum())
+        transaction.length = state['length']
+        transaction.metrics = ftpMetrics(transaction.totalBlocks, transaction.numReceived)
+        return transaction
 
     def getReqID(self):
         return self.reqID
 
+    def missingRanges(self):
+        """Runs of missing blocks as (first block, count), lowest first"""
+        ranges = []
+        start = self.receivedFlags.find(0)
+        while start != -1:
+            end = self.receivedFlags.find(1, start)
+            if end == -1:
+                end = self.totalBlocks
+            ranges.append((start, end - start))
+            start = self.receivedFlags.find(0, end)
+        return ranges
+
     def listMissing(self):
         missingBlocks = []
-        blocksReceived = [x.getBlockNum() for x in self.received]
-        for i in range(self.totalBlocks):
-            if i not in blocksReceived:
-                missingBlocks.append(i)
+        for start, count in self.missingRanges():
+            missingBlocks.extend(range(start, start + count))
         return missingBlocks
-    
+
     def getTotalBlocks(self):
         return self.totalBlocks
 
+def planBurstRequests(missingRanges, burstSize, maxRanges, coalesceGap=0):
+    """Picks the (skip, count) burst requests to send in one pass
+
+    Missing ranges separated by coalesceGap received blocks or fewer are
+    merged into one request, ranges longer than burstSize are split, and at
+    most maxRanges requests are returned, lowest blocks first.
+    """
+    merged = []
+    for start, count in missingRanges:
+        if merged and start - (merged[-1][0] + merged[-1][1]) <= coalesceGap:
+            merged[-1] = (merged[-1][0], start + count - merged[-1][0])
+        else:
+            merged.append((start, count))
+
+    requests = []
+    for start, count in merged:
+        while count > 0 and len(requests) < maxRanges:
+            requests.append((start, min(count, burstSize)))
+            start += burstSize
+            count -= burstSize
+        if len(requests) == maxRanges:
+            break
+    return requests
+
 class ftp(GroundStation):
     def __init__(self, opts):
         super(ftp, self).__init__(opts)
@@ -130,7 +341,7 @@ class ftp(GroundStation):
 
         self.destPort = self.services.get("FTP_COMMAND").get("port")
 
-    def shutdown(self):
+    def shutdown(self, *args):
         exit(0)
 
     def run(self):
@@ -143,8 +354,10 @@ class ftp(GroundStation):
         self.infile = file
 
     def _transaction(self, data):
+        # Anything still queued is a late reply to an earlier request
+        self.networkManager.flush(self.satelliteAddr, self.destPort)
         self.networkManager.send(self.satelliteAddr, self.destPort, data)
-        response = self.networkManager.receive(self.satelliteAddr, self.destPort, 10000)
+        response = self.networkManager.receive(self.satelliteAddr, self.destPort, subPort=data[0])
         return self.receiveParse.parseReturnValue(self.satelliteAddr, self.destPort, response)
 
 class ftpGetter(ftp):
@@ -152,6 +365,12 @@ class ftpGetter(ftp):
         super().__init__(opts)
         self.use_sband = opts.sband
         self.burst_size = opts.burst_size
+        self.max_burst_size = opts.burst_size
+        self.min_burst_size = min(8, opts.burst_size)
+        self.max_ranges = opts.max_ranges
+        self.coalesce_gap = 2 # Re-fetching a couple of blocks is cheaper than another request
+        self.metrics_file = opts.metrics
+        self.progress = ProgressLine()
         self.currentTransaction = None
         if opts.resume == 0:
             self.currentTransaction = self.makeNewDownloadTransaction(self.infile, self.outfile)
@@ -159,8 +378,7 @@ class ftpGetter(ftp):
             self.currentTransaction = self.resumeDownloadTransaction(opts.resume)
 
     def resumeDownloadTransaction(self, reqID : int):
-        with open(".ftpTransactions/{}.pickle".format(reqID), "rb") as f:
-            return pickle.loads(f.read())
+        return ftpTransaction.load(reqID)
 
     def makeNewDownloadTransaction(self, infile, outfile):
         size_packet = self._get_file_size_packet()
@@ -175,64 +393,107 @@ class ftpGetter(ftp):
         filesize = int(data['size'])
         req_id = randint(1,1652982075)
         total_blocks = filesize // self.blocksize
-        if total_blocks % self.blocksize > 0:
+        if filesize % self.blocksize > 0:
             total_blocks += 1
 
-        return ftpTransaction(req_id, total_blocks, infile, outfile)
+        return ftpTransaction(req_id, total_blocks, infile, outfile, self.blocksize, filesize)
 
     def run(self):
         print("Requesting file {} from satellite".format(self.infile))
         self._do_get_request()
 
-    def shutdown(self):
-        if not os.path.exists(".ftpTransactions"):
-            os.mkdir(".ftpTransactions")
-        with open(".ftpTransactions/{}.pickle".format(self.currentTransaction.getReqID()), "wb") as dumpfile:
-            pickle.dump(self.currentTransaction, dumpfile)
+    def shutdown(self, *args):
+        self.progress.finish(self.currentTransaction.metrics)
+        self.saveMetrics()
+        self.currentTransaction.save()
+        print("Download state saved, resume with -r {}".format(self.currentTransaction.getReqID()))
         super().shutdown()
 
     def _do_get_request(self):
-        received = 0
-        burst_size = self.burst_size
         req_id = self.currentTransaction.getReqID()
+        metrics = self.currentTransaction.metrics
+        metrics.subscribe(self.progress)
         while not self.currentTransaction.isDone():
-            missingBlocks = self.currentTransaction.listMissing()
-            skip = missingBlocks[0]
-            numToRequest = 1
-            numToSearch = self.burst_size if self.burst_size < len(missingBlocks) else len(missingBlocks)
-
-            for i in range(1, numToSearch):
-                if (missingBlocks[i] == missingBlocks[i - 1] + 1):
-                    numToRequest += 1
-                else:
+            # Ask for several gaps back to back, then collect all the bursts
+            ranges = planBurstRequests(self.currentTransaction.missingRanges(), self.burst_size,
+                                       self.max_ranges, self.coalesce_gap)
+            self._flush_port()
+            for skip, numToRequest in ranges:
+                download_packet = self._get_burst_download_packet(req_id, skip, numToRequest)
+                self.networkManager.send(self.satelliteAddr, self.destPort, download_packet)
+            metrics.blocksRequested(ranges)
+
+            # Coalesced requests re-fetch some blocks, only count the missing ones
+            wanted = sum(self.currentTransaction.receivedFlags[skip:skip + count].count(0) for skip, count in ranges)
+            before = self.currentTransaction.numReceived
+            timedOut = False
+            for i in range(len(ranges)):
+                metrics.burstStarted()
+                try:
+                    self._receive_burst()
+                except Exception as e:
+                    self.progress.finish(metrics)
+                    print(e)
+                    timedOut = True
                     break
-                
-            download_packet = self._get_burst_download_packet(req_id, skip, numToRequest)
-            self.networkManager.send(self.satelliteAddr, self.destPort, download_packet)
-            self._receive_burst()
+                finally:
+                    metrics.burstEnded()
+            newBlocks = self.currentTransaction.numReceived - before
+            self.currentTransaction.save()
+            if timedOut and newBlocks == 0:
+                raise Exception("No data from satellite, stopping download")
+            self._adapt_burst_size(wanted, newBlocks)
+        self.progress.finish(metrics)
         self.currentTransaction.end()
-        myfilename = ".ftpTransactions/{}.pickle".format(self.currentTransaction.getReqID())
-        if os.path.exists(myfilename):
-            os.remove(myfilename)
+        self.saveMetrics()
+
+    def saveMetrics(self):
+        """Writes the transfer metrics to the --metrics file, if one was given"""
+        if not self.metrics_file:
+            return
+        stats = self.currentTransaction.metrics.getStats()
+        stats['link'] = "sband" if self.use_sband else "uhf"
+        stats['file'] = self.infile
+        with open(self.metrics_file, "w") as f:
+            json.dump(stats, f, indent=1)
+
+    def _adapt_burst_size(self, requested, received):
+        # Shrink bursts quickly when blocks go missing, grow back slowly
+        # towards the configured size on a clean link
+        loss = 1 - received / requested if requested > 0 else 0
+        if loss > 0.2:
+            self.burst_size = max(self.min_burst_size, self.burst_size // 2)
+        elif loss < 0.05:
+            self.burst_size = min(self.max_burst_size, self.burst_size + max(1, self.burst_size // 4))
+
+    def _flush_port(self):
+        # Late packets from the last pass: data blocks carry their own block
+        # number so are still kept, a late end of burst reply would cut the
+        # next burst short so is dropped
+        dataSubPort = self.services.get("FTP_COMMAND").get('subservice').get('FTP_DATA_PACKET').get('subPort')
+        for packet in self.networkManager.flush(self.satelliteAddr, self.destPort):
+            if len(packet) > 0 and packet[0] == dataSubPort:
+                self._receive_data_packet(packet)
+
+    def _receive_data_packet(self, packet):
+        data = self.receiveParse.parseReturnValue(self.satelliteAddr, self.destPort, packet)
+        ftpData = FTPData(data['req_id'], data['blocknum'], data['data'])
+        try:
+            self.currentTransaction.receiveData(ftpData)
+        except Exception as e:
+            print(e)
 
     def _receive_burst(self):
-        received = 0
+        dataSubPort = self.services.get("FTP_COMMAND").get('subservice').get('FTP_DATA_PACKET').get('subPort')
         while True:
-            packet = self.networkManager.receive(self.satelliteAddr, self.destPort, 10000)
-            data = self.receiveParse.parseReturnValue(self.satelliteAddr, self.destPort, packet)
+            packet = self.networkManager.receive(self.satelliteAddr, self.destPort)
             # I know it's not good to hardcode the byte I want like this
             # but there's too much legacy so it won't change
-            if packet[0] == self.services.get("FTP_COMMAND").get('subservice').get('FTP_DATA_PACKET').get('subPort'):
-                ftpData = FTPData(data['req_id'], data['blocknum'], data['data'])
-                try:
-                    self.currentTransaction.receiveData(ftpData)
-                    print("Received block {}/{}".format(ftpData.getBlockNum(), self.currentTransaction.getTotalBlocks()))
-                except Exception as e:
-                    print(e)
-                    continue
+            if packet[0] == dataSubPort:
+                self._receive_data_packet(packet)
             else:
                 # Received service reply (final packet of burst download)
-                return data
+                return self.receiveParse.parseReturnValue(self.satelliteAddr, self.destPort, packet)
 
     def _get_burst_download_packet(self, req_id, skip, count):     
             subservice = self.services.get('FTP_COMMAND').get('subservice').get('REQUEST_BURST_DOWNLOAD').get('subPort')
@@ -258,6 +519,7 @@ class ftpGetter(ftp):
 class ftpSender(ftp):
     def __init__(self, opts):
         super().__init__(opts)
+        self.window = opts.window
 
     def run(self):
         self._do_post_request()
@@ -283,6 +545,9 @@ class ftpSender(ftp):
                 return
             if data['err'] < 0:
                 print("error {} from upload start packet".format(data['err']))
+            if self.window > 1:
+                self._do_windowed_post(f, req_id, filesize, count)
+                return
             done = False
             while not done:
                 print("Sending packet {}/{}".format(count, int(filesize/self.blocksize)))
@@ -302,6 +567,28 @@ class ftpSender(ftp):
                 if len(data) < self.blocksize:
                     done = True
 
+    def _do_windowed_post(self, f, req_id, filesize, first):
+        # The last block is the short one (empty if the file is a multiple of
+        # the blocksize), which tells the satellite the upload is complete
+        last = filesize // self.blocksize
+        total = last + 1
+
+        def makePacket(count):
+            print("Sending packet {}/{}".format(count, last))
+            f.seek(count * self.blocksize)
+            return self._get_data_upload_packet(req_id, f.read(self.blocksize), count)
+
+        def checkReply(count, resp):
+            if resp['err'] != 0:
+                print("error {} from upload data packet {}, resending".format(resp['err'], count))
+                return WindowedSender.RETRY
+            return WindowedSender.ACK
+
+        sender = WindowedSender(self.networkManager, self.satelliteAddr, self.destPort, self.window)
+        sender.sendBlocks(range(first, total), makePacket, checkReply, holdLast=True)
+        print("Sent {} packets for {} blocks ({} retransmitted)".format(
+            sender.packetsSent, total - first, sender.retransmits))
+
     def _get_data_upload_packet(self, req_id, data, count):
         subservice = self.services.get('FTP_COMMAND').get('subservice').get('FTP_UPLOAD_PACKET').get('subPort')
         out = bytearray()
@@ -22,6 +22,7 @@ from interactiveHandler import InteractiveHandler
 from inputHandler import InputHandler
 from system import GroundNodes
 from system import SatelliteNodes
+from telemetryStore import TelemetryStore
 
 class GroundStation:
     def __init__(self, opts):
@@ -45,6 +46,9 @@ class GroundStation:
             print(e)
             exit(1)
 
+        if opts.archive:
+            self.networkManager.archive = TelemetryStore(opts.archive)
+
         self.interactive = InteractiveHandler(opts.interface == "dummy")
         self.inputHandler = InputHandler()
         self.setSatellite(opts.satellite)
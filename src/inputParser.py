@@ -17,8 +17,156 @@
  * @date 2022-07-21
 '''
 
-from system import getServices, SatelliteNodes, varTypes
+from system import schema, SatelliteNodes, varTypes
 import numpy as np
+import struct
+from collections import OrderedDict
+
+# numpy dtype kind and size -> struct format character
+_structChars = {
+    ('u', 1): 'B', ('u', 2): 'H', ('u', 4): 'I', ('u', 8): 'Q',
+    ('i', 1): 'b', ('i', 2): 'h', ('i', 4): 'i', ('i', 8): 'q',
+    ('f', 2): 'e', ('f', 4): 'f', ('f', 8): 'd',
+    ('b', 1): '?',
+}
+
+class ArgEncoder:
+    """Packs a subservice's subPort and arguments with one precompiled struct.Struct
+
+    Raises ValueError at construction for argument lists struct can't express
+    (variable size args, mixed byte orders, odd types); InputParser falls back
+    to packing those one numpy array at a time.
+    """
+
+    def __init__(self, subPort, args):
+        self.subPort = subPort
+        self.names = list(args.keys()) if args else []
+        fmt = ''
+        order = None
+        self.tokenConverters = list()
+        self.valueConverters = list()
+        for name in self.names:
+            if args[name] == 'var':
+                raise ValueError("Variable size argument {}".format(name))
+            dtype = np.dtype(args[name])
+            if dtype.kind == 'S':
+                fmt += '{}s'.format(dtype.itemsize)
+                self.tokenConverters.append(lambda token: token.encode('ascii'))
+                self.valueConverters.append(lambda value: value.encode('ascii') if isinstance(value, str) else value)
+            elif (dtype.kind, dtype.itemsize) in _structChars:
+                fmt += _structChars[(dtype.kind, dtype.itemsize)]
+                # Same string conversions numpy does in np.array([token], dtype)
+                if dtype.kind == 'f':
+                    self.tokenConverters.append(float)
+                elif dtype.kind == 'b':
+                    self.tokenConverters.append(bool)
+                else:
+                    self.tokenConverters.append(int)
+                self.valueConverters.append(None)
+            else:
+                raise ValueError("Can't pack argument {} of type {}".format(name, args[name]))
+            if dtype.itemsize > 1 and dtype.kind != 'S':
+                fieldOrder = '>' if dtype.str[0] == '>' else '<'
+                if order is not None and order != fieldOrder:
+                    raise ValueError("Mixed byte order arguments")
+                order = fieldOrder
+        self.struct = struct.Struct((order or '>') + 'B' + fmt)
+
+    def pack(self, *values):
+        """Packs already typed argument values, e.g. pack(1598385718)"""
+        if len(values) != len(self.names):
+            raise ValueError('Wrong # of args')
+        values = [v if convert is None else convert(v) for v, convert in zip(values, self.valueConverters)]
+        try:
+            return bytearray(self.struct.pack(self.subPort, *values))
+        except struct.error as e:
+            raise ValueError("Bad argument: {}".format(e))
+
+    def packTokens(self, tokens):
+        """Packs argument strings from the command lexer"""
+        return self.pack(*[convert(token) for convert, token in zip(self.tokenConverters, tokens)])
+
+_encoders = dict()
+
+def getEncoder(nodeType, serviceName, subserviceName):
+    """Cached ArgEncoder for a subservice, or None if it can't be compiled"""
+    key = (nodeType, serviceName, subserviceName)
+    if key not in _encoders:
+        subservice = schema.getSubservice(nodeType, serviceName, subserviceName)
+        if subservice is None:
+            raise ValueError('No such subservice')
+        try:
+            _encoders[key] = ArgEncoder(subservice['subPort'], subservice['inoutInfo']['args'])
+        except (ValueError, TypeError, SyntaxError):
+            _encoders[key] = None
+    return _encoders[key]
+
+def encode(node, service, subservice, *args):
+    """Builds a command without going through the command string parser
+
+    e.g. encode("EX2", "TIME_MANAGEMENT", "SET_TIME", 1598385718)
+    Returns (dst, dport, packet bytes)
+    """
+    remote = schema.getSatellite(node.upper())
+    if remote is None:
+        raise ValueError("No such remote")
+    serv = schema.getService(remote[0], service.upper())
+    if serv is None:
+        raise ValueError('No such service')
+    encoder = getEncoder(remote[0], service.upper(), subservice.upper())
+    if encoder is None:
+        # Fall back to the string parser for arguments struct can't pack
+        argStr = "({})".format(",".join(str(a) for a in args)) if args else ""
+        command = InputParser().parseInput("{}.{}.{}{}".format(node, service, subservice, argStr))
+        return command['dst'], command['dport'], command['args']
+    return remote[2], serv['port'], encoder.pack(*args)
+
+class LRUCache:
+    """Small least recently used cache with hit/miss counters"""
+
+    def __init__(self, maxSize=256):
+        self.maxSize = maxSize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxSize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def getStats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.entries)}
+
+# Shared by every InputParser, so polling the same command from new
+# transaction objects doesn't lex and encode it again each time. Tokens are
+# cached by the exact command string, commands by the tokens: spellings that
+# lex the same share an entry, and nothing else does.
+_tokenCache = LRUCache()
+_commandCache = LRUCache()
+
+def getCacheStats():
+    return {'tokens': _tokenCache.getStats(), 'commands': _commandCache.getStats()}
+
+def _copyCommand(command):
+    # Callers extend or replace the args, so never hand out the cached ones
+    command = dict(command)
+    command['args'] = type(command['args'])(command['args'])
+    return command
 
 # TODO: rework this whole class
 
@@ -30,23 +178,27 @@ class InputParser:
         self.subserviceIdx = 4
 
     def parseInput(self, input : str):
+        key = tuple(self.lexer(input))
+        command = _commandCache.get(key)
+        if command is None:
+            command = self._parseInput(input)
+            if command is None:
+                return None
+            _commandCache.put(key, command)
+        return _copyCommand(command)
+
+    def _parseInput(self, input : str):
         tokens = self.lexer(input)
         command = {}
 
-        remote = None
-
-        for node in SatelliteNodes:
-            if node[1] == tokens[self.appIdx]:
-                remote = node
-                break
+        remote = schema.getSatellite(tokens[self.appIdx])
         if remote is None:
             raise ValueError("No such remote or bad format")
         command['dst'] = remote[2]
-        services = getServices(remote[0])
 
-        if tokens[self.serviceIdx] in services:
+        service = schema.getService(remote[0], tokens[self.serviceIdx])
+        if service is not None:
             # Matches <service>
-            service = services[tokens[self.serviceIdx]]
             command['dport'] = service['port']
             if 'subservice' not in service:
                 # Then there is no subservice, skip to arg check
@@ -70,8 +222,9 @@ class InputParser:
 
             if 'inoutInfo' not in subservice:
                 raise ValueError('No in/out info for subservice')
+            encoder = getEncoder(remote[0], tokens[self.serviceIdx], tokens[self.subserviceIdx])
             if not self.__argCheck(tokens[(
-                    self.subserviceIdx + 1)::], subservice['inoutInfo'], command, subservice['subPort']):
+                    self.subserviceIdx + 1)::], subservice['inoutInfo'], command, subservice['subPort'], encoder):
                 return None
         else:
             raise ValueError('No such subservice')
@@ -79,6 +232,13 @@ class InputParser:
         return command
 
     def lexer(self, input):
+        tokens = _tokenCache.get(input)
+        if tokens is None:
+            tokens = self._lexer(input)
+            _tokenCache.put(input, tokens)
+        return list(tokens)
+
+    def _lexer(self, input):
         tokenList = []
         splitInput = input.split("(")
         if len(splitInput) > 2 or len(splitInput) == 0:
@@ -109,7 +269,7 @@ class InputParser:
             tokenList[i] = tokenList[i].strip()
         return tokenList
 
-    def __argCheck(self, args, inoutInfo, command, subservice=None):
+    def __argCheck(self, args, inoutInfo, command, subservice=None, encoder=None):
         # TODO: wtf is this
         outArgs = bytearray()
 
@@ -131,6 +291,9 @@ class InputParser:
         args.pop(-1)
         if len(args) != len(inoutInfo['args']):
             raise ValueError('Wrong # of args')
+        if encoder is not None:
+            command['args'] = encoder.packTokens(args)
+            return command
         if subservice is not None:
             outArgs.extend([subservice])
  
@@ -20,20 +20,40 @@
 from system import services
 from dummyUtils import generateFakeHKDict
 from inputParser import InputParser
-from receiveParser import ReceiveParser
+from receiveParser import ReceiveParser, saveColumns
 from embedCSP import EmbedPacket
 import GNURadioHandler
 import libcsp_py3 as libcsp
 from uTransceiver import uTransceiver
+import os
 import time
 
 hkCommands = ["GET_HK", "GET_INSTANT_HK", "GET_LATEST_HK"]; # List of HK commands that need a special handler
 
+# (service, subservice) -> transaction class, subservice None matches the
+# whole service. Filled in by the registerTransaction decorators below.
+transactionTypes = dict()
+dummyTransactionTypes = dict()
+
+def registerTransaction(service, subservices=(None,), dummy=False):
+    """Class decorator: use this transaction class for the given commands"""
+    registry = dummyTransactionTypes if dummy else transactionTypes
+    def register(cls):
+        for subservice in subservices:
+            registry[(service, subservice)] = cls
+        return cls
+    return register
+
+def lookupTransaction(registry, service, subservice, default):
+    return registry.get((service, subservice)) or registry.get((service, None)) or default
+
 class InteractiveHandler:
-    def __init__(self, dummy=False):
+    def __init__(self, dummy=False, splitSchedules=False, hkTable=None):
         self.services = services
         self.inParser = InputParser()
         self.dummy = dummy # Use dummy responses instead
+        self.splitSchedules = splitSchedules # Send schedules too big for one SET_SCHEDULE in several
+        self.hkTable = hkTable # File to save HK replies to as a table, instead of returning them
         self.fake_hk_id = 1 # Dummy value for HK dataPosition
 
         # TODO: This is bad, make it good when fixing inputParser
@@ -42,45 +62,26 @@ class InteractiveHandler:
         self.subserviceIdx = 4
 
     def getTransactionObject(self, command : str, networkHandler):
-        transactObj = None
-        # TODO: Make this less bad after fixing inputParser badness
-        tokens = self.inParser.lexer(command)
         if self.dummy:
-            transactObj = self.getDummyTransactionObject(command, networkHandler)
-        elif tokens[self.serviceIdx] == "HOUSEKEEPING" and tokens[self.subserviceIdx] in hkCommands:
-            transactObj = getHKTransaction(command, networkHandler)
-        elif tokens[self.serviceIdx] == "CLI":
-            transactObj = satcliTransaction(command, networkHandler)
-        elif tokens[self.serviceIdx] == "SCHEDULER" and (tokens[self.subserviceIdx] == "SET_SCHEDULE"):
-            transactObj = schedulerTransaction(command, networkHandler)
-        elif tokens[self.serviceIdx] == "TIME_MANAGEMENT" and tokens[self.subserviceIdx] == "SET_TIME":
-            transactObj = setTimeTransaction(command, networkHandler)
-        elif tokens[self.serviceIdx] == "IRIS" and (tokens[self.subserviceIdx] in ["IRIS_SET_TIME"]):
-            transactObj = irisTransaction(command, networkHandler)
-        elif tokens[self.serviceIdx] == "NS_PAYLOAD":
-            transactObj = longTimeoutTransaction(command, networkHandler)
-        elif (tokens[self.serviceIdx] == "GENERAL") and (tokens[self.subserviceIdx == "DEPLOY_DEPLOYABLES"]):
-            transactObj = longTimeoutTransaction(command, networkHandler)
-        elif tokens[self.serviceIdx] == "COMMUNICATION" and (tokens[self.subserviceIdx] in ["UHF_SET_RF_MODE"]):
-            transactObj = setRFModeTransaction(command, networkHandler)
-        else:
-            transactObj = baseTransaction(command, networkHandler)
-
-        return transactObj
+            return self.getDummyTransactionObject(command, networkHandler)
+        tokens = self.inParser.lexer(command)
+        transactClass = lookupTransaction(transactionTypes, tokens[self.serviceIdx], tokens[self.subserviceIdx], baseTransaction)
+        if transactClass is schedulerTransaction:
+            return transactClass(command, networkHandler, self.splitSchedules)
+        if transactClass is getHKTransaction:
+            return transactClass(command, networkHandler, self.hkTable)
+        return transactClass(command, networkHandler)
 
     def getDummyTransactionObject(self, command: str, networkHandler):
-        transactObj = None
         tokens = self.inParser.lexer(command)
-        if tokens[self.serviceIdx] == "HOUSEKEEPING" and tokens[self.subserviceIdx] in hkCommands:
+        transactClass = lookupTransaction(dummyTransactionTypes, tokens[self.serviceIdx], tokens[self.subserviceIdx], dummyTransaction)
+        if transactClass is dummyHKTransaction:
             transactObj = dummyHKTransaction(command, networkHandler, self.fake_hk_id)
             self.fake_hk_id += 1
-        elif tokens[self.serviceIdx] == "CLI":
-            transactObj = dummySatCliTransaction(command, networkHandler)
-        elif tokens[self.serviceIdx] == "SCHEDULER" and (tokens[self.subserviceIdx] in ['SET_SCHEDULE', 'DELETE_SCHEDULE']):
-            transactObj = dummySchedulerTransaction(command, networkHandler)
-        else:
-            transactObj = dummyTransaction(command, networkHandler)
-        return transactObj
+            return transactObj
+        if transactClass is dummySchedulerTransaction:
+            return transactClass(command, networkHandler, self.splitSchedules)
+        return transactClass(command, networkHandler)
 
 class baseTransaction:
     def __init__(self, command, networkHandler):
@@ -92,13 +93,21 @@ class baseTransaction:
         self.dst = self.pkt["dst"]
         self.dport = self.pkt['dport']
         self.args = self.pkt['args']
-        self.timeout = 10000;
+        self.timeout = None # None: picked per port from the network handler's RTT estimate
+        # Never less than this, so a command that is slower than the others
+        # on its port isn't timed out on the strength of a few quick replies
+        self.minTimeout = 5000
 
     def send(self):
+        # Anything still queued is a late reply to an earlier request
+        self.networkHandler.flush(self.dst, self.dport)
         self.networkHandler.send(self.dst, self.dport, self.args)
 
     def receive(self):
-        return self.networkHandler.receive(self.dst, self.dport, self.timeout)
+        timeout = self.timeout
+        if timeout is None:
+            timeout = self.networkHandler.rtt.getTimeout(self.dst, self.dport, self.minTimeout)
+        return self.networkHandler.receive(self.dst, self.dport, timeout, self.pkt.get('subservice'))
 
     def parseReturnValue(self, data):
         return self.returnParse.parseReturnValue(self.dst, self.dport, data)
@@ -116,11 +125,17 @@ class dummyTransaction(baseTransaction):
             'args': self.args
         }
 
+@registerTransaction("NS_PAYLOAD")
+@registerTransaction("GENERAL", ["DEPLOY_DEPLOYABLES"])
+@registerTransaction("UPDATER", ["INITIALIZE_UPDATE", "ERASE_APP", "VERIFY_APP", "VERIFY_GOLDEN"])
 class longTimeoutTransaction(baseTransaction): 
     def __init__(self, command, networkHandler):
         super().__init__(command, networkHandler)
-        self.timeout = 40000
+        # These commands take a while to run on board, so never time out
+        # sooner than this however quick the link is
+        self.minTimeout = 40000
 
+@registerTransaction("TIME_MANAGEMENT", ["SET_TIME"])
 class setTimeTransaction(baseTransaction):
     def execute(self):
         tokens = self.inputParse.lexer(self.command)
@@ -135,48 +150,102 @@ class setTimeTransaction(baseTransaction):
         self.send()
         return self.parseReturnValue(self.receive())
 
+@registerTransaction("SCHEDULER", ["SET_SCHEDULE"])
 class schedulerTransaction(baseTransaction):
+    def __init__(self, command, networkHandler, split=False):
+        super().__init__(command, networkHandler)
+        self.split = split
+
     def execute(self):
         tokens = self.inputParse.lexer(self.command)
         file_param = tokens[-2]
         with open(file_param, "r") as f:
             cmdList = f.readlines()
-        packetEmbedder = EmbedPacket(cmdList, self.args)
-        self.args = packetEmbedder.embedCSP()
-        self.send()
-        return self.parseReturnValue(self.receive())
+        packetEmbedder = EmbedPacket(cmdList, self.args, self.split)
+        # With split set, big schedules go up in several packets, each adding to the schedule
+        for packet in packetEmbedder.embedPackets():
+            self.args = packet
+            self.send()
+            ret = self.parseReturnValue(self.receive())
+            if ret is None:
+                raise Exception("Could not parse the reply to SET_SCHEDULE")
+            if ret['err'] != 0:
+                break
+        return ret
 
+@registerTransaction("SCHEDULER", ["SET_SCHEDULE", "DELETE_SCHEDULE"], dummy=True)
 class dummySchedulerTransaction(baseTransaction):
+    def __init__(self, command, networkHandler, split=False):
+        super().__init__(command, networkHandler)
+        self.split = split
+
     def execute(self):
         tokens = self.inputParse.lexer(self.command)
         file_param = tokens[-2]
         with open(file_param, "r") as f:
             cmdList = f.readlines()
-        packetEmbedder = EmbedPacket(cmdList, self.args)
-        self.args = packetEmbedder.embedCSP()
+        packetEmbedder = EmbedPacket(cmdList, self.args, self.split)
+        packets = packetEmbedder.embedPackets()
         return {
             'err': 0,
             'dst': self.dst,
             'dport': self.dport,
-            'args': self.args
+            'args': packets[0] if len(packets) == 1 else packets
         }
 
+@registerTransaction("HOUSEKEEPING", hkCommands)
 class getHKTransaction(baseTransaction):
+    def __init__(self, command, networkHandler, tableFile=None):
+        super().__init__(command, networkHandler)
+        self.tableFile = tableFile
+
     def execute(self):
+        if self.tableFile is not None:
+            outfile = self.nextTableFile()
+            table = self.executeBulk(outfile)
+            if table is None:
+                return "No HK packets received"
+            return "{} HK packet(s) saved to {}".format(len(table), outfile)
+        return [self.parseReturnValue(ret) for ret in self.receiveAll()]
+
+    def executeBulk(self, outfile=None):
+        """Like execute, but decodes all the HK packets at once into a table
+
+        Returns a numpy structured array with one row per packet, optionally
+        also saved to outfile (see receiveParser.saveColumns)
+        """
+        table = self.returnParse.parseReturnValues(self.dst, self.dport, self.receiveAll())
+        if outfile is not None and table is not None:
+            saveColumns(table, outfile)
+        return table
+
+    def nextTableFile(self):
+        """First of <name>-0001<ext>, <name>-0002<ext>... that doesn't exist yet
+
+        Every HK command gets its own file, so none overwrites what an
+        earlier command or an earlier run saved.
+        """
+        root, ext = os.path.splitext(self.tableFile)
+        count = 1
+        while os.path.exists("{}-{:04d}{}".format(root, count, ext)):
+            count += 1
+        return "{}-{:04d}{}".format(root, count, ext)
+
+    def receiveAll(self):
+        # Keep reading until the satellite clears the 'final' flag
         self.send()
         rxlist = list()
-        rxData = dict()
         while True:
             try:
                 ret = self.receive()
             except:
                 return rxlist
-            rxData = self.parseReturnValue(ret)
-            rxlist.append(rxData)
+            rxlist.append(ret)
             if ret[2] != 1:
                 break
         return rxlist
 
+@registerTransaction("HOUSEKEEPING", hkCommands, dummy=True)
 class dummyHKTransaction(getHKTransaction):
     def __init__(self, command, networkHandler, fake_hk_id):
         super().__init__(command, networkHandler)
@@ -195,6 +264,7 @@ class dummyHKTransaction(getHKTransaction):
 
         return hk_list
 
+@registerTransaction("CLI")
 class satcliTransaction(baseTransaction):
     def execute(self):
         response = ""
@@ -207,6 +277,7 @@ class satcliTransaction(baseTransaction):
                 break
         return response.strip()
 
+@registerTransaction("IRIS", ["IRIS_SET_TIME"])
 class irisTransaction(baseTransaction):
     def execute(self):
         tokens = self.inputParse.lexer(self.command)
@@ -224,6 +295,7 @@ class irisTransaction(baseTransaction):
 
         return self.parseReturnValue(self.receive())
 
+@registerTransaction("COMMUNICATION", ["UHF_SET_RF_MODE"])
 class setRFModeTransaction(baseTransaction):
     def __init__(self, command, networkHandler):
         super().__init__(command, networkHandler)
@@ -236,6 +308,7 @@ class setRFModeTransaction(baseTransaction):
         self.gnuradio.setUHF_RFMode(self.args[1])
         return "Pipe timeout complete"
 
+@registerTransaction("CLI", dummy=True)
 class dummySatCliTransaction(satcliTransaction):
     def execute(self):
         response = """Running as SatCli command \
@@ -29,6 +29,8 @@ def optionsFactory(kind : str):
         return FTPOptions()
     elif (kind  == "sband"):
         return SBANDOptions();
+    elif (kind == "cli"):
+        return CLIOptions()
     else:
         raise NotImplementedError("Options class type {} not implemented".format(type))
 
@@ -79,6 +81,11 @@ class Options(object):
             type=str,
             default="EX2",
             help='Satellite parameter for automatic programs (e.g FTP): EX2, ARS, or YKS. Default is EX2')
+        self.parser.add_argument(
+            '--archive',
+            type=str,
+            default=None,
+            help='Directory to archive every received reply in (see telemetryStore.py). Default is no archive')
         self.parser.add_argument(
             '--fec',
             action='store_true',
@@ -91,11 +98,53 @@ class Options(object):
             opts = self.parser.parse_args(sys.argv[1:])
         return opts
 
+class CLIOptions(Options):
+    def __init__(self):
+        super().__init__()
+
+    def getOptions(self, argv=None):
+        self.parser.add_argument(
+            '-b',
+            '--batch',
+            type=str,
+            default=None,
+            help='Run the commands in this file (- for stdin) instead of prompting, one per line. Lines starting with # are skipped')
+        self.parser.add_argument(
+            '-o',
+            '--results',
+            type=str,
+            default='-',
+            help='File to write one JSON result per batch command to. Default is stdout')
+        self.parser.add_argument(
+            '-j',
+            '--parallel',
+            type=int,
+            default=1,
+            help='Number of destination ports to run batch commands on at once. Commands to the same port always run in file order. Default is 1 (whole file in order)')
+        self.parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only parse and validate the batch file, send nothing')
+        self.parser.add_argument(
+            '--stop-on-error',
+            action='store_true',
+            help='Stop the batch at the first command that fails')
+        self.parser.add_argument(
+            '--split-schedule',
+            action='store_true',
+            help='Send schedules too big for one SET_SCHEDULE packet in several. Only safe if SET_SCHEDULE adds to the schedule on board')
+        self.parser.add_argument(
+            '--hk-table',
+            type=str,
+            default=None,
+            help='Decode housekeeping replies in bulk and save them as tables instead of printing them: .npz for one array per field, otherwise a .npy record array. Each HK command saves to a new file, e.g. hk-0001.npz, hk-0002.npz for --hk-table hk.npz')
+        return super().getOptions(argv)
+
 class UpdateOptions(Options):
     def __init__(self):
         super().__init__();
 
-    def getOptions(self):
+    def getOptions(self, argv=None):
         self.parser.add_argument(
             '-f',
             '--file',
@@ -126,8 +175,37 @@ class UpdateOptions(Options):
             default=None,
             help="Provide file CRC. Can be hex or decimal"
         )
+        self.parser.add_argument(
+            '-w',
+            '--window',
+            type=int,
+            default=1,
+            help="Number of blocks to keep in flight. Default is 1 (wait for each reply)"
+        )
+        self.parser.add_argument(
+            '--delta',
+            action='store_true',
+            help="Compare with the last image programmed (see --manifest) and skip the upload if it's unchanged"
+        )
+        self.parser.add_argument(
+            '--plan',
+            action='store_true',
+            help="Only report which blocks differ from the last image programmed"
+        )
+        self.parser.add_argument(
+            '--manifest',
+            type=str,
+            default='updater_manifest.json',
+            help="File recording the block CRCs of the last image programmed to each satellite"
+        )
+        self.parser.add_argument(
+            '--journal',
+            type=str,
+            default='updater_journal',
+            help="Directory to keep the progress of unfinished updates in, so the next run carries on from there"
+        )
 
-        return super().getOptions();
+        return super().getOptions(argv);
 
 
 class FTPOptions(Options):
@@ -159,6 +237,11 @@ class FTPOptions(Options):
             type=int,
             default='100',
             help='Number of packets to receive in a single burst download')
+        self.parser.add_argument(
+            '--max-ranges',
+            type=int,
+            default=4,
+            help='Number of burst downloads to request back to back for separate gaps. Default is 4')
         self.parser.add_argument(
             '--sband',
             action='store_true',
@@ -177,6 +260,19 @@ class FTPOptions(Options):
             default=0,
             help="Number of bytes to skip"
         )
+        self.parser.add_argument(
+            '-w',
+            '--window',
+            type=int,
+            default=1,
+            help="Number of upload packets to keep in flight. Default is 1 (wait for each reply)"
+        )
+        self.parser.add_argument(
+            '--metrics',
+            type=str,
+            default=None,
+            help="Write download throughput metrics as JSON to this file when the transfer ends"
+        )
         return super().getOptions(argv);
 
 class SBANDOptions(Options):
@@ -18,11 +18,36 @@
 '''
 
 import libcsp_py3 as libcsp
+from contextlib import contextmanager
 
 def breakPacket(packet):
     data = bytearray(libcsp.packet_get_data(packet))
     return data
 
+@contextmanager
+def packetView(packet):
+    """Zero-copy memoryview of a packet's data, frees the packet on exit
+
+    The view is released when the with block ends. Copy anything that has to
+    outlive the packet, including numpy arrays decoded from the view, which
+    share its memory.
+    """
+    view = memoryview(libcsp.packet_get_data(packet))
+    try:
+        yield view
+    finally:
+        view.release()
+        libcsp.buffer_free(packet)
+
+def takePacketData(packet):
+    """Packet data that outlives the packet, frees the packet
+
+    libcsp already hands back its own bytes object, which is kept as it is;
+    only a view into the libcsp buffer is copied.
+    """
+    with packetView(packet) as view:
+        return view.obj if isinstance(view.obj, bytes) else view.tobytes()
+
 def makePacket(data : bytearray):
     packet = libcsp.buffer_get(len(data))
     if len(data) > 0:
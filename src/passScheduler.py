@@ -0,0 +1,170 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file passScheduler.py
+ * @date 2026-10-18
+'''
+
+import itertools
+import time
+
+class QueuedCommand:
+    """A transaction waiting for a pass, with what the scheduler needs to place it"""
+
+    def __init__(self, transactObj, command, priority, deadline, duration, seq):
+        self.transactObj = transactObj
+        self.command = command
+        self.priority = priority # higher runs first
+        self.deadline = deadline # unix time it must be done by, or None
+        self.duration = duration # expected seconds on the link
+        self.seq = seq # order it was queued in, breaks ties
+
+    def getReport(self, reason=None):
+        report = {
+            'command': self.command,
+            'priority': self.priority,
+            'deadline': self.deadline,
+            'duration': self.duration,
+        }
+        if reason is not None:
+            report['reason'] = reason
+        return report
+
+class PassScheduler:
+    """Ground side command queue that fits queued work into a pass
+
+    Commands are queued with a priority and optional deadline, then planned
+    against a pass window: the highest priority commands are taken first, and
+    each one is kept only if everything taken so far can still finish by its
+    deadline (and LOS) when run earliest deadline first. Whatever doesn't fit
+    is deferred and stays queued for the next pass, with the reason.
+
+    Durations are estimates: given when queuing, or else one reply timeout
+    from the network handler's RTT estimate for that port. Timestamps are
+    unix times in seconds.
+    """
+
+    def __init__(self, interactive, networkHandler, defaultDuration=10, clock=time.time, sleep=time.sleep):
+        self.interactive = interactive
+        self.networkHandler = networkHandler
+        self.defaultDuration = defaultDuration
+        self.clock = clock
+        self.sleep = sleep
+        self.queue = list()
+        self.counter = itertools.count()
+
+    def add(self, command, priority=0, deadline=None, duration=None):
+        """Queues a command string, or any transaction object with execute()
+
+        Command strings are parsed straight away, so bad commands are caught
+        before the pass rather than during it.
+        """
+        if isinstance(command, str):
+            transactObj = self.interactive.getTransactionObject(command, self.networkHandler)
+        else:
+            transactObj = command
+            command = getattr(transactObj, 'command', repr(transactObj))
+        if duration is None:
+            duration = self.estimateDuration(transactObj)
+        queued = QueuedCommand(transactObj, command, priority, deadline, duration, next(self.counter))
+        self.queue.append(queued)
+        return queued
+
+    def estimateDuration(self, transactObj):
+        rtt = getattr(self.networkHandler, 'rtt', None)
+        if rtt is None or not hasattr(transactObj, 'dport'):
+            return self.defaultDuration
+        return rtt.getTimeout(transactObj.dst, transactObj.dport, getattr(transactObj, 'minTimeout', 0)) / 1000
+
+    def plan(self, passStart, passEnd):
+        """Orders the queue for a pass, returns (scheduled, deferred)
+
+        scheduled is the list of QueuedCommands in the order to run them and
+        deferred a list of (QueuedCommand, reason). Doesn't change the queue.
+        """
+        scheduled = list()
+        deferred = list()
+        for queued in sorted(self.queue, key=lambda q: (-q.priority, q.seq)):
+            if self._due(queued, passEnd) < passStart + queued.duration:
+                if queued.deadline is not None and queued.deadline <= passStart:
+                    deferred.append((queued, "deadline is before AOS"))
+                elif queued.deadline is not None and queued.deadline < passEnd:
+                    deferred.append((queued, "deadline too soon after AOS"))
+                else:
+                    deferred.append((queued, "longer than the pass"))
+                continue
+            candidate = self._order(scheduled + [queued], passEnd)
+            if self._fits(candidate, passStart, passEnd):
+                scheduled = candidate
+            elif queued.deadline is not None and queued.deadline < passEnd:
+                deferred.append((queued, "can't make its deadline around higher priority work"))
+            else:
+                deferred.append((queued, "no room left before LOS"))
+        return scheduled, deferred
+
+    def run(self, passStart, passEnd, onResult=None):
+        """Plans and runs the queue over a pass, returns a report dict
+
+        Waits for AOS if it hasn't happened yet. Before each command the time
+        left is checked against its estimate again, since earlier commands
+        may have overrun. Completed and failed commands leave the queue,
+        deferred ones stay for the next pass. onResult(queued, ok, value) is
+        called after each command if given.
+        """
+        scheduled, deferred = self.plan(passStart, passEnd)
+        report = {'completed': list(), 'failed': list(), 'deferred': list()}
+        wait = passStart - self.clock()
+        if wait > 0:
+            self.sleep(wait)
+        for queued in scheduled:
+            now = self.clock()
+            if now + queued.duration > self._due(queued, passEnd):
+                deferred.append((queued, "ran out of time in the pass"))
+                continue
+            try:
+                value = queued.transactObj.execute()
+                ok = True
+            except Exception as e:
+                value = e
+                ok = False
+            entry = queued.getReport()
+            entry['time'] = now
+            entry['elapsed'] = self.clock() - now
+            if ok:
+                report['completed'].append(entry)
+            else:
+                entry['error'] = str(value)
+                report['failed'].append(entry)
+            self.queue.remove(queued)
+            if onResult is not None:
+                onResult(queued, ok, value)
+        report['deferred'] = [queued.getReport(reason) for queued, reason in deferred]
+        return report
+
+    def _due(self, queued, passEnd):
+        if queued.deadline is None:
+            return passEnd
+        return min(queued.deadline, passEnd)
+
+    def _order(self, commands, passEnd):
+        # Earliest deadline first, higher priority first among equal deadlines
+        return sorted(commands, key=lambda q: (self._due(q, passEnd), -q.priority, q.seq))
+
+    def _fits(self, commands, passStart, passEnd):
+        finish = passStart
+        for queued in commands:
+            finish += queued.duration
+            if finish > self._due(queued, passEnd):
+                return False
+        return True
@@ -0,0 +1,167 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file receiveDispatcher.py
+ * @date 2026-10-18
+'''
+
+import threading
+import time
+from collections import deque
+
+class ReceiveDispatcher:
+    """Background thread that drains every open connection as packets arrive
+
+    'connections' is called with no arguments and returns (server, port) for
+    every open connection. 'read' is called as read(server, port) and returns
+    the packet data, or None straight away if nothing is waiting. Reading as
+    soon as packets arrive keeps the libcsp buffer pool free, whether or not
+    anyone is waiting on that port.
+
+    Each packet is offered to the subscribers for its (server, port) first;
+    if none of them returns True it's queued for receive(). A reply that
+    arrives after its receive() timed out must not be taken as the reply to
+    the next request on that port, so a new request flush()es the port before
+    it's sent, and receive() can also be told which subPort it's waiting for.
+    Either way the stale reply has already been seen by the subscribers, so
+    it's still archived. When a port's queue is full the oldest packet is
+    dropped.
+    """
+
+    def __init__(self, connections, read, pollInterval=0.01, maxQueued=1024):
+        self.connections = connections
+        self.read = read
+        self.pollInterval = pollInterval # seconds to sleep when nothing came in
+        self.maxQueued = maxQueued
+        self.queues = dict() # (server, port) -> deque of (arrival time, packet)
+        self.ready = threading.Condition()
+        self.subscribers = list()
+        self.thread = None
+        self.stopped = threading.Event()
+        self.received = 0
+        self.consumed = 0
+        self.dropped = 0
+        self.stale = 0
+
+    def subscribe(self, callback, server=None, port=None):
+        """Calls callback(server, port, data) on the receive thread for each packet
+
+        A server or port of None matches any. The callback returns True if it
+        has dealt with the packet and it shouldn't be queued for receive().
+        Returns a handle for unsubscribe().
+        """
+        handle = (server, port, callback)
+        self.subscribers.append(handle)
+        return handle
+
+    def unsubscribe(self, handle):
+        self.subscribers.remove(handle)
+
+    def deliver(self, server, port, data):
+        """Hands a packet to the subscribers, or queues it for receive()"""
+        self.received += 1
+        consumed = False
+        for subServer, subPort, callback in list(self.subscribers):
+            if subServer not in (None, server) or subPort not in (None, port):
+                continue
+            try:
+                consumed = bool(callback(server, port, data)) or consumed
+            except Exception as e:
+                print(e)
+        if consumed:
+            self.consumed += 1
+            return
+        with self.ready:
+            packets = self.queues.setdefault((server, port), deque())
+            if len(packets) >= self.maxQueued:
+                packets.popleft()
+                self.dropped += 1
+            packets.append((time.monotonic(), data))
+            self.ready.notify_all()
+
+    def take(self, server, port, timeout, subPort=None):
+        """Next queued (arrival time, packet) from (server, port), or None after timeout ms
+
+        If subPort is given, queued packets for any other subPort are replies
+        to an earlier request and are discarded.
+        """
+        deadline = time.monotonic() + timeout / 1000
+        with self.ready:
+            while True:
+                packets = self.queues.get((server, port))
+                while packets:
+                    arrival, data = packets.popleft()
+                    if subPort is None or (len(data) > 0 and data[0] == subPort):
+                        return arrival, data
+                    self.stale += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self.ready.wait(remaining)
+
+    def receive(self, server, port, timeout, subPort=None):
+        """Next queued packet from (server, port), or None after timeout ms"""
+        entry = self.take(server, port, timeout, subPort)
+        return None if entry is None else entry[1]
+
+    def flush(self, server, port):
+        """Discards and returns everything queued for (server, port)
+
+        Called before a new request goes out, so that replies left over from
+        one that timed out can't be taken as its reply.
+        """
+        with self.ready:
+            packets = self.queues.pop((server, port), deque())
+            self.stale += len(packets)
+        return [data for arrival, data in packets]
+
+    def poll(self):
+        """Reads every connection until it's empty, returns the number of packets"""
+        count = 0
+        for server, port in self.connections():
+            while True:
+                data = self.read(server, port)
+                if data is None:
+                    break
+                self.deliver(server, port, data)
+                count += 1
+        return count
+
+    def run(self):
+        while not self.stopped.is_set():
+            if self.poll() == 0:
+                self.stopped.wait(self.pollInterval)
+
+    def start(self):
+        if self.thread is None:
+            self.stopped.clear()
+            self.thread = threading.Thread(target=self.run, name="ReceiveDispatcher", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        if self.thread is not None:
+            self.stopped.set()
+            self.thread.join()
+            self.thread = None
+
+    def getStats(self):
+        with self.ready:
+            queued = {key: len(packets) for key, packets in self.queues.items() if packets}
+        return {
+            'received': self.received,
+            'consumed': self.consumed,
+            'dropped': self.dropped,
+            'stale': self.stale,
+            'queued': queued,
+        }
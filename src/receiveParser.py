@@ -18,36 +18,145 @@
 '''
 
 import numpy as np
-from system import SatelliteNodes, GroundNodes, getServices
+from system import SatelliteNodes, GroundNodes, schema
+
+class ReturnDecoder:
+    """Decodes a subservice reply with a single precompiled structured dtype.
+
+    The fields listed in inoutInfo['returns'] are packed back to back after the
+    subPort byte, so they map directly onto a numpy structured dtype with no
+    padding. A 'var' field swallows the rest of the packet and ends the list.
+    """
+
+    def __init__(self, returns):
+        self.names = list()
+        formats = list()
+        self.varName = None
+        for name, fmt in returns.items():
+            if fmt == 'var':
+                self.varName = name
+                break
+            self.names.append(name)
+            formats.append(fmt)
+        # Raises if any of the field types is not a valid numpy type
+        self.dtype = np.dtype({'names': self.names, 'formats': formats})
+        self.offset = 1 # subPort byte
+        self.minLength = self.offset + self.dtype.itemsize
+        # Same fields laid over a whole packet, for decoding many at once
+        self.packetDtype = np.dtype({
+            'names': self.names,
+            'formats': formats,
+            'offsets': [self.offset + self.dtype.fields[name][1] for name in self.names],
+            'itemsize': self.minLength})
+
+    def decode(self, data):
+        outputObj = {}
+        if self.names:
+            record = np.frombuffer(data, dtype=self.dtype, count=1, offset=self.offset)[0]
+            outputObj = dict(zip(self.names, record))
+        if self.varName is not None:
+            outputObj[self.varName] = np.frombuffer(data, dtype="b", count=-1, offset=self.minLength)
+        return outputObj
+
+    def decodeMany(self, packets):
+        """Decodes a list of packets of the same subservice into one record array
+
+        The fixed part of every packet is copied into a single buffer and read
+        with one frombuffer call. A trailing 'var' field is not included.
+        """
+        buf = bytearray(len(packets) * self.minLength)
+        for i, data in enumerate(packets):
+            if len(data) < self.minLength:
+                raise ValueError("Packet {} is {} bytes, expected at least {}".format(i, len(data), self.minLength))
+            buf[i * self.minLength:(i + 1) * self.minLength] = data[:self.minLength]
+        return np.frombuffer(buf, dtype=self.packetDtype)
+
+_decoders = dict()
+
+def getDecoder(src, dport, subPort):
+    """ReturnDecoder for a (src, dport, subPort), compiled on first use
+
+    Returns None for unknown subservices and for ones whose returns can't be
+    expressed as a structured dtype; those fall back to field by field
+    decoding in ReceiveParser.
+    """
+    key = (src, dport, subPort)
+    try:
+        return _decoders[key]
+    except KeyError:
+        pass
+    decoder = None
+    node = schema.getNodeByAddr(src)
+    match = schema.getSubserviceByPort(node[0], dport, subPort) if node is not None else None
+    if match is not None:
+        try:
+            decoder = ReturnDecoder(match[2]['inoutInfo']['returns'])
+        except Exception:
+            decoder = None
+    return _decoders.setdefault(key, decoder)
+
+def compileDecoders():
+    """Compiles the decoder for every (src, dport, subPort) in the system
+
+    Returns the (src, dport, subPort) -> ReturnDecoder table. Decoders are
+    normally compiled one at a time by getDecoder, this is for tools that
+    want all of them up front.
+    """
+    decoders = dict()
+    for node in SatelliteNodes + GroundNodes:
+        for (nodeType, dport, subPort) in schema.subservicesByPort:
+            if nodeType == node[0]:
+                decoders[(node[2], dport, subPort)] = getDecoder(node[2], dport, subPort)
+    return decoders
 
 class ReceiveParser:
     def __init__(self):
         pass
 
     def parseReturnValue(self, src, dport, data):
-        systemType = None
-        for node in SatelliteNodes:
-            if node[2] == src:
-                systemType = node[0]
-        if systemType is None:
-            for node in GroundNodes:
-                if node[2] == src:
-                    systemType = node[0]
-        services = getServices(systemType)
-
-        # TODO: Refactor this
-        length = len(data)
-        service = [
-            x for x in services if services[x]['port'] == dport][0]
+        """Decodes one reply, as a dict of field name to value
+
+        data can be bytes, a bytearray or a memoryview such as the one from
+        packetUtils.packetView. Array fields share data's memory rather than
+        copying it, so they're only valid for as long as data is.
+        """
+        if len(data) > 0:
+            decoder = getDecoder(src, dport, data[0])
+            if decoder is not None and len(data) >= decoder.minLength:
+                return decoder.decode(data)
+        # Short packets and unusual types are decoded one field at a time
+        return self.parseReturnValueByField(src, dport, data)
+
+    def parseReturnValues(self, src, dport, packets):
+        """Decodes many replies from the same subservice in one go
+
+        Returns a numpy structured array with one row per packet; index it by
+        field name to get a column, e.g. table['UNIXtimestamp'].
+        """
+        if len(packets) == 0:
+            return None
+        decoder = getDecoder(src, dport, packets[0][0])
+        if decoder is None:
+            raise ValueError("No compiled decoder for subservice {} on port {}".format(packets[0][0], dport))
+        if any(data[0] != packets[0][0] for data in packets):
+            raise ValueError("Packets are not all from the same subservice")
+        return decoder.decodeMany(packets)
+
+    def parseReturnValueByField(self, src, dport, data):
+        node = schema.getNodeByAddr(src)
+        systemType = node[0] if node is not None else None
+        if schema.getServiceByPort(systemType, dport) is None:
+            raise ValueError("No service on port {} for node {}".format(dport, src))
 
         idx = 0
         outputObj = {}
         subservice = {}
 
-        if service and (
-                'subservice' in services[service]) and length > 0:
-            subservice = [services[service]['subservice'][x] for x in services[service]
-                          ['subservice'] if services[service]['subservice'][x]['subPort'] == data[idx]][0]
+        if len(data) > 0:
+            match = schema.getSubserviceByPort(systemType, dport, data[idx])
+            if match is None:
+                raise ValueError("No subservice {} on port {} for node {}".format(data[idx], dport, src))
+            subservice = match[2]
             idx += 1
 
         if 'inoutInfo' not in subservice:
@@ -70,6 +179,17 @@ class ReceiveParser:
                 idx += np.dtype(returns[retVal]).itemsize
         return outputObj
 
+def saveColumns(table, filename):
+    """Saves a table from parseReturnValues to disk
+
+    A .npz filename stores one array per field so single columns can be loaded
+    on their own; anything else is saved as a single .npy record array.
+    """
+    if filename.endswith(".npz"):
+        np.savez(filename, **{name: table[name] for name in table.dtype.names})
+    else:
+        np.save(filename, table)
+
 if __name__ == '__main__':
     parser = ReceiveParser()
     returnval = parser.parseReturnValue(8, bytearray(b'\x01\x00')) # ba[0] = 01 (set time)
@@ -0,0 +1,118 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file rttEstimator.py
+ * @date 2026-10-18
+'''
+
+import threading
+import time
+
+class RTTEstimator:
+    """Smoothed round trip time and retransmission timeout, as in RFC 6298
+
+    All times are in milliseconds, like the libcsp timeouts.
+    """
+
+    def __init__(self, initialTimeout=10000, minTimeout=1000, maxTimeout=60000):
+        self.initialTimeout = initialTimeout
+        self.minTimeout = minTimeout
+        self.maxTimeout = maxTimeout
+        self.srtt = None
+        self.rttvar = None
+        self.rto = initialTimeout
+        self.samples = 0
+        self.timeouts = 0
+        self.lastRtt = None
+
+    def addSample(self, rtt):
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+        self.rto = self._clamp(self.srtt + 4 * self.rttvar)
+        self.samples += 1
+        self.lastRtt = rtt
+
+    def timedOut(self):
+        # Back off so a marginal link gets more time on the next attempt
+        self.timeouts += 1
+        self.rto = self._clamp(self.rto * 2)
+
+    def getTimeout(self):
+        return int(self.rto)
+
+    def getStats(self):
+        return {
+            'srtt': self.srtt,
+            'rttvar': self.rttvar,
+            'rto': self.getTimeout(),
+            'last': self.lastRtt,
+            'samples': self.samples,
+            'timeouts': self.timeouts,
+        }
+
+    def _clamp(self, timeout):
+        return max(self.minTimeout, min(self.maxTimeout, timeout))
+
+class RTTTable:
+    """One RTTEstimator per (server, port), fed by a network handler
+
+    The handler calls sent() after each send and received()/timedOut() after
+    each receive. Only the first reply after a quiet period is timed, so the
+    later packets of a burst download don't count as round trips.
+    """
+
+    def __init__(self, initialTimeout=10000, minTimeout=1000, maxTimeout=60000):
+        self.initialTimeout = initialTimeout
+        self.minTimeout = minTimeout
+        self.maxTimeout = maxTimeout
+        self.estimators = dict()
+        self.sendTimes = dict()
+        self.lock = threading.Lock()
+
+    def _estimator(self, server, port):
+        if (server, port) not in self.estimators:
+            self.estimators[(server, port)] = RTTEstimator(self.initialTimeout, self.minTimeout, self.maxTimeout)
+        return self.estimators[(server, port)]
+
+    def sent(self, server, port):
+        with self.lock:
+            self.sendTimes.setdefault((server, port), time.monotonic())
+
+    def received(self, server, port, when=None):
+        """A reply came in, at 'when' (time.monotonic()) if it was queued before being read"""
+        if when is None:
+            when = time.monotonic()
+        with self.lock:
+            sendTime = self.sendTimes.pop((server, port), None)
+            if sendTime is not None:
+                self._estimator(server, port).addSample(max(0, when - sendTime) * 1000)
+
+    def timedOut(self, server, port):
+        with self.lock:
+            self.sendTimes.pop((server, port), None)
+            self._estimator(server, port).timedOut()
+
+    def getTimeout(self, server, port, minimum=0):
+        """Timeout in ms to use for the next reply from (server, port)"""
+        with self.lock:
+            return max(minimum, self._estimator(server, port).getTimeout())
+
+    def getStats(self):
+        """{(server, port): stats dict} for every port seen so far"""
+        with self.lock:
+            return {key: estimator.getStats() for key, estimator in self.estimators.items()}
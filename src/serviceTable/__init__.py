@@ -0,0 +1,23 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/__init__.py
+ * @date 2026-10-18
+'''
+
+'''
+One module per entry of system.services, each defining a single `service`
+dict. Don't import these directly, go through system.services so each one is
+only loaded once and only when it's needed.
+'''
@@ -0,0 +1,2136 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/adcs.py
+ * @date 2026-10-18
+'''
+
+service = { # refer to the adcs service
+    'supports' : ("OBC",),
+    'port': 18,
+    'subservice': {
+        'ADCS_RESET': {
+            'what': 'Forces ADCS to perform a reset.',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_RESET_LOG_POINTER': {
+            'what': 'Resets TLM log pointer to log buffer (from where LastLogEvent TLM is returned).',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_ADVANCE_LOG_POINTER': {
+            'what': 'Advances TLM log pointer to log buffer (form where LastLogEvent TLM is returned).',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_RESET_BOOT_REGISTERS': {
+            'what': 'Resets boot counter, state, and cause registers',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_FORMAT_SD_CARD': {
+            'what': 'Formats SD card.',
+            'subPort': 4,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_ERASE_FILE': {
+            'what': 'Erases file by file type and counter. Alternatively, can erase all files in SD card.',
+            'subPort': 5,
+            'inoutInfo': {
+                'args': {
+                    "File_type" : '>u1',
+                    "File_counter" : '>u1',
+                    "Erase_all" : '>u1'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_LOAD_FILE_DOWNLOAD_BLOCK': {
+            'what': 'Fill download buffer with file contents specified by file type, counter, offset and length.',
+            'subPort': 6,
+            'inoutInfo': {
+                'args': {
+                    "File_type" : '>u1',
+                    "File_counter" : '>u1',
+                    "Offset" : '>u4',
+                    "Block_length" : '>u2'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_ADVANCE_FILE_LIST_READ_POINTER': {
+            'what':  'Advances file list read pointer.',
+            'subPort': 7,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_INITIATE_FILE_UPLOAD': {
+            'what': 'Initiates file upload to destination (Table 20, F/W Ref. Manual) with block size specified.',
+            'subPort': 8,
+            'inoutInfo': {
+                'args': {
+                    "File_dest" : '>u1',
+                    "Block_size" : '>u1'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_FILE_UPLOAD_PACKET': {
+            'what': 'Sends 20-byte file message. Include packet number and file bytes to be sent.',
+            'subPort': 9,
+            'inoutInfo': {
+                'args': {
+                    "Packet_num" : '>u2',
+                    "File_bytes" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                    'file_bytes': '>b'
+                }
+            }
+        },
+        'ADCS_FINALIZE_UPLOAD_BLOCK': {
+            'what': 'Finalizes uploaded file block at specified destination (Table 20, F/W Ref. Manual), offset, and block length. Executed after hole map is complete.',
+            'subPort': 10,
+            'inoutInfo': {
+                'args': {
+                    "File_dest" : '>u2',
+                    "Offset" : '>u4',
+                    "Block_length" : '>u2'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_RESET_UPLOAD_BLOCK': {
+            'what': 'Resets the hole map for the upload block.',
+            'subPort': 11,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_RESET_FILE_LIST_READ_POINTER': {
+            'what': 'Resets file list read pointer.',
+            'subPort': 12,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_INITIATE_DOWNLOAD_BURST': {
+            'what': 'Initiates download burst. ADCS begins to send 20-byte packets. Specify message length, and hole map polling. Executed after download block is ready.',
+            'subPort': 13,
+            'inoutInfo': {
+                'args': {
+                    "Msg_len" : '>u1',
+                    "Ignore_hole_map" : '>?'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_GET_NODE_IDENTIFICATION': {
+            'what': 'Returns identification for this node: type, interface, firmware versions, and runtime in s and ms.',
+            'subPort': 14,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Node_Type': '>u1',
+                    'Interface_Ver': '>u1',
+                    'Major_Firm_Ver': '>u1',
+                    'Minor_Firm_Ver': '>u1',
+                    'Runtime_S': '>u2',
+                    'Runtime_Ms': '>u2'
+                }
+            }
+        },
+        'ADCS_GET_BOOT_PROGRAM_STAT': {
+            'what': 'Returns boot and running program status: reset cause, boot cause (Table 29 and 30 F/W Ref. Manual), boot counter, program index and firmware version',
+            'subPort': 15,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Mcu_Reset_Cause': '>u1',
+                    'Boot_Cause': '>u1',
+                    'Boot_Count': '>u2',
+                    'Boot_Idx': '>u1',
+                    'Major_Firm_Ver': '>u1',
+                    'Minor_Firm_Ver': '>u1'
+                }
+            }
+        },
+        'ADCS_GET_BOOT_INDEX': {
+            'what': 'Returns program index and boot status (Tables 31 and 33 F/W Ref. Manual)',
+            'subPort': 16,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Program_Idx': '>u1',
+                    'Boot_Stat': '>u1',
+                }
+            }
+        },
+        'ADCS_GET_LAST_LOGGED_EVENT': {
+            'what': 'Returns last logged event time, ID and parameter (relative to pointer -- use advance/reset log pointer commands).',
+            'subPort': 17,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Time': '>u4',
+                    'Event_Id': '>u1',
+                    'Event_Param': '>u1'
+                }
+            }
+        },
+        'ADCS_GET_SD_FORMAT_PROGRESS': {
+            'what': 'Returns SD format and/or erase all progress.',
+            'subPort': 18,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'FormT_Busy': '>?',
+                    'Erase_All_Busy': '>?',
+                }
+            }
+        },
+        'ADCS_GET_TC_ACK': {
+            'what': 'Returns last TC ID, processed flag, TC error status (Table 40 F/W Ref. Manual) and index.',
+            'subPort': 19,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Last_Tc_Id': '>u1',
+                    'Tc_Processed': '>?',
+                    'Tc_Err_Stat': '>b',
+                    'Tc_Param_Err_Index': '>B'
+                }
+            }
+        },
+        'ADCS_GET_FILE_DOWNLOAD_BUFFER': {
+            'what': 'Returns file download buffer with packet count and 20-byte packet.',
+            'subPort': 20,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Packet_Count': '>u2',
+                    'File': '>u4', #TODO: array
+                }
+            }
+        },
+        'ADCS_GET_FILE_DOWNLOAD_BLOCK_STAT': {
+            'what': 'Returns ready flag, msg length and hole map parameter error flag, CRC16 checksum, and block length of download block.',
+            'subPort': 21,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Ready': '>?',
+                    'Param_Err': '>?',
+                    'Crc16_Checksum': '>u2',
+                    'Length': '>u2'
+                }
+            }
+        },
+        'ADCS_GET_FILE_INFO': {
+            'what': 'Returns file type, update flag, counter, size, date/time, CRC16 checksum.',
+            'subPort': 22,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Type': '>u1',
+                    'Updating': '>?',
+                    'File_Counter': '>u1',
+                    'Size': '>u4',
+                    'Time': '>u4',
+                    'Crc16_Checksum': '>u2'
+                }
+            }
+        },
+        'ADCS_GET_INIT_UPLOAD_STAT': {
+            'what': 'Returns status of upload initiation.',
+            'subPort': 23,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Busy': '>?',
+                }
+            }
+        },
+        'ADCS_GET_FINALIZE_UPLOAD_STAT': {
+            'what': 'Returns busy and error flag regarding upload finalization status.',
+            'subPort': 24,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Busy': '>?',
+                    'Error': '>?'
+                }
+            }
+        },
+        'ADCS_GET_UPLOAD_CRC16_CHECKSUM': {
+            'what': 'Returns upload CRC16 checksum.',
+            'subPort': 25,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Checksum': '>u2'
+                }
+            }
+        },
+        'ADCS_GET_SRAM_LATCHUP_COUNT': {
+            'what': 'Returns SRAM1 and SRAM2 latchup counts.',
+            'subPort': 26,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Sram1': '>u2',
+                    'Sram2': '>u2'
+                }
+            }
+        },
+        'ADCS_GET_EDAC_ERR_COUNT': {
+            'what': 'Returns single, double, and multiple SRAM upsets.',
+            'subPort': 27,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Single_Sram': '>u2',
+                    'Double_Sram': '>u2',
+                    'Multi_Sram': '>u2'
+                }
+            }
+        },
+        'ADCS_GET_COMMS_STAT': {
+            'what': 'Returns TC counter, TLM request counter, TC buffer overrun flag, and UART, I2C, and CAN error flags.',
+            'subPort': 28,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'TC_num': '>u2',
+                    'TM_num': '>u2',
+                    'TC_Buffer_Overrun': '<B',
+                    'UART_Error': '<B',
+                    'UART_Incomplete': '<B',
+                    'I2C_TLM_Err': '<B',
+                    'I2C_TC_Buffer_Err': '<B',
+                    'CAN_TC_Buffer_Err': '<B',
+
+                }
+            }
+        },
+        'ADCS_SET_CACHE_EN_STATE': {
+            'what': 'Sets cache enabled state.',
+            'subPort': 29,
+            'inoutInfo': {
+                'args': {
+                    "State" : '>?'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_SRAM_SCRUB_SIZE': {
+            'what': 'Set SRAM scrubbing size.',
+            'subPort': 30,
+            'inoutInfo': {
+                'args': {
+                    "Size" : '>u2'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_UNIXTIME_SAVE_CONFIG': {
+            'what' : "when: [1 = now, 2 = on update, 4 = periodically], period",
+            'subPort': 31,
+            'inoutInfo': {
+                'args': {
+                    "When" : '>u1',
+                    "period" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_HOLE_MAP': {
+            'what': 'Sets file upload hole map (up to 8 arrays of 16 bytes).',
+            'subPort': 32,
+            'inoutInfo': {
+                'args': { 
+                    "Hole_Map" : '>u1', 
+                    "Hole_Map_Num" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                    'Hole_Map': '>u1'
+                }
+            }
+        },
+        'ADCS_SET_UNIX_T': {
+            'what': 'Sets the Unix Time.',
+            'subPort': 33,
+            'inoutInfo': { 
+                'args': {
+                    "Unix_T" : '>u4',
+                    "Count_Millis" : '>u2'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_GET_CACHE_EN_STATE': {
+            'what': 'Returns cache enabled state.',
+            'subPort': 34,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'En_State': '>?'
+                }
+            }
+        },
+        'ADCS_GET_SRAM_SCRUB_SIZE': {
+            'what': 'Returns SRAM scrubbing size.',
+            'subPort': 35,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Size': '>u2'
+                }
+            }
+        },
+        'ADCS_GET_UNIXTIME_SAVE_CONFIG': {
+            'what': 'Returns Unix Time save configuration: when: [1 = now, 2 = on update, 4 = periodically], and period',
+            'subPort': 36,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'When': '>u1',
+                    'Period': '>u1'
+                }
+            }
+        },
+        'ADCS_GET_HOLE_MAP': {
+            'what': 'Returns file upload hole map: ',
+            'subPort': 37,
+            'inoutInfo': {
+                'args': {
+                    "Hole_Map_Num" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                    'Hole_Map': '>u1',
+                }
+            }
+        },
+        'ADCS_GET_UNIX_T': {
+            'what': 'Returns the Unix Time in (in s and ms) saved on the ADCS.',
+            'subPort': 38,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Unix_t': '>u4',
+                    'Count_Ms': '>u2'
+                }
+            }
+        },
+        'ADCS_CLEAR_ERR_FLAGS': {
+            'what': 'Clears ADCS error flags.',
+            'subPort': 39,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_BOOT_INDEX': {
+            'what': 'Selects which program to boot (Table 63 F/W Ref. Manual).',
+            'subPort': 40,
+            'inoutInfo': {
+                'args': {
+                    "Index" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_RUN_SELECTED_PROGRAM': {
+            'what': 'Runs selected program -- forces the bootloader to run internal flash program.',
+            'subPort': 41,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_READ_PROGRAM_INFO': {
+            'what': 'Requests program CRC and length, use ADCS_GET_PROGRAM_INFO to read.',
+            'subPort': 42,
+            'inoutInfo': {
+                'args': {
+                    "Index" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_COPY_PROGRAM_INTERNAL_FLASH': {
+            'what': 'Copies program at index (Table 66, F/W Ref. Manual), with option to overwrite the bootloader.',
+            'subPort': 43,
+            'inoutInfo': {
+                'args': {
+                    "Index" : '>u1',
+                    "Overwrite_flag" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_GET_BOOTLOADER_STATE': {
+            'what': 'Return status flags for bootloader.',
+            'subPort': 44,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Uptime_S': '>u2',
+                    'SRAM1_En': '>u1',
+                    'SRAM2_En': '>u1',
+                    'SRAM_Latch_Err_Un_Re': '>u1',
+                    'SRAN_Latch_Err_Re': '>u1',
+                    'SD_Card_Init_Err': '>u1',
+                    'SD_Card_Read_Err': '>u1',
+                    'SD_Card_Write_Err': '>u1',
+                    'Ext_Flash_Err': '>u1',
+                    'Int_Flash_Err': '>u1',
+                    'EEPROM_Err': '>u1',
+                    'Boot_Reg_Corrupt': '>u1',
+                    'Comms_Err': '>u1'
+                }
+            }
+        },
+        'ADCS_GET_PROGRAM_INFO': {
+            'what': 'Returns program index, reading flag, file syze (bytes) and CRC16 checksum.',
+            'subPort': 45,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Index': '>u1',
+                    'Busy': '>?',
+                    'File_Size': '>u4',
+                    'Crc16_Checksum': '>u2'
+                }
+            }
+        },
+        'ADCS_COPY_INTERNAL_FLASH_PROGRESS': {
+            'what': 'Progress of copy to internal flash operation -- returns busy and error flags.',
+            'subPort': 46,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Error': '>?',
+                    'Busy': '>?',
+                }
+            }
+        },
+        'ADCS_DEPLOY_MAGNETOMETER_BOOM': {
+            "what" : "Actuation timeout in seconds",
+            'subPort': 47,
+            'inoutInfo': {
+                'args': {
+                    "Actuation_timeout" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_ENABLED_STATE': {
+            'what': 'Set emabled state and control loop behaviour (Table 75, F/W Ref. Manual).',
+            'subPort': 48,
+            'inoutInfo': {
+                'args': {
+                    "State" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_CLEAR_LATCHED_ERRS': {
+            'what': 'Clear ADCS and/or HK error flags.',
+            'subPort': 49,
+            'inoutInfo': {
+                'args': { #TODO: Better names
+                    "ADCS_Err_Flags" : '>?',
+                    "HK_Err_Flags" : '>?'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_ATTITUDE_CONTROL_MODE': {
+            'what': 'Sets control mode (Table 78 F/W Ref. Manual), and control timeout duration (0xFFFF for inf timeout).',
+            'subPort': 50,
+            'inoutInfo': {
+                'args': {
+                    "Control_mode" : '>u1',
+                    "Timeout" : '>u2'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_ATTITUDE_ESTIMATE_MODE': {
+            'what': 'Sets estimation mode (Table 80 F/W Ref. Manual).',
+            'subPort': 51,
+            'inoutInfo': {
+                'args': {
+                    "Est_Mode" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_TRIGGER_ADCS_LOOP': {
+            'what': 'Trigger ADCS to perform one iteration of the control loop (only when Run Mode is triggered).',
+            'subPort': 52,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_TRIGGER_ADCS_LOOP_SIM': {
+            'what': 'Trigger ADCS to perform one iteration of the control loop only with simulated sensor data.',
+            'subPort': 53,
+            'inoutInfo': {
+                'args': None, #TODO: sim_sensor_data type ?
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_ASGP4_RUN_MODE': {
+            'what': 'Sets ASGP4 run mode -- (GPS augmented SGP4 not used, use SGP4 commands instead!).',
+            'subPort': 54,
+            'inoutInfo': {
+                'args': {
+                    "Mode" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_TRIGGER_ASGP4': {
+            'what': 'Trigger ASGP4 process -- (GPS augmented SGP4 not used, use SPG4 commands instead!).',
+            'subPort': 55,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_MTM_OP_MODE': {
+            'what': 'Set magnetometer mode (Table 90 F/W Ref. Manual).',
+            'subPort': 56,
+            'inoutInfo': {
+                'args': {
+                    "Mtm_Mde" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_CNV2JPG': {
+            'what': 'Convert raw/bmp files to JPG',
+            'subPort': 57,
+            'inoutInfo': {
+                'args': { 
+                    "Src_File_Ctr" : '>u1',
+                    "Qual_Factor" : '>u1',
+                    "White_Bal" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SAVE_IMG': {
+            'what': 'Save and capture image from CubeSense or CubeStar cameras to SD card with specified size (Tables 95 and 96 F/W Ref. Manual).',
+            'subPort': 58,
+            'inoutInfo': {
+                'args': { 
+                    "Cam_Select" : '>u1',
+                    "Img_Size" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+
+        'ADCS_SET_MAGNETORQUER_OUTPUT': {
+            'what': 'Set X, Y, and Z magnetorquer duty cycles [0 - +/-800]. Only valid of Control Mode is None.',
+            'subPort': 59,
+            'inoutInfo': {
+                'args': { 
+                    "Mtq_X" : '>i2',
+                    "Mtq_Y" : '>i2',
+                    "Mtq_Z" : '>i2'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_WHEEL_SPEED': {
+            'what': 'Set wheel speed rpm [0 - +/-8000]. Only valid if Control Mode is None.', 
+            'subPort': 60,
+            'inoutInfo': {
+                'args': { 
+                    "Wheel_X" : '>i2',
+                    "Wheel_Y" : '>i2',
+                    "Wheel_Z" : '>i2'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SAVE_CONFIG': {
+            'what': 'Saves current configuration to flash memory.',
+            'subPort': 61,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SAVE_ORBIT_PARAMS': {
+            'what': 'Saves current orbit parameters to flash memory.',
+            'subPort': 62,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_GET_CURRENT_STATE': {
+            'what': 'Gets full ADCS state (Table 149 F/W Ref. Manual).',
+            'subPort': 63,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'att_estimate_mode': '>B',
+                    'att_ctrl_mode': '>B',
+                    'run_mode': '>B',
+                    'ASGP4_mode': '>B',
+                    'Cubectrl_Sig_En': '>B',
+                    'Cubectrl_Mtr_En': '>B',
+                    'Cube1_En': '>B',
+                    'Cubesns2_En': '>B',
+                    'Cubewhl1_En': '>B',
+                    'Cubewhl2_En': '>B',
+                    'Cubewhl3_En': '>B',
+                    'Cubestr_En': '>B',
+                    'GPS_Rx_En': '>B',
+                    'GPS_LNA_Pwr_En': '>B',
+                    'Mtr_Drvr_En': '>B',
+                    'Sun_Abv_Lcl_Hrzn': '>B',
+                    'CubeSense1_Comms_Err': '>B',
+                    'CubeSense2_Comms_Err': '>B',
+                    'Cubectrl_Sig_Comms_Err': '>B',
+                    'Cubectrl_Mtr_Comms_Err': '>B',
+                    'CubeWheel1_Comms_Err': '>B',
+                    'CubeWheel2_Comms_Err': '>B',
+                    'CubeWheel3_Comms_Err': '>B',
+                    'CubeStar_Comms_Err': '>B',
+                    'Mtm_Rng_Err': '>B',
+                    'Cam1_SRAM_Ov': '>B',
+                    'Cam1_3V3_Ov': '>B',
+                    'Cam1_Busy_Err': '>B',
+                    'Cam1_Det_Err': '>B',
+                    'Sun_Snsr_Rng_Err': '>B',
+                    'Cam2_SRAM_Ov': '>B',
+                    'Cam2_3V3_Ov': '>B',
+                    'Cam2_Busy_Err': '>B',
+                    'Cam2_Det_Err': '>B',
+                    'Ndir_Snsr_Rng_Err': '>B',
+                    'Rate_Snsr_Rng_Err': '>B',
+                    'Whl_Spd_Rng_Err': '>B',
+                    'Crs_Sun_Snsr_Err': '>B',
+                    'Strtrckr_Mtch_Err': '>B',
+                    'Strtrckr_Ov_Det': '>B',
+                    'Orbt_Param_Invld': '>B',
+                    'Cnfg_Invld': '>B',
+                    'Ctrl_Mde_Invld': '>B',
+                    'Estmtr_Chng_Invld': '>B',
+                    'Mtm_Smpl_Mode': '>B',
+                    'Mag_Fld_Diff': '>B',
+                    'Node_Recov_Err': '>B',
+                    'CubeSense1_Runtm_Err': '>B',
+                    'CubeSense2_Runtm_Err': '>B',
+                    'Cubectrl_Sgnl_Runtm_Err': '>B',
+                    'Cubectrl_Mtr_Runtm_Err': '>B',
+                    'CubeWhl1_Runtm_Err': '>B',
+                    'CubeWhl2_Runtm_Err': '>B',
+                    'CubeWhl3_Runtm_Err': '>B',
+                    'Cubestr_Runtm_Err': '>B',
+                    'Mtm__Err': '>B',
+                    'Rate_Snsr_Fail': '>B',
+                    'est_roll_angle': '>f4',
+                    'est_pitch_angle': '>f4',
+                    'est_yaw_angle': '>f4',
+                    'est_quaternion_x': '>i2',
+                    'est_quaternion_y': '>i2',
+                    'est_quaternion_z': '>i2',
+                    'est_angular_rate_x': '>f4',
+                    'est_angular_rate_y': '>f4',
+                    'est_angular_rate_z': '>f4',
+                    'ECI_pos_x': '>f4',
+                    'ECI_pos_y': '>f4',
+                    'ECI_pos_z': '>f4',
+                    'ECI_vel_x': '>f4',
+                    'ECI_vel_y': '>f4',
+                    'ECI_vel_z': '>f4',
+                    'Latitude': '>f4',
+                    'Longitude': '>f4',
+                    'Altitude': '>f4',
+                    'ecef_pos_x': '>i2',
+                    'ecef_pos_y': '>i2',
+                    'ecef_pos_z': '>i2'
+                }
+            }
+        },
+        'ADCS_GET_JPG_CNV_PROGESS': {
+            'what': 'Returns JPG conversion progress.',
+            'subPort': 64,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Percentage': '>u1',
+                    'Result': '>u1',
+                    'File_Counter': '>u1'
+                }
+            }
+        },
+        'ADCS_GET_CUBEACP_STATE': {
+            'what': 'Returns flags regarding ACP state.',
+            'subPort': 65,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Cnfg_Load_Err': '>u1',
+                    'Orbt_Param_Load_Err': '>u1',
+                    'Sys_Cnfg_Load_Err': '>u1',
+                    'SD_Crd_Init_Err': '>u1',
+                    'SD_Crd_Rd_Err': '>u1',
+                    'SD_Crd_Wrt_Err': '>u1',
+                }
+            }
+        },
+        'ADCS_GET_SAT_POS_LLH': {
+            'what': 'Returns LLH (WGS-84) satellite position.',
+            'subPort': 66,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Latitude': '>i2',
+                    'Longitude': '>i2',
+                    'Altitude': '>u2',
+                }
+            }
+        },
+        'ADCS_GET_EXECUTION_TIMES': {
+            'what': 'Returns execution times of ACP functions (Table 155 F/W Ref. Manual).',
+            'subPort': 67,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Adcs_Update': '>u2',
+                    'Sensor_Comm': '>u2',
+                    'SGP4_propag': '>u2',
+                    'IGRF_model': '>u2'
+                }
+            }
+        },
+        'ADCS_GET_ACP_LOOP_STAT': {
+            'what': 'Returns time (ms) since start of loop and execution point (Table 168 F/W Ref. Manual).',
+            'subPort': 68,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Time': '>u2',
+                    'Execution_point': '>u1'
+                }
+            }
+        },
+        'ADCS_GET_IMG_SAVE_PROGRESS': {
+            'what': 'Returns image save progress.',
+            'subPort': 69,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Percentage': '>u1',
+                    'Status': '>u1'
+                }
+            }
+        },
+        'ADCS_GET_MEASUREMENTS': {
+            'what': 'Returns calibrated sensor measurements (Table 150 F/W Ref. Manual).',
+            'subPort': 70,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Magnetic_field_X': '>f4',
+                    'Magnetic_field_Y': '>f4',
+                    'Magnetic_field_Z': '>f4',
+                    'Coarse_Sun_X': '>f4',
+                    'Coarse_Sun_Y': '>f4',
+                    'Coarse_Sun_Z': '>f4',
+                    'Sun_X': '>f4',
+                    'Sun_Y': '>f4',
+                    'Sun_Z': '>f4',
+                    'Nadir_X': '>f4',
+                    'Nadir_Y': '>f4',
+                    'Nadir_Z': '>f4',
+                    'Angular_Rate_X': '>f4',
+                    'Angular_Rate_Y': '>f4',
+                    'Angular_Rate_Z': '>f4',
+                    'Wheel_Speed_X': '>f4',
+                    'Wheel_Speed_Y': '>f4',
+                    'Wheel_Speed_Z': '>f4',
+                    'Star1b_X': '>f4',
+                    'Star1b_Y': '>f4',
+                    'Star1b_Z': '>f4',
+                    'Star1o_X': '>f4',
+                    'Star1o_Y': '>f4',
+                    'Star1o_Z': '>f4',
+                    'Star2b_X': '>f4',
+                    'Star2b_Y': '>f4',
+                    'Star2b_Z': '>f4',
+                    'Star2o_X': '>f4',
+                    'Star2o_Y': '>f4',
+                    'Star2o_Z': '>f4',
+                    'Star3b_X': '>f4',
+                    'Star3b_Y': '>f4',
+                    'Star3b_Z': '>f4',
+                    'Star3o_X': '>f4',
+                    'Star3o_Y': '>f4',
+                    'Star3o_Z': '>f4',
+                }
+            }
+        },
+        'ADCS_GET_ACTUATOR': {
+            'what': 'Returns actuator commands on-time.',
+            'subPort': 71,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Magnetorquer_X_ms/1000': '>f4',
+                    'Magnetorquer_Y_ms/1000': '>f4',
+                    'Magnetorquer_Z_ms/1000': '>f4',
+                    'Wheel_Speed_X': '>f4',
+                    'Wheel_Speed_Y': '>f4',
+                    'Wheel_Speed_Z': '>f4',
+                }
+            }
+        },
+        'ADCS_GET_ESTIMATION': {
+            'what': 'Returns estimation meta-data (Table 152 F/W Ref. Manual).',
+            'subPort': 72,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Igrf_magnetic_field_X': '>f4',
+                    'Igrf_magnetic_field_Y': '>f4',
+                    'Igrf_magnetic_field_Z': '>f4',
+                    'Sun_X': '>f4',
+                    'Sun_Y': '>f4',
+                    'Sun_Z': '>f4',
+                    'Gyro_bias_X': '>f4',
+                    'Gyro_bias_Y': '>f4',
+                    'Gyro_bias_Z': '>f4',
+                    'Innovation_X': '>f4',
+                    'Innovation_Y': '>f4',
+                    'Innovation_Z': '>f4',
+                    'Quaternion_Err_X': '>f4',
+                    'Quaternion_Err_Y': '>f4',
+                    'Quaternion_Err_Z': '>f4',
+                    'Quaternion_Covar_X': '>f4',
+                    'Quaternion_Covar_X': '>f4',
+                    'Quaternion_Covar_X': '>f4',
+                    'Angular_Rate_Covar_X': '>f4',
+                    'Angular_Rate_Covar_Y': '>f4',
+                    'Angular_Rate_Covar_Z': '>f4',
+                }
+            }
+        },
+        'ADCS_GET_ASGP4': {
+            'what': 'Get ASGP4 TLEs. (Not using GPS-augmented SGP4, use SGP4 commands instead!).',
+            'subPort': 73,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Epoch': '>f4',
+                    'Inclination': '>f4',
+                    'RAAN': '>f4',
+                    'ECC': '>f4',
+                    'AOP': '>f4',
+                    'MA': '>f4',
+                    'MM': '>f4',
+                    'Bstar': '>f4',
+                }
+            }
+        },
+        'ADCS_GET_RAW_SENSOR': {
+            'what': 'Returns raw sensor measurements (Table 153 F/W Ref. Manual).',
+            'subPort': 74,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Cam1_Centroid_X': '>i2',
+                    'Cam1_Centroid_Y': '>i2',
+                    'Cam1_Capture_Stat': '>u1',
+                    'Cam1_Detect_Result': '>u1',
+                    'Cam2_Centroid_X': '>i2',
+                    'Cam2_Centroid_Y': '>i2',
+                    'Cam2_Capture_Stat': '>u1',
+                    'Cam2_Detect_Result': '>u1',
+                    'Css_1': '>u1',
+                    'Css_2': '>u1',
+                    'Css_3': '>u1',
+                    'Css_4': '>u1',
+                    'Css_5': '>u1',
+                    'Css_6': '>u1',
+                    'Css_7': '>u1',
+                    'Css_8': '>u1',
+                    'Css_9': '>u1',
+                    'Css_10': '>u1',
+                    'MTM_X': '>i2',
+                    'MTM_Y': '>i2',
+                    'MTM_Z': '>i2',
+                    'Rate_X': '>i2',
+                    'Rate_Y': '>i2',
+                    'Rate_Z': '>i2',
+
+                }
+            }
+        },
+        'ADCS_GET_RAW_GPS': {
+            'what': 'Returns raw GPS data (Table 158 F/W Ref. Manual).',
+            'subPort': 75,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Sol_Stat': '>u1',
+                    'Tracked_Sats': '>u1',
+                    'UsedInSol_Sats': '>u1',
+                    'Xyz_Lof_Count': '>u1',
+                    'Range_Log_Count': '>u1',
+                    'Response_Msg': '>u1',
+                    'Reference_Week': '>u2',
+                    'Time': '>u4',
+                    'X_Pos': '>i4',
+                    'X_Vel': '>i2',
+                    'Y_Pos': '>i4',
+                    'Y_Vel': '>i2',
+                    'Z_Pos': '>i4',
+                    'Z_Vel': '>i2',
+                    'Pos_Std_Dev_X': '>f4',
+                    'Pos_Std_Dev_Y': '>f4',
+                    'Pos_Std_Dev_Z': '>f4',
+                    'Vel_Std_Dev_X': '>u1',
+                    'Vel_Std_Dev_Y': '>u1',
+                    'Vel_Std_Dev_Z': '>u1',
+                }
+            }
+        },
+        'ADCS_GET_STAR_TRACKER': {
+            'what': 'Return raw Star Tracker measurements (Table 159 F/W Ref. Manual).',
+            'subPort': 76,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Detected_Stars': '>u1',
+                    'Img_noise': '>u1',
+                    'Invalid_stars': '>u1',
+                    'Identified_stars': '>u1',
+                    'Identification_mode': '>u1',
+                    'Img_dark_val': '>u1',
+                    'flags_arr': '>O20',
+                    'Sample_T': '>u2',
+                    'Star1_Confidence': '>u1',
+                    'Star1_magnitude': '>u2',
+                    'Star1_Catalouge_Num': '>u2',
+                    'Star1_Centroid_X': '>i2',
+                    'Star1_Centroid_Y': '>i2',
+                    'Star2_Confidence': '>u1',
+                    'Star2_magnitude': '>u2',
+                    'Star2_Catalouge_Num': '>u2',
+                    'Star2_Centroid_X': '>i2',
+                    'Star2_Centroid_Y': '>i2',
+                    'Star3_Confidence': '>u1',
+                    'Star3_magnitude': '>u2',
+                    'Star3_Catalouge_Num': '>u2',
+                    'Star3_Centroid_X': '>i2',
+                    'Star3_Centroid_Y': '>i2',
+                    'Capture_T': '>u2',
+                    'Detect_T': '>u2',
+                    'Identification_T': '>u2',
+                    'Estimated_Rate_X': '>f4',
+                    'Estimated_Rate_Y': '>f4',
+                    'Estimated_Rate_Z': '>f4',
+                    'Estimated_Att_X': '>f4',
+                    'Estimated_Att_Y': '>f4',
+                    'Estimated_Att_Z': '>f4',
+                }
+            }
+        },
+        'ADCS_GET_MTM2_MEASUREMENTS': {
+            'what': 'Return raw secondary magnetometer measuremnets.',
+            'subPort': 77,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Mag_X': '>i2',
+                    'Mag_Y': '>i2',
+                    'Mag_Z': '>i2',
+                }
+            }
+        },
+        'ADCS_GET_POWER_TEMP': {
+            'what': 'Returns power and temperature measurements (Table 154 F/W Ref. Manual).',
+            'subPort': 78,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Cubesense1_3v3_I': '>f4',
+                    'Cubesense1_CamSram_I': '>f4',
+                    'Cubesense2_3v3_I': '>f4',
+                    'Cubesense2_CamSram_I': '>f4',
+                    'Cubecontrol_3v3_I': '>f4',
+                    'cubecontrol_5v_I': '>f4',
+                    'Cubecontrol_vBat_I': '>f4',
+                    'wheel1_I': '>f4',
+                    'wheel2_I': '>f4',
+                    'wheel3_I': '>f4',
+                    'Cubestar_I': '>f4',
+                    'Magnetorquer_I': '>f4',
+                    'Cubestar_Temp': '>f4',
+                    'MCU_temp': '>f4',
+                    'MTM_temp': '>f4',
+                    'MTM2_temp': '>f4',
+                    'Rate_Sensor_Temp_X': '>i2',
+                    'Rate_Sensor_Temp_Y': '>i2',
+                    'Rate_Sensor_Temp_Z': '>i2',
+                }
+            }
+        },
+        'ADCS_SET_POWER_CONTROL': {
+            'what': 'Control power to selected components (Table 185 F/W Ref. Manual).',
+            'subPort': 79,
+            'inoutInfo': {
+                'args': { 
+                    "CubeCtrl_Sig_Pwr_Sel" : '>u1',
+                    "CubeCtrl_Mtr_Pwr_Sel" : '>u1',
+                    "CubeSense1_Pwr_Sel" : '>u1',
+                    "CubeSense2_Pwr_Sel" : '>u1',
+                    "CubeStar_Pwr_Sel" : '>u1',
+                    "CubeWheel1_Pwr_Sel" : '>u1',
+                    "CubeWheel2_Pwr_Sel" : '>u1',
+                    "CubeWheel3_Pwr_Sel" : '>u1',
+                    "Mtr_Pwr" : '>u1',
+                    "GPS_Pwr" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_GET_POWER_CONTROL': {
+            'what': 'Returns component power [0 = OFF, 1 = ON, 2 = Kept same]',
+            'subPort': 80,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'CubeCTRLSgn': '>u1',
+                    'CubeCTRLMtr': '>u1',
+                    'CubeSense1': '>u1',
+                    'CubeSense2': '>u1',
+                    'CubeStar': '>u1',
+                    'CubeWheel1': '>u1',
+                    'CubeWheel2': '>u1',
+                    'CubeWheel3': '>u1',
+                    'Motor': '>u1',
+                    'GPS': '>u1',
+                }
+            }
+        },
+        'ADCS_SET_ATTITUDE_ANGLE': {
+            'what' : "CHECK DATA SHEET BEFORE USE. xyz ORDER MAY BE WRONG",
+            'subPort': 81,
+            'inoutInfo': {
+                'args': {
+                    'x' : '>f4',
+                    'y' : '>f4',
+                    'z' : '>f4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_GET_ATTITUDE_ANGLE': {
+            'what': 'Returns commanded attitude angles',
+            'subPort': 82,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'X': '>f4',
+                    'Y': '>f4',
+                    'Z': '>f4'
+                }
+            }
+        },
+        'ADCS_SET_TRACK_CONTROLLER': {
+            'what': 'Sets target reference for tracking control mode (Table 186 F/W Ref. Manual).',
+            'subPort': 83,
+            'inoutInfo': {
+                'args': {
+                    'Geocentric_Long' : '>f4',
+                    'Geocentric_Lat' : '>f4',
+                    'Geocentric_Alt' : '>f4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_GET_TRACK_CONTROLLER': {
+            'what': 'Returns target reference for tracking control mode (Table 186 F/W Ref. Manual).',
+            'subPort': 84,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Geocentric_Long' : '>f4',
+                    'Geocentric_Lat' : '>f4',
+                    'Geocentric_Alt' : '>f4'
+                }
+            }
+        },
+        'ADCS_SET_LOG_CONFIG': {
+            "what" : "Hex file assumed for file with name 'file name'",
+            'subPort': 85,
+            'inoutInfo': {
+                'args': {
+                    "Period" : '>u2',
+                    "Destination" : '>B',
+                    "Log" : '>B',
+                    "File_name" : '>S30'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_GET_LOG_CONFIG': {
+            'what': 'Returns log config of selected log',
+            'subPort': 86,
+            'inoutInfo': {
+                'args': {
+                    "Log" : '>B'
+                },
+                'returns': {
+                    'err': '>b',
+                    'Flags_arr': '>V80',
+                    'Period': '>u2',
+                    'Dest': '>u1',
+                    'Log': '>u1'
+                }
+            }
+        },
+        'ADCS_SET_INERTIAL_REF': {
+            'what': 'Set reference unit vector for inertial pointing control mode.',
+            'subPort': 87,
+            'inoutInfo': {
+                'args': {
+                    "x" : '>f4',
+                    "y" : '>f4',
+                    "z" : '>f4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_GET_INERTIAL_REF': {
+            'what': 'Returns reference unit vector for interial pointing control mode.',
+            'subPort': 88,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'X': '>f4',
+                    'Y': '>f4',
+                    'Z': '>f4'
+                }
+            }
+        },
+        'ADCS_SET_SGP4_ORBIT_PARAMS': {
+            'what': 'Set SGP4 orbit parameters. Use SAVE_ORBIT_PARAMS to save to flash.',
+            'subPort': 89,
+            'inoutInfo': {
+                'args': {
+                    "inclination" : '>f8',
+                    "eccentricity" : '>f8',
+                    "RAAN" : '>f8',
+                    "AOP" : '>f8',
+                    "Bstar" : '>f8',
+                    "mean_motion" : '>f8',
+                    "mean_anomaly" : '>f8',
+                    "epoch" : '>f8',
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_GET_SGP4_ORBIT_PARAMS': {
+            'what': 'Returns SGP4 orbit parameters saved on ADCS.',
+            'subPort': 90,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Inclination': '>f8',
+                    'ECC': '>f8',
+                    'RAAN': '>f8',
+                    'AOP': '>f8',
+                    'Bstar': '>f8',
+                    'MM': '>f8',
+                    'MA': '>f8',
+                    'Epoch': '>f8'
+                }
+            }
+        },
+        'ADCS_SET_SYSTEM_CONFIG': {
+            'what': 'Set ADCS system config -- DO NOT EXECUTE UNLESS CONSULTED WITH CUBESPACE',
+            'subPort': 91,
+            'inoutInfo': {
+                'args': {
+                    'Acp_Type': '>u1',
+                    'Special_Ctrl_Sel': '>u1',
+                    'CC_sig_ver': '>u1',
+                    'CC_motor_ver': '>u1',
+                    'CS1_ver': '>u1',
+                    'CS2_ver': '>u1',
+                    'CS1_cam': '>u1',
+                    'CS2_cam': '>u1',
+                    'CubeStar_Ver': '>u1',
+                    'GPS': '>u1',
+                    'Include_MTM2': '>?',
+                    'MTQ_max_dipole_X': '>f4',
+                    'MTQ_max_dipole_Y': '>f4',
+                    'MTQ_max_dipole_Z': '>f4',
+                    'MTQ_ontime_res': '>f4',
+                    'MTQ_max_ontime': '>f4',
+                    'RW_max_torque_X': '>f4',
+                    'RW_max_torque_Y': '>f4',
+                    'RW_max_torque_Z': '>f4',
+                    'RW_max_moment_X': '>f4',
+                    'RW_max_moment_Y': '>f4',
+                    'RW_max_moment_Z': '>f4',
+                    'RW_inertia_X': '>f4',
+                    'RW_inertia_Y': '>f4',
+                    'RW_inertia_Z': '>f4',
+                    'RW_torque_inc': '>f4',
+                    'MTM1_bias_d1_X': '>f4',
+                    'MTM1_bias_d1_Y': '>f4',
+                    'MTM1_bias_d1_Z': '>f4',
+                    'MTM1_bias_d2_X': '>f4',
+                    'MTM1_bias_d2_Y': '>f4',
+                    'MTM1_bias_d2_Z': '>f4',
+                    'MTM1_sens_s1_X': '>f4',
+                    'MTM1_sens_s1_Y': '>f4',
+                    'MTM1_sens_s1_Z': '>f4',
+                    'MTM1_sens_s2_X': '>f4',
+                    'MTM1_sens_s2_Y': '>f4',
+                    'MTM1_sens_s2_Z': '>f4',
+                    'MTM2_bias_d1_X': '>f4',
+                    'MTM2_bias_d1_Y': '>f4',
+                    'MTM2_bias_d1_Z': '>f4',
+                    'MTM2_bias_d2_X': '>f4',
+                    'MTM2_bias_d2_Y': '>f4',
+                    'MTM2_bias_d2_Z': '>f4',
+                    'MTM2_sens_s1_X': '>f4',
+                    'MTM2_sens_s1_Y': '>f4',
+                    'MTM2_sens_s1_Z': '>f4',
+                    'MTM2_sens_s2_X': '>f4',
+                    'MTM2_sens_s2_Y': '>f4',
+                    'MTM2_sens_s2_Z': '>f4',
+                    'CC_Signal_Port': '>u1',
+                    'CC_Signal_Pin': '>u1',
+                    'CC_Motor_Port': '>u1',
+                    'CC_Motor_Pin': '>u1',
+                    'CC_Common_Port': '>u1',
+                    'CC_Common_Pin': '>u1',
+                    'CS1_Port': '>u1',
+                    'CS1_Pin': '>u1',
+                    'CS2_Port': '>u1',
+                    'CS2_Pin': '>u1',
+                    'CubeStar_Port': '>u1',
+                    'CubeStar_Pin': '>u1',
+                    'CW1_Port': '>u1',
+                    'CW1_Pin': '>u1',
+                    'CW2_Port': '>u1',
+                    'CW2_Pin': '>u1',
+                    'CW3_Port': '>u1',
+                    'CW3_Pin': '>u1',
+                }, 
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_GET_SYSTEM_CONFIG': {
+            'what': 'Returns the hard-coded system configuration (Tabbles 201-207 F/W Ref. Manual).',
+            'subPort': 92,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Acp_Type': '>u1',
+                    'Special_Ctrl_Sel': '>u1',
+                    'CC_sig_ver': '>u1',
+                    'CC_motor_ver': '>u1',
+                    'CS1_ver': '>u1',
+                    'CS2_ver': '>u1',
+                    'CS1_cam': '>u1',
+                    'CS2_cam': '>u1',
+                    'CubeStar_Ver': '>u1',
+                    'GPS': '>u1',
+                    'Include_MTM2': '>?',
+                    'MTQ_max_dipole_X': '>f4',
+                    'MTQ_max_dipole_Y': '>f4',
+                    'MTQ_max_dipole_Z': '>f4',
+                    'MTQ_ontime_res': '>f4',
+                    'MTQ_max_ontime': '>f4',
+                    'RW_max_torque_X': '>f4',
+                    'RW_max_torque_Y': '>f4',
+                    'RW_max_torque_Z': '>f4',
+                    'RW_max_moment_X': '>f4',
+                    'RW_max_moment_Y': '>f4',
+                    'RW_max_moment_Z': '>f4',
+                    'RW_inertia_X': '>f4',
+                    'RW_inertia_Y': '>f4',
+                    'RW_inertia_Z': '>f4',
+                    'RW_torque_inc': '>f4',
+                    'MTM1_bias_d1_X': '>f4',
+                    'MTM1_bias_d1_Y': '>f4',
+                    'MTM1_bias_d1_Z': '>f4',
+                    'MTM1_bias_d2_X': '>f4',
+                    'MTM1_bias_d2_Y': '>f4',
+                    'MTM1_bias_d2_Z': '>f4',
+                    'MTM1_sens_s1_X': '>f4',
+                    'MTM1_sens_s1_Y': '>f4',
+                    'MTM1_sens_s1_Z': '>f4',
+                    'MTM1_sens_s2_X': '>f4',
+                    'MTM1_sens_s2_Y': '>f4',
+                    'MTM1_sens_s2_Z': '>f4',
+                    'MTM2_bias_d1_X': '>f4',
+                    'MTM2_bias_d1_Y': '>f4',
+                    'MTM2_bias_d1_Z': '>f4',
+                    'MTM2_bias_d2_X': '>f4',
+                    'MTM2_bias_d2_Y': '>f4',
+                    'MTM2_bias_d2_Z': '>f4',
+                    'MTM2_sens_s1_X': '>f4',
+                    'MTM2_sens_s1_Y': '>f4',
+                    'MTM2_sens_s1_Z': '>f4',
+                    'MTM2_sens_s2_X': '>f4',
+                    'MTM2_sens_s2_Y': '>f4',
+                    'MTM2_sens_s2_Z': '>f4',
+                    'CC_Signal_Port': '>u1',
+                    'CC_Signal_Pin': '>u1',
+                    'CC_Motor_Port': '>u1',
+                    'CC_Motor_Pin': '>u1',
+                    'CC_Common_Port': '>u1',
+                    'CC_Common_Pin': '>u1',
+                    'CS1_Port': '>u1',
+                    'CS1_Pin': '>u1',
+                    'CS2_Port': '>u1',
+                    'CS2_Pin': '>u1',
+                    'CubeStar_Port': '>u1',
+                    'CubeStar_Pin': '>u1',
+                    'CW1_Port': '>u1',
+                    'CW1_Pin': '>u1',
+                    'CW2_Port': '>u1',
+                    'CW2_Pin': '>u1',
+                    'CW3_Port': '>u1',
+                    'CW3_Pin': '>u1',
+                }
+            }
+        },
+        'ADCS_SET_MTQ_CONFIG': {
+            'what': 'Set magnetorquer axes. Keep default (values found in ADCS Flight Config sheet).',
+            'subPort': 93,
+            'inoutInfo': {
+                'args': {
+                    "Mag1_axis" : '>u1',
+                    "Mag2_axis" : '>u1',
+                    "Mag3_axis" : '>u1'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ADCS_SET_RW_CONFIG': {
+            'what': 'Sets wheel axes (Table 180 F/W Ref. Manual).',
+            'subPort': 94,
+            'inoutInfo': {
+                'args': {
+                    "RW1_axis" : '>u1',
+                    "RW2_axis" : '>u1',
+                    "RW3_axis" : '>u1',
+                    "RW4_axis" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_RATE_GYRO': {
+            'what': 'Set rate gyro config parameters. Keep default (values provided in ADCS Flight Config Sheet).',
+            'subPort': 95,
+            'inoutInfo': {
+                'args': {
+                    "Gyro1_axis" : '>u1',
+                    "Gyro2_axis" : '>u1',
+                    "Gyro3_axis" : '>u1',
+                    "X_sensor_offset" : '>f4',
+                    "Y_sensor_offset" : '>f4',
+                    "Z_sensor_offset" : '>f4',
+                    "Rate_Sensor_Mult" : '>u1',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_CSS_CONFIG': {
+            "what" : "CSS relative scale floats cannot be negative!",
+            'subPort': 96,
+            'inoutInfo': {
+                'args': {
+                    "CSS1_axis" : '>B',
+                    "CSS2_axis" : '>B',
+                    "CSS3_axis" : '>B',
+                    "CSS4_axis" : '>B',
+                    "CSS5_axis" : '>B',
+                    "CSS6_axis" : '>B',
+                    "CSS7_axis" : '>B',
+                    "CSS8_axis" : '>B',
+                    "CSS9_axis" : '>B',
+                    "CSS10_axis" : '>B',
+                    "CSS1_rel_scale" : '>f4',
+                    "CSS2_rel_scale" : '>f4',
+                    "CSS3_rel_scale" : '>f4',
+                    "CSS4_rel_scale" : '>f4',
+                    "CSS5_rel_scale" : '>f4',
+                    "CSS6_rel_scale" : '>f4',
+                    "CSS7_rel_scale" : '>f4',
+                    "CSS8_rel_scale" : '>f4',
+                    "CSS0_rel_scale" : '>f4',
+                    "CSS10_rel_scale" : '>f4',
+                    "CSS_threshold" : '>B'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_STAR_TRACK_CONFIG': {
+            'what': 'Star Tracker not used.',
+            'subPort': 97,
+            'inoutInfo': {
+                'args': { #TODO Better names
+                    "Float1" : '>f4',
+                    "Float2" : '>f4',
+                    "Float3" : '>f4',
+                    "Arg1" : '>u2',
+                    "Arg2" : '>u2',
+                    "Arg3" : '>u1',
+                    "Arg4" : '>u1',
+                    "Arg5" : '>u1',
+                    "Arg6" : '>u2',
+                    "Arg7" : '>u1',
+                    "Arg8" : '>u1',
+                    "Arg9" : '>u1',
+                    "Float4" : '>f4',
+                    "Float5" : '>f4',
+                    "Float6" : '>f4',
+                    "Float7" : '>f4',
+                    "Float8" : '>f4',
+                    "Float9" : '>f4',
+                    "Float10" : '>f4',
+                    "Arg10" : '>u1',
+                    "Arg11" : '>u1',
+                    "Arg12" : '>u1',
+                    "Arg13" : '>u?',
+                    "Arg14" : '>u?',
+                    "Arg15" : '>u1',
+
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_CUBESENSE_CONFIG': {
+            'what': 'Set CubeSense config parameters (Table 189 F/W Ref. Manual). Cam1 parameters to be kept default -- Cam2 TBD in orbit.',
+            'subPort': 98,
+            'inoutInfo': {
+                'args': {
+                    "Config" : '>S30'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_MTM_CONFIG': {
+            'what': 'Sets the magnetometer configuration parameters. Input: Angle xyz (floats), channel_offset xyz (floats), sensitivity matrix (s11,s22,s33,s12,s13,s21,s23,s31,s32)',
+            'subPort': 99,
+            'inoutInfo': {
+                'args': {
+                    "angle_x" : '>f4',
+                    "angle_y" : '>f4',
+                    "angle_z" : '>f4',
+                    "channel_x" : '>f4',
+                    "channel_y" : '>f4',
+                    "channel_z" : '>f4',
+                    "s11" : '>f4',
+                    "s22" : '>f4',
+                    "s33" : '>f4',
+                    "s12" : '>f4',
+                    "s13" : '>f4',
+                    "s21" : '>f4',
+                    "s23" : '>f4',
+                    "s31" : '>f4',
+                    "s32" : '>f4',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_DETUMBLE_CONFIG': {
+            'what': 'Set control parameters for Detumbling mode. Values TBD from sims and/or commissioning.',
+            'subPort': 100,
+            'inoutInfo': {
+                'args': {
+                    "Detumble_Spin_Gain" : '>f4',
+                    "Detumble_Damp_Gain" : '>f4',
+                    "Ref_Spin_Rate" : '>f4',
+                    "Fast_Bdot_Detumble_Gain" : '>f4',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_YWHEEL_CONFIG': {
+            'what': 'Set control parameters for Y-wheel control mode. Values TBD from sims and commissioning.',
+            'subPort': 101,
+            'inoutInfo': {
+                'args': {
+                    "Ymoment_Ctrl_Gain" : '>f4',
+                    "Ymoment_Damp_Gain" : '>f4',
+                    "Ymoment_Prop_Gain" : '>f4',
+                    "Ymoment_Deriv_Gain" : '>f4',
+                    "Ref_Wheel_Moment" : '>f4',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_RWHEEL_CONFIG': {
+            'what': 'Set control parameters for reaction wheel mode. Values TBD from sims and/or commissioning.',
+            'subPort': 102,
+            'inoutInfo': {
+                'args': {
+                    "RWheel_Prop_Gain" : '>f4',
+                    "RWheel_Deriv_Gain" : '>f4',
+                    "YWheel_Bias_Moment" : '>f4',
+                    "Sun_Point_Facet" : '>B',
+                    "Auto_Ctrl_Transit" : '>B'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_TRACKING_CONFIG': {
+            'what': 'Set control parameters for tracking mode. Values TBD from sims and/or commissioning.',
+            'subPort': 103,
+            'inoutInfo': {
+                'args': {
+                    "Track_Prop_Gain" : '>f4',
+                    "Track_Deriv_Gain" : '>f4',
+                    "Track_Intgrl_Gain" : '>f4',
+                    "Trgt_Track_Facet" : '>B'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_MOI_MAT': {
+            'what': 'Sets satellite moment of inertia matrix.',
+            'subPort': 104,
+            'inoutInfo': {
+                'args': {
+                    "Ixx" : '>f4',
+                    "Iyy" : '>f4',
+                    "Izz" : '>f4',
+                    "Ixy" : '>f4',
+                    "Ixz" : '>f4',
+                    "Iyz" : '>f4',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_ESTIMATION_CONFIG': {
+            'what': 'Sets estimation noise covariance and sensor mask (Table 200 F/W Ref. Manual). Consult with CubeSpace before executing.',
+            'subPort': 105,
+            'inoutInfo': {
+                'args': {
+                    "Mtm_Rt_Fltr_Sys_Noise" : '>f4',
+                    "EKF_Sys_Noise" : '>f4',
+                    "CSS_Msrmnt_Noise" : '>f4',
+                    "Sun_Snsr_Msrmnt_Noise" : '>f4',
+                    "Ndr_Snsr_Msrmnt_Noise" : '>f4',
+                    "Mtm_Snsr_Msrmnt_Noise" : '>f4',
+                    "Strtrckr_Msrmnt_Noise" : '>f4',
+                    "Use_Sun_Sensor" : '>u1',
+                    "Use_Nadir_Sensor" : '>u1',
+                    "Use_CSS" : '>u1',
+                    "Use_Star_Tracker" : '>u1',
+                    "Ndr_Snsr_Trmntr_Tst" : '>u1',
+                    "Auto_Mtm_Rcvry" : '>u1',
+                    "Mtm_Sel1" : '>u1',
+                    "Mtm_Sel2" : '>u1', # MTM selection done by ORing with last two elements in select_arr
+                    "Mtm_Mode" : '>u1',
+                    "Auto_Est_Trans" : '>u1',
+                    "Cam_Sample_Period" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_USERCODED_SETTING': {
+            'what': 'Set user-coded estimation and control modes.',
+            'subPort': 106,
+            'inoutInfo': {
+                'args': {
+                    "User_Ctrlr_Set" : '>O20',
+                    "User_Estim_Set" : '>020'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_SET_ASGP4_SETTING': {
+            'what': 'Set ASGP4 settings (Not using GPS-augmented SGP4, use SGP4 commands instead!).',
+            'subPort': 107,
+            'inoutInfo': {
+                'args': {
+                    "Float1" : '>f4',
+                    "Float2" : '>f4',
+                    "Float3" : '>f4',
+                    "Float4" : '>f4',
+                    "Float5" : '>f4',
+                    "Float6" : '>f4',
+                    "Float7" : '>f4',
+                    "Arg1" : '>u1',
+                    "Float8" : '>f4',
+                    "Float9" : '>f4',
+                    "Arg2" : '>u1',
+                    "Float10" : '>f4',
+                    "Float11" : '>f4',
+                    "Arg3" : '>u1',
+                    "Float12" : '>f4',
+                    "Float13" : '>f4',
+                    "Arg4" : '>u2',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_GET_FULL_CONFIG': {
+            'what': 'Returns ADCS full config (Table 192 F/W Ref. Manual).',
+            'subPort': 108,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'MTQ_x': '>B',
+                    'MTQ_y': '>B',
+                    'MTQ_z': '>B',
+                    'RW1': '>B',
+                    'RW2': '>B',
+                    'RW3': '>B',
+                    'RW4': '>B',
+                    'gyro_x': '>B',
+                    'gyro_y': '>B',
+                    'gyro_z': '>B',
+                    'sensor_offset_x': '>f4',
+                    'sensor_offset_y': '>f4',
+                    'sensor_offset_z': '>f4',
+                    'rate_sensor_mult': '>B',
+                    'css_config1': '>B',
+                    'css_config2': '>B',
+                    'css_config3': '>B',
+                    'css_config4': '>B',
+                    'css_config5': '>B',
+                    'css_config6': '>B',
+                    'css_config7': '>B',
+                    'css_config8': '>B',
+                    'css_config9': '>B',
+                    'css_config10': '>B',
+                    'css_relscale1': '>f4',
+                    'css_relscale2': '>f4',
+                    'css_relscale3': '>f4',
+                    'css_relscale4': '>f4',
+                    'css_relscale5': '>f4',
+                    'css_relscale6': '>f4',
+                    'css_relscale7': '>f4',
+                    'css_relscale8': '>f4',
+                    'css_relscale9': '>f4',
+                    'css_relscale10': '>f4',
+                    'css_threshold': '>B',
+                    'cs1_mnt_angle_x': '>f4',
+                    'cs1_mnt_angle_y': '>f4',
+                    'cs1_mnt_angle_z': '>f4',
+                    'cs1_detect_th': '>B',
+                    'cs1_auto_adjust': '>?',
+                    'cs1_exposure_t': '>u2',
+                    'cs1_boresight_x': '>f4',
+                    'cs1_boresight_y': '>f4',
+                    'cs2_mnt_angle_x': '>f4',
+                    'cs2_mnt_angle_y': '>f4',
+                    'cs2_mnt_angle_z': '>f4',
+                    'cs2_detect_th': '>B',
+                    'cs2_auto_adjust': '>?',
+                    'cs2_exposure_t': '>u2',
+                    'cs2_boresight_x': '>f4',
+                    'cs2_boresight_y': '>f4',
+                    'nadir_max_deviate': '>B',
+                    'nadir_max_bad_edge': '>B',
+                    'nadir_max_radius': '>B',
+                    'nadir_min_radius': '>B',
+                    'cam1_area_1_x_min': '>u2',
+                    'cam1_area_1_x_max': '>u2',
+                    'cam1_area_1_y_min': '>u2',
+                    'cam1_area_1_y_max': '>u2',
+                    'cam1_area_2_x_min': '>u2',
+                    'cam1_area_2_x_max': '>u2',
+                    'cam1_area_2_y_min': '>u2',
+                    'cam1_area_2_y_max': '>u2',
+                    'cam1_area_3_x_min': '>u2',
+                    'cam1_area_3_x_max': '>u2',
+                    'cam1_area_3_y_min': '>u2',
+                    'cam1_area_3_y_max': '>u2',
+                    'cam1_area_4_x_min': '>u2',
+                    'cam1_area_4_x_max': '>u2',
+                    'cam1_area_4_y_min': '>u2',
+                    'cam1_area_4_y_max': '>u2',
+                    'cam1_area_5_x_min': '>u2',
+                    'cam1_area_5_x_max': '>u2',
+                    'cam1_area_5_y_min': '>u2',
+                    'cam1_area_5_y_max': '>u2',
+                    'cam2_area_1_x_min': '>u2',
+                    'cam2_area_1_x_max': '>u2',
+                    'cam2_area_1_y_min': '>u2',
+                    'cam2_area_1_y_max': '>u2',
+                    'cam2_area_2_x_min': '>u2',
+                    'cam2_area_2_x_max': '>u2',
+                    'cam2_area_2_y_min': '>u2',
+                    'cam2_area_2_y_max': '>u2',
+                    'cam2_area_3_x_min': '>u2',
+                    'cam2_area_3_x_max': '>u2',
+                    'cam2_area_3_y_min': '>u2',
+                    'cam2_area_3_y_max': '>u2',
+                    'cam2_area_4_x_min': '>u2',
+                    'cam2_area_4_x_max': '>u2',
+                    'cam2_area_4_y_min': '>u2',
+                    'cam2_area_4_y_max': '>u2',
+                    'cam2_area_5_x_min': '>u2',
+                    'cam2_area_5_x_max': '>u2',
+                    'cam2_area_5_y_min': '>u2',
+                    'cam2_area_5_y_max': '>u2',
+                    'MTM1_mount_angle_x': '>f4',
+                    'MTM1_mount_angle_y': '>f4',
+                    'MTM1_mount_angle_z': '>f4',
+                    'MTM1_channel_offset_x': '>f4',
+                    'MTM1_channel_offset_y': '>f4',
+                    'MTM1_channel_offset_z': '>f4',
+                    'MTM1_sensitivity_mat_1': '>f4',
+                    'MTM1_sensitivity_mat_2': '>f4',
+                    'MTM1_sensitivity_mat_3': '>f4',
+                    'MTM1_sensitivity_mat_4': '>f4',
+                    'MTM1_sensitivity_mat_5': '>f4',
+                    'MTM1_sensitivity_mat_6': '>f4',
+                    'MTM1_sensitivity_mat_7': '>f4',
+                    'MTM1_sensitivity_mat_8': '>f4',
+                    'MTM1_sensitivity_mat_9': '>f4',
+                    'MTM2_mount_angle_x': '>f4',
+                    'MTM2_mount_angle_y': '>f4',
+                    'MTM2_mount_angle_z': '>f4',
+                    'MTM2_channel_offset_x': '>f4',
+                    'MTM2_channel_offset_y': '>f4',
+                    'MTM2_channel_offset_z': '>f4',
+                    'MTM2_sensitivity_mat_1': '>f4',
+                    'MTM2_sensitivity_mat_2': '>f4',
+                    'MTM2_sensitivity_mat_3': '>f4',
+                    'MTM2_sensitivity_mat_4': '>f4',
+                    'MTM2_sensitivity_mat_5': '>f4',
+                    'MTM2_sensitivity_mat_6': '>f4',
+                    'MTM2_sensitivity_mat_7': '>f4',
+                    'MTM2_sensitivity_mat_8': '>f4',
+                    'MTM2_sensitivity_mat_9': '>f4',
+                    'cubestar_mounting_angle_x': '>f4',
+                    'cubestar_mounting_angle_y': '>f4',
+                    'cubestar_mounting_angle_z': '>f4',
+                    'cubestar_exposure_t': '>u2',
+                    'cubestar_analog_gain': '>u2',
+                    'cubestar_detect_th': '>B',
+                    'cubestar_star_th': '>B',
+                    'cubestar_max_star_matched': '>B',
+                    'cubestar_detect_timeout_t': '>u2',
+                    'cubestar_max_pixel': '>B',
+                    'cubestar_min_pixel': '>B',
+                    'cubestar_err_margin': '>B',
+                    'cubestar_delay_t': '>u2',
+                    'cubestar_centroid_x': '>f4',
+                    'cubestar_centroid_y': '>f4',
+                    'cubestar_focal_len': '>f4',
+                    'cubestar_radical_distor_1': '>f4',
+                    'cubestar_radical_distor_2': '>f4',
+                    'cubestar_tangent_distor_1': '>f4',
+                    'cubestar_tangent_distor_2': '>f4',
+                    'cubestar_window_wid': '>B',
+                    'cubestar_track_margin': '>B',
+                    'cubestar_valid_margin': '>B',
+                    'cubestar_module_en': '>?',
+                    'cubestar_loc_predict_en': '>?',
+                    'cubestar_search_wid': '>B',
+                    'detumble_spin_gain': '>f4',
+                    'detumble_damping_gain': '>f4',
+                    'detumble_spin_rate': '>f4',
+                    'detumble_fast_bDot': '>f4',
+                    'ywheel_control_gain': '>f4',
+                    'ywheel_damping_gain': '>f4',
+                    'ywheel_proportional_gain': '>f4',
+                    'ywheel_derivative_gain': '>f4',
+                    'ywheel_reference': '>f4',
+                    'rwheel_proportional_gain': '>f4',
+                    'rwheel_derivative_gain': '>f4',
+                    'rwheel_bias_moment': '>f4',
+                    'rwheel_sun_point_facet': '>B',
+                    'rwheel_auto_transit': '>?',
+                    'tracking_proportional_gain': '>f4',
+                    'tracking_derivative_gain': '>f4',
+                    'tracking_integral_gain': '>f4',
+                    'tracking_target_facet': '>B',
+                    'MoI_config_diag_x': '>f4',
+                    'MoI_config_diag_y': '>f4',
+                    'MoI_config_diag_z': '>f4',
+                    'MoI_config_nondiag_x': '>f4',
+                    'MoI_config_nondiag_y': '>f4',
+                    'MoI_config_nondiag_z': '>f4',
+                    'est_MTM_rate_noise': '>f4',
+                    'est_EKF_noise': '>f4',
+                    'est_CSS_noise': '>f4',
+                    'est_sun_sensor_noise': '>f4',
+                    'est_nadir_sensor_noise': '>f4',
+                    'est_MTM_noise': '>f4',
+                    'est_star_track_noise': '>f4',
+                    'est_select_arr_1': '>B',
+                    'est_select_arr_2': '>B',
+                    'est_select_arr_3': '>B',
+                    'est_select_arr_4': '>B',
+                    'est_select_arr_5': '>B',
+                    'est_select_arr_6': '>B',
+                    'est_select_arr_7': '>B',
+                    'est_select_arr_8': '>B',
+                    'est_MTM_mode': '>B',
+                    'est_MTM_select': '>B',
+                    'est_cam_sample_period': '>B',
+                    'asgp4_inclination': '>f4',
+                    'asgp4_RAAN': '>f4',
+                    'asgp4_ECC': '>f4',
+                    'asgp4_AoP': '>f4',
+                    'asgp4_time': '>f4',
+                    'asgp4_pos': '>f4',
+                    'asgp4_max_pos_err': '>f4',
+                    'asgp4_filter': '>B',
+                    'asgp4_xp': '>f4',
+                    'asgp4_yp': '>f4',
+                    'asgp4_gps_rollover': '>B',
+                    'asgp4_pos_sd': '>f4',
+                    'asgp4_vel_sd': '>f4',
+                    'asgp4_min_stat': '>B',
+                    'asgp4_time_gain': '>f4',
+                    'asgp4_max_lag': '>f4',
+                    'asgp4_min_samples': '>u2',
+                    'usercoded_controller': '>V48',
+                    'usercoded_estimator': '>V48'
+                }
+            }
+        },
+        'ADCS_DOWNLOAD_FILE_LIST_TO_OBC': {
+            'what': 'Saves information about files stored on the ADCS to the OBC. File name VOL0:/adcs/adcs_file_list.txt',
+            'subPort': 109,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'ADCS_DOWNLOAD_FILE_TO_OBC': {
+            'what': 'Saves a file from the ADCS to the OBC. Inputs: type, counter, size, and OBC file name. (Be patient and check the log for return.)',
+            'subPort': 110,
+            'inoutInfo': {
+                'args': {
+                    "Type" : '>B',
+                    "Counter" : '>B',
+                    "Size" : '>u4',
+                    "File_name" : '>S30'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+    }
+}
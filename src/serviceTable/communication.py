@@ -0,0 +1,658 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/communication.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 10,
+    'subservice': {
+        'S_GET_FREQ': {
+            'what': 'Gets the S-band frequency (Hz)',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'frequency_Hz': '>u4',
+                }
+            }
+        },
+        'S_GET_CONTROL': {
+            'what': 'Gets the S-band`s power amplifier write status and its mode = {0:configuration, 1: synchronization, 2:data, 3:test data}',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'status': '>u1',
+                    'mode': '>u1',
+                }
+            }
+        },
+        'S_GET_ENCODER': {
+            'what': 'Gets the S-band encoding configuration. mod={0:QPSK, 1:OQPSK}, rate={0:half, 1:full}',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'scrambler': '>u1',
+                    'filter': '>u1',
+                    'modulation': '>u1',
+                    'rate': '>u1',
+                }
+            }
+        },
+        'S_GET_PAPOWER': {
+            'what': 'Gets the power value of S-band power amplifier',
+            'subPort': 4,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Power Amplifier Power': '>u1',
+                }
+            }
+        },
+        'S_GET_STATUS': {
+            'what': 'Checks if the power of S-band power aamplifier is good and if the frequency lock is achieved',
+            'subPort': 5,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'PWRGD': '>u1',
+                    'TXL': '>u1',
+                }
+            }
+        },
+        'S_GET_FW': {
+            'what': 'S-band Firmware Version. XYY = X.YY',
+            'subPort': 6,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Firmware Version': '>u2',
+                }
+            }
+        },
+        'S_GET_TR': {
+            'what': 'S-band Transmit Ready Indicator = {0: >2560B in buffer}',
+            'subPort': 7,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Transmit Ready': '>i4',
+                }
+            }
+        },
+        'S_GET_BUFFER': {
+            'what': 'Gets the pointer to the buffer quantity in S-band. Input = {0:Count, 1:Underrun, 2:Overrun}',
+            'subPort': 8,
+            'inoutInfo': {
+                'args': {
+                    "Buffer_quantity" : '>B'
+                },
+                'returns': {
+                    'err': '>b',
+                    'buffer': '>u2',
+                }
+            }
+        },
+        'S_GET_HK': {
+            'what': 'Gets S-band housekeeping info',
+            'subPort': 9,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'S_mode': '>B',
+                    'PA_status': '>B',
+                    'S_frequency_Hz': '>u4',
+                    'S_scrambler': '>B',
+                    'S_filter': '>B',
+                    'S_modulation': '>B',
+                    'S_data_rate': '>B',
+                    'S_bit_order': '>B',
+                    'S_PWRGD': '>B',
+                    'S_TXL': '>B',
+                    'Output Power': '>B',
+                    'Power Amplifier Temperature': '>b',
+                    'Top Temperature': '>b',
+                    'Bottom Temperature': '>b',
+                    'Battery Current': '>u2',
+                    'Battery Voltage': '>u2',
+                    'Power Amplifier Current': '>u2',
+                    'Power Amplifier Voltage': '>u2',
+                }
+            }
+        },
+        'S_SOFT_RESET': {
+            'what': 'Reset S-band FPGA registers to default',
+            'subPort': 10,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'S_GET_FULL_STATUS': {
+            'what': 'A full status of S-band non-configurable parameters',
+            'subPort': 11,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'PWRGD': '>u1',
+                    'TXL': '>u1',
+                    'Transmit Ready': '>i4',
+                    'Buffer Count': '>u2',
+                    'Buffer Underrun': '>u2',
+                    'Buffer Overrun': '>u2',
+                    'Output Power': '>B',
+                    'Power Amplifier Temperature': '>b',
+                    'Top Temperature': '>b',
+                    'Bottom Temperature': '>b',
+                    'Battery Current mA': '>u2',
+                    'Battery Voltage mV': '>u2',
+                    'Power Amplifier Current mA': '>u2',
+                    'Power Amplifier Voltage mV': '>u2',
+                }
+            }
+        },
+        'S_SET_FREQ': {
+            'what': 'Sets the frequency of S-band (Hz)',
+            'subPort': 12,
+            'inoutInfo': {
+                'args': {
+                    "Frequency" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'S_SET_CONTROL': {
+            'what': 'Sets the S-band`s power amplifier write status and its mode = {0:config, 1: synch, 2:data, 3:test data}. Input: 2 binary',
+            'subPort': 13,
+            'inoutInfo': {
+                'args': {
+                    "Status" : '>u1',
+                    "Mode" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'S_SET_ENCODER': {
+            'what': 'Sets the S-band encoding configuration. mod={0:QPSK, 1:OQPSK}, rate={1:half, 0:full}. Input: 4 binary',
+            'subPort': 14,
+            'inoutInfo': {
+                'args': {
+                    "Scrambler" : '>u1',
+                    "Filter" : '>u1',
+                    "Modulation" : '>u1',
+                    "Baudrate" : '>u1',
+                    "Bit_order": '>u1',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'S_SET_PAPOWER': {
+            'what': 'Sets the power value of S-band power amplifier (24, 26, 28, 30 dBm)',
+            'subPort': 15,
+            'inoutInfo': {
+                'args': {
+                    "Power" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'S_GET_CONFIG': {
+            'what': 'A full status of S-band configurable parameters (the ones with set functions)',
+            'subPort': 16,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Frequency': '>u4',
+                    'Power Amplifier Power': '>u1',
+                    'Power Amplifier status': '>u1',
+                    'Power Amplifier mode': '>u1',
+                    'Encoder scrambler': '>u1',
+                    'Encoder filter': '>u1',
+                    'Encoder modulation': '>u1',
+                    'Encoder rate': '>u1',
+                    'Encoder bit order': '>u1'
+                }
+            }
+        },
+        'S_SET_CONFIG': {
+            'what': 'Sets all the 9 S-band configurable parameters',
+            'subPort': 17,
+            'inoutInfo': {
+                'args': {
+                    "Freq" : '>u4',
+                    "PA_power" : '>u1',
+                    "PA_status" : '>u1',
+                    "PA_mode" : '>u1',
+                    "Enc_scrambler" : '>u1',
+                    "Enc_filter" : '>u1',
+                    "Enc_mod" : '>u1',
+                    "Enc_rate" : '>u1',
+                    "Enc_bit_order" : '>u1',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_SCW': {
+            'what': 'Sets UHF status control word',
+            'subPort': 20,
+            'inoutInfo': {
+                'args': { #RONLY = read only parameter
+                    "HFTX_RONLY" : '>u1',
+                    "UART_baud" : '>u1',
+                    "Reset" : '>u1',
+                    "RF_mode" : '>u1',
+                    "Echo" : '>u1',
+                    "Beacon" : '>u1',
+                    "Pipe" : '>u1',
+                    "SW_mode" : '>u1',
+                    "CTS_RONLY" : '>u1',
+                    "SEC_RONLY" : '>u1',
+                    "FRAM_RONLY" : '>u1',
+                    "RFTS_RONLY" : '>u1',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_FREQ': {
+            'what': 'Sets UHF frequency (Hz)',
+            'subPort': 21,
+            'inoutInfo': {
+                'args': {
+                    "Freq" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_PIPE_T': {
+            'what': 'Sets UHF PIPE timeout period',
+            'subPort': 22,
+            'inoutInfo': {
+                'args': {
+                    "Timeout" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_BEACON_T': {
+            'what': 'Sets UHF beacon message transmission period',
+            'subPort': 23,
+            'inoutInfo': {
+                'args': {
+                    "Period" : ">u4"
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_AUDIO_T': {
+            'what': 'Sets UHF audio beacon period b/w transmissions',
+            'subPort': 24,
+            'inoutInfo': {
+                'args': {
+                    "Period" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_PARAMS': {
+            'what': 'Sets UHF freq, pipe_t, beacon_t, audio_t parameters. Input:4',
+            'subPort': 25,
+            'inoutInfo': {
+                'args': {
+                    "Freq" : '>u4',
+                    "pipe_t" : '>u4',
+                    "beacon_t" : '>u4',
+                    "audio_t" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_RESTORE': {
+            'what': 'Restore UHF default values',
+            'subPort': 26,
+            'inoutInfo': {
+                'args': {
+                    "Set_1_to_confirm" : '>u1' #Safety precaution
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_LOW_PWR': {
+            'what': 'Puts UHF TRX into low power mode',
+            'subPort': 27,
+            'inoutInfo': {
+                'args': {
+                    "Set_1_to_confirm" : '>u1' #Safety precaution
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_DESTINATION': {
+            'what': 'Sets UHF destination callsign',
+            'subPort': 28,
+            'inoutInfo': {
+                'args': {
+                    "Callsign" : '>S6'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_SOURCE': {
+            'what': 'Sets UHF source callsign',
+            'subPort': 29,
+            'inoutInfo': {
+                'args': {
+                    "Callsign" : '>S6'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_MORSE': {
+            'what': 'Sets UHF morse code callsign (max 36)',
+            'subPort': 30,
+            'inoutInfo': {
+                'args': {
+                    "Callsign" : '>S36'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_MIDI': {
+            'what': 'Sets UHF MIDI audio beacon (max 36 notes)',
+            'subPort': 31,
+            'inoutInfo': {
+                # increase packet size and switch to >U108
+                'args': {
+                    "Beacon" : '>S60'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_BEACON_MSG': {
+            'what': 'Sets UHF beacon message (max 98)',
+            'subPort': 32,
+            'inoutInfo': {
+                #TODO Switch to >U97 after packet configuration
+                'args': {
+                    "Beacon" : '>S60'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_I2C': {
+            'what': 'Sets UHF I2C address (22 | 23)',
+            'subPort': 33,
+            'inoutInfo': {
+                'args': {
+                    "Address" : '>u1'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_WRITE_FRAM': {
+            'what': 'Sets UHF FRAM address and write 16-byte data',
+            'subPort': 34,
+            'inoutInfo': {
+                'args': {
+                    "Address" : '>u4',
+                    "Data" : '>S16'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SECURE': {
+            'what': 'Puts UHF TRX into secure mode',
+            'subPort': 35,
+            'inoutInfo': {
+                'args': {
+                    "Set_1_to_confirm" : '>u1' #Safety precaution
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_GET_FULL_STAT': {
+            'what': 'Returns the fulla status of all the UHF non-configurable parameters',
+            'subPort': 36,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'HFXT': '>u1',
+                    'UartBaud': '>u1',
+                    'Reset': '>u1',
+                    'RF Mode': '>u1',
+                    'Echo': '>u1',
+                    'BCN': '>u1',
+                    'PIPE': '>u1',
+                    'Bootloader': '>u1',
+                    'CTS': '>u1',
+                    'SEC': '>u1',
+                    'FRAM': '>u1',
+                    'RFTS': '>u1',
+                    'Frequency': '>u4',
+                    'PIPE timeout': '>u4',
+                    'Beacon period': '>u4',
+                    'Audio trans. period': '>u4',
+                    'Uptime': '>u4',
+                    'Packets out': '>u4',
+                    'Packets in': '>u4',
+                    'Packets in CRC16': '>u4',
+                    'Temperature': '>f',
+                }
+            }
+        },
+        'UHF_GET_CALLSIGN': {
+            'what': 'Gets UHF destination and source callsign',
+            'subPort': 37,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Destination': '>S6',
+                    'Source': '>S6',
+                }
+            }
+        },
+        'UHF_GET_MORSE': {
+            'what': 'Gets UHF morse callsign',
+            'subPort': 38,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Morse': '>S36',
+                }
+            }
+        },
+        'UHF_GET_MIDI': {
+            'what': 'Gets UHF MIDI audio beacon',
+            'subPort': 39,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'MIDI': '>S60',
+                }
+            }
+        },
+        'UHF_GET_BEACON_MSG': {
+            'what': 'Gets the beacon message',
+            'subPort': 40,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Beacon Message': '>S60',
+                }
+            }
+        },
+        'UHF_GET_FRAM': {
+            'what': 'Reads the FRAM data',
+            'subPort': 41,
+            'inoutInfo': {
+                'args': {
+                    "FRAM" : '>u4' #TODO: Better name
+                },
+                'returns': {
+                    'err': '>b',
+                    'FRAM': '>S16',
+                }
+            }
+        },
+        'UHF_SET_ECHO': {
+            'what': 'Starts echo over UART',
+            'subPort': 42,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_BCN': {
+            'what': 'Set the communication to the beacon mode',
+            'subPort': 43,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_PIPE': {
+            'what': 'Set the communication to the PIPE(transparent) mode',
+            'subPort': 44,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_GET_SECURE_KEY': {
+            'what': 'Gets the key for secure mode',
+            'subPort': 45,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Secure Key': '>u4',
+                }
+            }
+        },
+        'UHF_GET_SWVER': {
+            'what': 'Gets the UHF firmware version',
+            'subPort': 46,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'ver_XYZ': '>u2',
+                }
+            }
+        },
+        'UHF_GET_PLDSZ': {
+            'what': 'Gets UHF device payload size',
+            'subPort': 47,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'size_B': '>u2',
+                }
+            }
+        },
+        'UHF_SET_CRC16_ENABLE': {
+            'what': 'Set whether UHF frame CRC16s are enabled',
+            'subPort': 48,
+            'inoutInfo': {
+                'args': {
+                    'enabled':'>?',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'UHF_SET_RF_MODE': {
+            'what': 'Set mode of uhf communications as defined in UHF user manual',
+            'subPort': 49,
+            'inoutInfo': {
+                'args': {
+                    'mode':'>b',
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+    }
+}
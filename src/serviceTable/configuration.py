@@ -0,0 +1,209 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/configuration.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("EPS",),
+    'port': 9,  # As per EPS docs
+    'subservice': {
+        'GET_ACTIVE_CONFIG': {
+            'what': 'Gets config values in active mode for a specific type',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': {
+                    "id" : '<u2',
+                    "type_id" : '<u1'
+                },
+                'returns': {
+                    'err': '>B',
+                    'type': '<u1',
+                    'Value': 'var' #In command parser it gets the data type from the return value for 'type'
+                }
+            }
+        },
+        'GET_MAIN_CONFIG': {
+            'what': 'Gets config values in main mode for a specific type',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': {
+                    "id" : '<u2',
+                    "type_id" : '<u1'
+                },
+                'returns': {
+                    'err': '>B',
+                    'type': '<u1',
+                    'Value': 'var' #See comment for active
+                }
+            }
+        },
+        'GET_FALLBACK_CONFIG': {
+            'what': 'Gets config values in fallback mode for a specific type',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': {
+                    "id" : '<u2',
+                    "type_id" : '<u1'
+                },
+                'returns': {
+                    'err': '>B',
+                    'type': '<u1',
+                    'Value': 'var' #See comment for active
+                }
+            }
+        },
+        'GET_DEFAULT_CONFIG': {
+            'what': 'Gets config values in default mode for a specific type',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': {
+                    "id" : '<u2',
+                    "type_id" : '<u1'
+                },
+                'returns': {
+                    'err': '>B',
+                    'type': '<u1',
+                    'Value': 'var' #See comment for active
+                }
+            }
+        },
+        'SET_CONFIG': {
+            'what': 'Sets the configuration',
+            'subPort': 4,
+            'inoutInfo': {
+                'args': {
+                    "id" : '<u2',
+                    "type_id" : '<u1',
+                    "Config" : 'var'
+                },
+                'returns': {
+                    'err': '>B',
+                }
+            }
+        },
+        'LOAD_MAIN2ACTIVE': {
+            'what': 'Load main configuration from file into active',
+            'subPort': 5,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'LOAD_FALLBACK2ACTIVE': {
+            'what': 'Load fallback configuration from file into active',
+            'subPort': 6,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'LOAD_DEFAULT2ACTIVE': {
+            'what': 'Load default configuration from file into active',
+            'subPort': 7,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'UNLOCK_CONFIG': {
+            'what': 'Unlock configuration for saving',
+            'subPort': 8,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'LOCK_CONFIG': {
+            'what': 'Lock configuration from saving',
+            'subPort': 9,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'SAVE_ACTIVE2MAIN': {
+            'what': 'Save active configuration to main file',
+            'subPort': 10,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'SAVE_ACTIVE2FALLBACK': {
+            'what': 'Save active configuration to fallback file',
+            'subPort': 11,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'ELEVATE_ACCESS': {
+            'what': 'Elevates access role. Key is in the docs',
+            'subPort': 12,
+            'inoutInfo': {
+                'args': {
+                    "Role" : '<u1',
+                    "Key" : '<u4'
+                },
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'GET_STATUS': {
+            'what': 'Gets status and errors info',
+            'subPort': 13,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B',
+                    'isInitialized': '<u1',
+                    'isLocked': '<u1',
+                    'isFallbackConfigurationLoaded': '<u1',
+                    'isMainConfigurationLoaded': '<u1',
+                    'wasFallbackRequested': '<u1',
+                    'initSource': '<u1',
+                    'currAccessRole': '<u1',
+                    'totalNumofErrors': '<u1',
+                    'numOfParameterDoesNotExistErrors': '<u1',
+                    'numOfInvalidParameterTypeErrors': '<u1',
+                    'numOfValidationFailErrors': '<u1',
+                    'numOfStorageFailErrors': '<u1',
+                    'numOfNotInitializedErrors': '<u1',
+                    'numOfNotLoadedOnInitErrors': '<u1',
+                    'numOfLockedErrors': '<u1',
+                    'numOfAccessDeniedErrors': '<u1',
+                    'numOfWrongPasswordErrors': '<u1',
+                    'numOfUnknownErrors': '<u1',
+                }
+            }
+        },
+    }
+}
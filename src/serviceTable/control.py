@@ -0,0 +1,148 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/control.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("EPS",),
+    'port': 14,
+    'subservice': {
+        # POWER OUTPUTS
+        'SINGLE_OUTPUT_CONTROL': {
+            'what': 'Turns on/off a power output channel (with a defined delay)',
+            'subPort': 0,
+            'inoutInfo': {
+                # output num., state, delay (s)
+                'args': {
+                    "Channel" : '<B',
+                    "State" : '<B',
+                    "Delay" : '<u2'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'ALL_OUTPUT_CONTROL': {
+            'what': 'Sets all ouputs status at once (nth bit -> nth channel. 18 bit binary integer',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': {
+                    "StateMask" : '<u4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'SINGLE_OUTPUT_CONTROL_NORMAL_BATT': {
+            'what': 'Set the output channels mode on normal battery mode',
+            'subPort': 9,
+            'inoutInfo': {
+                # output num., state, delay (s)
+                'args': {
+                    "Channel" : '<B',
+                    "State" : '<B',
+                    "Delay" : '<u2'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+
+        # SOLAR PANEL INPUTS & MPPT
+        'SET_SINGLE_MPPT_CONV_V': {
+            'what': 'Sets single MPPT converter voltage. Voltage is in mv',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': {
+                    "Channel" : '<B',
+                    "Voltage" : '<u2'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'SET_ALL_MPPT_CONV_V': {
+            'what': 'Sets all MPPT converter voltage at once',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': {
+                    "v1" : '<u2',
+                    "v2" : '<u2',
+                    "v3" : '<u2',
+                    "v4" : '<u2',
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'SET_MODE_MPPT': {
+            'what': 'Sets MPPT mode. 0-Hw, 1-manual, 2-auto, 3-auto w/ timeout',
+            'subPort': 4,
+            'inoutInfo': {
+                'args': {
+                    "Mode" : '<B'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'SET_AUTO_TIMEOUT_MPPT': {
+            'what': 'Sets MPPT auto timeout period',
+            'subPort': 5,
+            'inoutInfo': {
+                'args': {
+                    "Timeout" : '<u4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+
+        # BATTERY HEATER
+        'SET_HEATER_MODE': {
+            'what': 'Manual, or automatic. See docs for mode values', #TODO: Put the mode values here
+            'subPort': 6,
+            'inoutInfo': {
+                'args': {
+                    "Mode" : '<B'
+                },
+                'returns': {
+                    'status': '>b'
+                }
+            }
+        },
+        'SET_HEATER_STATE': {
+            'what': 'On, or off. Duration in seconds', #TODO: What number is on or off?
+            'subPort': 7,
+            'inoutInfo': {
+                'args': {
+                    "State" : '<B',
+                    "Duration" : '<u2'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,34 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/csp.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("EPS", "OBC"),
+    'port': 1,
+    'subservice': {
+        'PING': {
+            'what': "Do a CSP ping",
+            'subPort': 0,
+            'inoutInfo':{
+                'args': None,
+                'returns': {
+                    'err': '<b'
+                },
+            },
+        },
+    },
+}
@@ -0,0 +1,78 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/dfgm.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 19,
+    'subservice': {
+        'DFGM_RUN': {
+            'what': 'Record DFGM data for specified number of seconds.',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': {
+                    "Seconds" : '>u4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'DFGM_START': {
+            'what': 'Start recording DFGM data',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'DFGM_STOP': {
+            'what': 'Stop recording DFGM data.',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'DFGM_GET_HK': {
+            'subPort': 3,
+            'inoutInfo': {
+                'what': 'Fetch housekeeping data for the DFGM payload.',
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Core Voltage': '>u2',
+                    'Sensor Temperature': '>u2',
+                    'Reference Temperature': '>u2',
+                    'Board Temperature': '>u2',
+                    'Positive Rail Voltage': '>u2',
+                    'Input Voltage': '>u2',
+                    'Reference Voltage': '>u2',
+                    'Input Current': '>u2',
+                    'Reserved 1': '>u2',
+                    'Reserved 2': '>u2',
+                    'Reserved 3': '>u2',
+                    'Reserved 4': '>u2',
+                }
+            }
+        }
+    }
+}
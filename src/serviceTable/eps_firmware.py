@@ -0,0 +1,201 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/eps_firmware.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("EPS",),
+    'port': 11,
+    'subservice' : {
+        'START': {
+            'What': "Start new update process. New update descriptor is recorded into non-volatile memory. Set fromGoldenStorage to true if forcing to install from the golden image storage, otherwise always equal to false.",
+            'subPort': 0,
+            'inoutInfo': {
+                'args': {
+                    "ImageType" : '<u1',
+                    "TargetMcuUid0" : "<u4",
+                    "TargetMcuUid1" : "<u4",
+                    "TargetMcuUid2" : "<u4",
+                    "ImageSize" : "<u4",
+                    "fromGoldenStorage" : "<b"
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        "START_FROM_GOLDEN": {
+            'What': "Start new update process from the existing golden image expecting imageType to be installed. If expected image type does not match existing golden image - error is returned. Golden image and its descriptor must exist in the file system to be successful.",
+            'subPort': 1,
+            'inoutInfo': {
+                'args' : {
+                    "ImageType" : "<b"
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        "ABORT": {
+            'What' : "Abort current update procedure. It deletes the current update descriptor from non-volatile memory.",
+            'subPort': 2,
+            'inoutInfo': {
+                'args' : None,
+                'returns' : {
+                    'err': '>b'
+                }
+            }
+        },
+        "INSTALL": {
+            'What': "Execute installation procedure.",
+            'subPort': 3,
+            'inoutInfo': {
+                'args' : None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        "GET_SYSTEM_INFO": {
+            'What': "Get system information including unique subsystem ID and versions of each image.",
+            'subPort': 4,
+            'inoutInfo': {
+                'args' : None,
+                'returns': {
+                    'err': '<b',
+                    'imageType': '<b',
+                    'mcuUid0': "<u4",
+                    'mcuUid1': "<u4",
+                    'mcuUid2': "<u4",
+                    'versionOfBootloaderL1Major' : '<u2',
+                    'versionOfBootloaderL1Minor' : '<u2',
+                    'versionOfBootloaderL1Patch' : '<u2',
+                    'versionOfBootloaderL2Major' : '<u2',
+                    'versionOfBootloaderL2Minor' : '<u2',
+                    'versionOfBootloaderL2Patch' : '<u2',
+                    'versionOfApplicationL1Major' : '<u2',
+                    'versionOfApplicationL1Minor' : '<u2',
+                    'versionOfApplicationPatch' : '<u2',
+                    'repNameBL1' : 'V32',
+                    'gitHashBL1': 'V20',
+                    'repNameBL2': 'V32',
+                    'gitHashBL2': 'V20',
+                    'repNameAPP': 'V32',
+                    'gitHashAPP': 'V20'
+
+                }
+            }
+        },
+        "GET_CURRENT_STATE": {
+            'What': "Return the current state of the ongoing update process.",
+            'subPort' : 5,
+            'inoutInfo' : {
+                'args': None,
+                'returns' : {
+                    'err': '<b',
+                    'state': '<b'
+                }
+            }
+        },
+        "GET_CURRENT_UPDATE_DESCRIPTOR": {
+            'What': "Return the descriptor of current update process, which includes information about what type of update is performed.",
+            'subPort' : 6,
+            'inoutInfo' : {
+                'args': None,
+                'returns' : {
+                    'err': '<b',
+                    'imageType': '<b',
+                    "TargetMcuUid0" : "<u4",
+                    "TargetMcuUid1" : "<u4",
+                    "TargetMcuUid2" : "<u4",
+                    "ImageSize" : "<u4",
+                    "fromGoldenStorage" : "<b"
+                }
+            }
+        },
+        "GET_GOLDEN_UPDATE_DESCRIPTOR": {
+            'What': "Return the update descriptor of the golden image.",
+            'subPort' : 7,
+            'inoutInfo' : {
+                'args': None,
+                'returns' : {
+                    'err': '<b',
+                    'imageType': '<b',
+                    "TargetMcuUid0" : "<u4",
+                    "TargetMcuUid1" : "<u4",
+                    "TargetMcuUid2" : "<u4",
+                    "ImageSize" : "<u4",
+                    "fromGoldenStorage" : "<b"
+                }
+            }
+        },
+        "VALIDATE_SIGNATURE": {
+            'What': "Perform image integrity check by checking for valid signature. Image size and CRC32 value is returned as a result. In case of invalid image signature, error invalidSignature is returned.",
+            'subPort': 8,
+            'inoutInfo': {
+                'args': {
+                    'imageType': '<b'
+                },
+                'returns': {
+                    'err': '<b',
+                    'size': '<u4',
+                    'crc': '<u4'
+                }
+            }
+        },
+        "ABORT_BOOT": {
+            'What': "Abort boot process. Supported only in the bootloader L2 context.",
+            'subPort': 9,
+            'inoutInfo': {
+                'args' : None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        "GET_GOLDEN_INFO": {
+            'What': "Checks if golden image is present and is valid. Returns information of golden image.",
+            'subPort': 10,
+            'inoutInfo': {
+                'args' : None,
+                'returns': {
+                    'err': '<b',
+                    'imageType': '<b',
+                    'versionMajor': "<u2",
+                    'versionMinor': "<u2",
+                    'versionPatch': "<u2",
+                    'crc': "<u4",
+                    'repName': 'V32',
+                    'gitHash': 'V20'
+
+                }
+            }
+        },
+        "SET_SIGNATURE_CHECKING": {
+            'What': "Enables or disables signature checking which allows updating firmware with different signature. Set state is kept until reboot. Recommended update sequence: bootloader L1, bootloader L2, application. By default signature checking is enabled. Enable: 1 - enable, 0 - disable. Magic: 0x862A7E01",
+            'subPort': 11,
+            'inoutInfo': {
+                'args': {
+                    'enable': '<b',
+                    'magicKey': '<u4'
+                },
+                'returns': {
+                    'err': '<b'
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,36 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/eps_reset.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("EPS",),
+    'port': 15,  # As per EPS docs
+    'subservice': {
+        'EPS_HARD_RESET': {
+            'what': 'Does a hard reset on EPS (Resets the config) Not recommended to use by the operator. Key value is 17767',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': {
+                    "Key" : '<u2'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+    }
+}
@@ -0,0 +1,76 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/ftp_command.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 20,
+    'subservice': {
+        'GET_FILE_SIZE': {
+            'subPort': 0,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'size': '>u8',
+                }
+            }
+        },
+        'REQUEST_BURST_DOWNLOAD': {
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'mtime': '>u4',
+                    'ctime': '>u4',
+                }
+            }
+        },
+        'FTP_DATA_PACKET': {
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'req_id': '>u4',
+                    'size': '>u4',
+                    'blocknum': '>u2',
+                    'data': 'var'
+                }
+            }
+        },
+        'FTP_START_UPLOAD': {
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'FTP_UPLOAD_PACKET': {
+            'subPort': 4,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+    }
+}
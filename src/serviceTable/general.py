@@ -0,0 +1,228 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/general.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port' : 11,
+    'subservice' : {
+        'REBOOT': {
+            'What': "Command OBC to reboot to a given more, B, A, or G for bootloader, application, or golden image respectively",
+            'subPort': 0,
+            'inoutInfo': {
+                'args': {
+                    "Mode" : '>B'
+                },
+                'returns': {
+                    'err': '>b'  # err
+                }
+            }
+        },
+        'DEPLOY_DEPLOYABLES': {
+            'what': 'Trigger burnwire. DFGM=0, UHF_P=1, UHF_Z=2, UHF_S=3, UHF_N=4. Solar panels: Port=5, Payload=6, Starboard=7. Returns instantaneous current consumption',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': {
+                    "Wire" : '>B'
+                },
+                'returns': {
+                    'err': '>b',  # switch status 
+                }
+            }
+        },
+        'GET_SWITCH_STATUS': {
+        'what': 'Query the status of all deployment switches. Returns 1 = Deployed, 0 = Undeployed',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',  # err status
+                    'switch_DFGM' : '>b',
+                    'switch_UHF_P' : '>b',
+                    'switch_UHF_Z' : '>b',
+                    'switch_UHF_S' : '>b',
+                    'switch_UHF_N' : '>b',
+                    'switch_Port' : '>b',
+                    'switch_Payload' : '>b',
+                    'switch_Starboard' : '>b'
+                }
+            }
+        },
+        'GET_UHF_WATCHDOG_TIMEOUT': {
+            'what': 'Get the period (in ticks) of the UHF watchdog timer on the OBC',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',  # err status
+                    'timeout_ms': '>u4'
+                }
+            }
+        },
+        'SET_UHF_WATCHDOG_TIMEOUT': {
+            'what': 'Set the period (in ms) of the UHF watchdog timer on the OBC',
+            'subPort': 4,
+            'inoutInfo': {
+                'args': {
+                    "Period" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',  # err status
+                }
+            }
+        },
+        'GET_SBAND_WATCHDOG_TIMEOUT': {
+            'what': 'Get the period (in ticks) of the S-band watchdog timer on the OBC',
+            'subPort': 5,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',  # err status
+                    'timeout_ms': '>u4'
+                }
+            }
+        },
+        'SET_SBAND_WATCHDOG_TIMEOUT': {
+            'what': 'Set the period (in ms) of the S-band watchdog timer on the OBC',
+            'subPort': 6,
+            'inoutInfo': {
+                'args': {
+                    "Period" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',  # err status
+                }
+            }
+        },
+        'GET_CHARON_WATCHDOG_TIMEOUT': {
+            'what': 'Get the period (in ticks) of the Charon watchdog timer on the OBC',
+            'subPort': 7,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',  # err status
+                    'timeout_ms': '>u4'
+                }
+            }
+        },
+        'SET_CHARON_WATCHDOG_TIMEOUT': {
+            'what': 'Set the period (in ms) of the Charon watchdog timer on the OBC.',
+            'subPort': 8,
+            'inoutInfo': {
+                'args': {
+                    "Period" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',  # err status
+                }
+            }
+        },
+        'GET_ADCS_WATCHDOG_TIMEOUT': {
+            'subPort': 9,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',  # err status
+                    'timeout_ms': '>u4'
+                }
+            }
+        },
+        'SET_ADCS_WATCHDOG_TIMEOUT': {
+            'subPort': 10,
+            'inoutInfo': {
+                'args': {
+                    "Period" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',  # err status
+                }
+            }
+        },
+        'GET_NS_PAYLOAD_WATCHDOG_TIMEOUT': {
+            'subPort': 12,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',  # err status
+                    'timeout_ms': '>u4'
+                }
+            }
+        },
+        'SET_NS_PAYLOAD_WATCHDOG_TIMEOUT': {
+            'subPort': 13,
+            'inoutInfo': {
+                'args': {
+                    "Period" : '>u4'
+                },
+                'returns': {
+                    'err': '>b',  # err status
+                }
+            }
+        },
+        'ENABLE_BEACON_TASK': {
+            'subPort': 14,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b', # err status
+                }
+            }
+        },
+        'DISABLE_BEACON_TASK': {
+            'subPort': 15,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b', # err status
+                }
+            }
+        },
+        'BEACON_TASK_GET_STATE': {
+            'subPort': 16,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b', # err status
+                    'state': '>?'
+                }
+            }
+        },
+        'GET_SOLAR_SWITCH_STATUS': {
+            'what': "Gets the status of the switch connected to the power of the solar panel currentsense ICs",
+            'subPort': 17,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b', # err status
+                    'state': '>b'
+                }
+            }
+        },
+        'SET_SOLAR_SWITCH': {
+            'what': "Turn the solar panel currentsense ICs on or off",
+            'subPort': 18,
+            'inoutInfo': {
+                'args': {
+                    'state' : '>b'
+                },
+                'returns': {
+                    'err': '>b', # err status
+                }
+            }
+        },
+    }
+}
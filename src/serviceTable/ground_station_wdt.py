@@ -0,0 +1,70 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/ground_station_wdt.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("EPS",),
+    'port': 16,  # As per EPS docs
+    'subservice': {
+        'RESET_WDT': {
+            'what': 'Resets the ground station watchdog timer. See docs for key value',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': {
+                    "Key" : '<u2'
+                },
+                'returns': {
+                    'err': '>B'
+                }
+            }
+        },
+        'GET_WDT_REMAINING': {
+            'what': 'Gets GS watchdog time left in seconds',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B',
+                    'timeLeftInS': '<u4'
+                }
+            }
+        },
+        'CLEAR_WDT_RESET_MARK': {
+            'what': 'Clears GS watchdog reset mark. See docs for key value',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': {
+                    "Key" : '<u2'
+                },
+                'returns': {
+                    'err': '>B',
+                }
+            }
+        },
+        'CHECK_STARTUP_POST_RESET': {
+            'what': 'Checks if startup happened after GS watchdog reset',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>B',
+                    'startupAfterGsWdt': '?',
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,496 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/housekeeping.py
+ * @date 2026-10-18
+'''
+
+obc_housekeeping = {
+    'err': '>b',
+    # WARNING: Avoid duplicate names in the return items below!
+    #packet meta
+    '###############################\r\n'+
+    'packet meta\r\n'+
+    '###############################\r\n'+
+    'final': '<B',
+    'UNIXtimestamp': '>u4',
+    'dataPosition': '>u2',
+    #ADCS
+    '###############################\r\n'
+    'ADCS\r\n'+
+    '###############################\r\n'+
+    'Att_Estimate_Mode': '>B',
+    'Att_Control_Mode': '>B',
+    'Run_Mode': '>B',
+    'Flags_arr': '>V52',
+    'Longitude': '>f4',
+    'Latitude': '>f4',
+    'Altitude': '>f4',
+    'Estimated_Angular_Rate_X': '>f4',
+    'Estimated_Angular_Rate_Y': '>f4',
+    'Estimated_Angular_Rate_Z': '>f4',
+    'Estimated_Angular_Angle_X': '>f4',
+    'Estimated_Angular_Angle_Y': '>f4',
+    'Estimated_Angular_Angle_Z': '>f4',
+    'Sat_Position_ECI_X': '>f4',
+    'Sat_Position_ECI_Y': '>f4',
+    'Sat_Position_ECI_Z': '>f4',
+    'Sat_Velocity_ECI_X': '>f4',
+    'Sat_Velocity_ECI_Y': '>f4',
+    'Sat_Velocity_ECI_Z': '>f4',
+    'Sat_Position_LLH_X': '>f4',
+    'Sat_Position_LLH_Y': '>f4',
+    'Sat_Position_LLH_Z': '>f4',
+    'ECEF_Position_X': '>i2',
+    'ECEF_Position_Y': '>i2',
+    'ECEF_Position_Z': '>i2',
+    'Coarse_Sun_Vector_X': '>f4',
+    'Coarse_Sun_Vector_Y': '>f4',
+    'Coarse_Sun_Vector_Z': '>f4',
+    'Fine_Sun_Vector_X': '>f4',
+    'Fine_Sun_Vector_Y': '>f4',
+    'Fine_Sun_Vector_Z': '>f4',
+    'Nadir_Vector_X': '>f4',
+    'Nadir_Vector_Y': '>f4',
+    'Nadir_Vector_Z': '>f4',
+    'Wheel_Speed_X': '>f4',
+    'Wheel_Speed_Y': '>f4',
+    'Wheel_Speed_Z': '>f4',
+    'Mag_Field_Vector_X': '>f4',
+    'Mag_Field_Vector_Y': '>f4',
+    'Mag_Field_Vector_Z': '>f4',
+    'TC_num': '>i2',
+    'TM_num': '>i2',
+    'CommsStat_flags_1': '<B',
+    'CommsStat_flags_2': '<B',
+    'CommsStat_flags_3': '<B',
+    'CommsStat_flags_4': '<B',
+    'CommsStat_flags_5': '<B',
+    'CommsStat_flags_6': '<B',
+    'Wheel1_Current': '>f4',
+    'Wheel2_Current': '>f4',
+    'Wheel3_Current': '>f4',
+    'CubeSense1_Current': '>f4',
+    'CubeSense2_Current': '>f4',
+    'CubeControl_Current3v3': '>f4',
+    'CubeControl_Current5v0': '>f4',
+    'CubeStar_Current': '>f4',
+    'CubeStar_Temp': '>f4',
+    'Magnetorquer_Current': '>f4',
+    'MCU_Temp': '>f4',
+    'Rate_Sensor_Temp_X': '>i2',
+    'Rate_Sensor_Temp_Y': '>i2',
+    'Rate_Sensor_Temp_Z': '>i2',
+    #Athena
+    '###############################\r\n'
+    'Athena\r\n'+
+    '###############################\r\n'+
+    'software_ver_major':'>u2',
+    'software_ver_minor':'>u2',
+    'software_ver_patch':'>u2',
+    'MCU_core_temp': '>i2',
+    'converter_temp': '>i2',
+    'OBC_uptime': '>u4',
+    'vol0_usage_percent': '>u1',
+    'vol1_usage_percent': '>u1',
+    'boot_cnt': '>u2',
+    'boot_src': '>u2',
+    'last_reset_reason': '<B',
+    'solar_panel_supply_curr': '>u2',
+    'cmds_received': '>u2',
+    'heap_free' : '>u4',
+    'lowest_heap_free': '>u4', 
+
+    #EPS (when fetched via hk, these values are BE)
+    '###############################\r\n'
+    'EPS\r\n'+
+    '###############################\r\n'+
+    'eps_cmd_hk': '<B',
+    'eps_status_hk' : '<b',
+    'eps_timestamp_hk': '>f8',
+    'eps_uptimeInS_hk': '>u4',
+    'eps_bootCnt_hk': '>u4',
+    'wdt_gs_time_left_s': '>u4',
+    'wdt_gs_counter': '>u4',
+    'mpptConverterVoltage1_mV': '>u2',
+    'mpptConverterVoltage2_mV': '>u2',
+    'mpptConverterVoltage3_mV': '>u2',
+    'mpptConverterVoltage4_mV': '>u2',
+    'curSolarPanels1_mA': '>u2',
+    'curSolarPanels2_mA': '>u2',
+    'curSolarPanels3_mA': '>u2',
+    'curSolarPanels4_mA': '>u2',
+    'curSolarPanels5_mA': '>u2',
+    'curSolarPanels6_mA': '>u2',
+    'curSolarPanels7_mA': '>u2',
+    'curSolarPanels8_mA': '>u2',
+    'vBatt_mV': '>u2',
+    'curSolar_mA': '>u2',
+    'curBattIn_mA': '>u2',
+    'curBattOut_mA': '>u2',
+    'curOutput1_mA': '>u2',
+    'curOutput2_mA': '>u2',
+    'curOutput3_mA': '>u2',
+    'curOutput4_mA': '>u2',
+    'curOutput5_mA': '>u2',
+    'curOutput6_mA': '>u2',
+    'curOutput7_mA': '>u2',
+    'curOutput8_mA': '>u2',
+    'curOutput9_mA': '>u2',
+    'curOutput10_mA': '>u2',
+    'curOutput11_mA': '>u2',
+    'curOutput12_mA': '>u2',
+    'curOutput13_mA': '>u2',
+    'curOutput14_mA': '>u2',
+    'curOutput15_mA': '>u2',
+    'curOutput16_mA': '>u2',
+    'curOutput17_mA': '>u2',
+    'curOutput18_mA': '>u2',
+    'AOcurOutput1_mA': '>u2',
+    'AOcurOutput2_mA': '>u2',
+    'outputConverterVoltage1': '>u2',
+    'outputConverterVoltage2': '>u2',
+    'outputConverterVoltage3': '>u2',
+    'outputConverterVoltage4': '>u2',
+    'outputConverterVoltage5': '>u2',
+    'outputConverterVoltage6': '>u2',
+    'outputConverterVoltage7': '>u2',
+    'outputConverterVoltage8': '>u2',
+    'outputConverterState': '<B',  # 4 bits!
+    'outputStatus': '>u4',
+    'outputFaultStatus': '>u4',
+    'protectedOutputAccessCnt': '>u2',
+    'outputOnDelta1': '>u2',
+    'outputOnDelta2': '>u2',
+    'outputOnDelta3': '>u2',
+    'outputOnDelta4': '>u2',
+    'outputOnDelta5': '>u2',
+    'outputOnDelta6': '>u2',
+    'outputOnDelta7': '>u2',
+    'outputOnDelta8': '>u2',
+    'outputOnDelta9': '>u2',
+    'outputOnDelta10': '>u2',
+    'outputOnDelta11': '>u2',
+    'outputOnDelta12': '>u2',
+    'outputOnDelta13': '>u2',
+    'outputOnDelta14': '>u2',
+    'outputOnDelta15': '>u2',
+    'outputOnDelta16': '>u2',
+    'outputOnDelta17': '>u2',
+    'outputOnDelta18': '>u2',
+    'outputOffDelta1': '>u2',
+    'outputOffDelta2': '>u2',
+    'outputOffDelta3': '>u2',
+    'outputOffDelta4': '>u2',
+    'outputOffDelta5': '>u2',
+    'outputOffDelta6': '>u2',
+    'outputOffDelta7': '>u2',
+    'outputOffDelta8': '>u2',
+    'outputOffDelta9': '>u2',
+    'outputOffDelta10': '>u2',
+    'outputOffDelta11': '>u2',
+    'outputOffDelta12': '>u2',
+    'outputOffDelta13': '>u2',
+    'outputOffDelta14': '>u2',
+    'outputOffDelta15': '>u2',
+    'outputOffDelta16': '>u2',
+    'outputOffDelta17': '>u2',
+    'outputOffDelta18': '>u2',
+    'outputFaultCount1': '<B',
+    'outputFaultCount2': '<B',
+    'outputFaultCount3': '<B',
+    'outputFaultCount4': '<B',
+    'outputFaultCount5': '<B',
+    'outputFaultCount6': '<B',
+    'outputFaultCount7': '<B',
+    'outputFaultCount8': '<B',
+    'outputFaultCount9': '<B',
+    'outputFaultCount10': '<B',
+    'outputFaultCount11': '<B',
+    'outputFaultCount12': '<B',
+    'outputFaultCount13': '<B',
+    'outputFaultCount14': '<B',
+    'outputFaultCount15': '<B',
+    'outputFaultCount16': '<B',
+    'outputFaultCount17': '<B',
+    'outputFaultCount18': '<B',
+    'temp1_c': '<b',
+    'temp2_c': '<b',
+    'temp3_c': '<b',
+    'temp4_c': '<b',
+    'temp5_c': '<b',
+    'temp6_c': '<b',
+    'temp7_c': '<b',
+    'temp8_c': '<b',
+    'temp9_c': '<b',
+    'temp10_c': '<b',
+    'temp11_c': '<b',
+    'temp12_c': '<b',
+    'temp13_c': '<b',
+    'temp14_c': '<b',
+    'battMode': '<B',
+    'mpptMode': '<B',
+    'battHeaterMode': '<B',
+    'battHeaterState': '<B',
+    'PingWdt_toggles': '>u2',
+    'PingWdt_turnOffs': '<B',
+    'thermalProtTemperature_1': '>b',
+    'thermalProtTemperature_2': '>b',
+    'thermalProtTemperature_3': '>b',
+    'thermalProtTemperature_4': '>b',
+    'thermalProtTemperature_5': '>b',
+    'thermalProtTemperature_6': '>b',
+    'thermalProtTemperature_7': '>b',
+    'thermalProtTemperature_8': '>b',
+    '###############################\r\n'
+    'EPS STARTUP\r\n'+
+    '###############################\r\n'+
+    'eps_cmd_startup': '<B',
+    'eps_status_startup': '<b',
+    'eps_timestamp_startup': '>f8',
+    'last_reset_reason_reg': '>u4',
+    'eps_bootCnt_startup': '>u4',
+    'FallbackConfigUsed': '<B',
+    'rtcInit': '<B',
+    'rtcClkSourceLSE': '>B',
+    'flashAppInit': '>B',
+    'Fram4kPartitionInit': '>b',
+    'Fram520kPartitionInit': '>b',
+    'intFlashPartitionInit': '>b',
+    'fwUpdInit': '>B',
+    'FSInit': '>b',
+    'FTInit': '>b',
+    'supervisorInit': '>b',
+    'uart1App': '>B',
+    'uart2App': '>B',
+    'tmp107Init': '>b',
+    #UHF
+    '###############################\r\n'
+    'UHF\r\n'+
+    '###############################\r\n'+
+    'scw1': '<B',
+    'scw2': '<B',
+    'scw3': '<B',
+    'scw4': '<B',
+    'scw5': '<B',
+    'scw6': '<B',
+    'scw7': '<B',
+    'scw8': '<B',
+    'scw9': '<B',
+    'scw10': '<B',
+    'scw11': '<B',
+    'scw12': '<B',
+    'U_frequency': '>u4',
+    'pipe_t': '>u4',
+    'beacon_t': '>u4',
+    'audio_t': '>u4',
+    'uptime': '>u4',
+    'pckts_out': '>u4',
+    'pckts_in': '>u4',
+    'pckts_in_crc16': '>u4',
+    'temperature': '>f4',
+    #Sband
+    '###############################\r\n'
+    'Sband\r\n'+
+    '###############################\r\n'+
+    'S_mode': '>B',
+    'PA_status': '>B',
+    'S_frequency_Hz': '>u4',
+    'S_scrambler': '>B',
+    'S_filter': '>B',
+    'S_modulation': '>B',
+    'S_data_rate': '>B',
+    'S_bit_order': '>B',
+    'S_PWRGD': '>B',
+    'S_TXL': '>B',
+    'Output_Power': '>B',
+    'PA_Temp': '>b',
+    'Top_Temp': '>b',
+    'Bottom_Temp': '>b',
+    'Bat_Current_mA': '>u2',
+    'Bat_Voltage_mV': '>u2',
+    'PA_Current_mA': '>u2',
+    'PA_Voltage_mV': '>u2',
+    #Hyperion
+    '###############################\r\n'
+    'Hyperion Panels\r\n'+
+    '###############################\r\n'+
+    'Nadir_Temp1': '>b',
+    'Nadir_Temp_Adc': '>b',
+    'Port_Temp1': '>b',
+    'Port_Temp2': '>b',
+    'Port_Temp3': '>b',
+    'Port_Temp_Adc': '>b',
+    'Port_Dep_Temp1': '>b',
+    'Port_Dep_Temp2': '>b',
+    'Port_Dep_Temp3': '>b',
+    'Port_Dep_Temp_Adc': '>b',
+    'Star_Temp1': '>b',
+    'Star_Temp2': '>b',
+    'Star_Temp3': '>b',
+    'Star_Temp_Adc': '>b',
+    'Star_Dep_Temp1': '>b',
+    'Star_Dep_Temp2': '>b',
+    'Star_Dep_Temp3': '>b',
+    'Star_Dep_Temp_Adc': '>b',
+    'Zenith_Temp1': '>b',
+    'Zenith_Temp2': '>b',
+    'Zenith_Temp3': '>b',
+    'Zenith_Temp_Adc': '>b',
+    'Nadir_Pd1': '>B',
+    'Port_Pd1': '>B',
+    'Port_Pd2': '>B',
+    'Port_Pd3': '>B',
+    'Port_Dep_Pd1': '>B',
+    'Port_Dep_Pd2': '>B',
+    'Port_Dep_Pd3': '>B',
+    'Star_Pd1': '>B',
+    'Star_Pd2': '>B',
+    'Star_Pd3': '>B',
+    'Star_Dep_Pd1': '>B',
+    'Star_Dep_Pd2': '>B',
+    'Star_Dep_Pd3': '>B',
+    'Zenith_Pd1': '>B',
+    'Zenith_Pd2': '>B',
+    'Zenith_Pd3': '>B',
+    'Port_Voltage' : '>u2',
+    'Port_Dep_Voltage' : '>u2',
+    'Star_Voltage' : '>u2',
+    'Star_Dep_Voltage' : '>u2',
+    'Zenith_Voltage' : '>u2',
+    'Port_Current' : '>u2',
+    'Port_Dep_Current' : '>u2',
+    'Star_Current' : '>u2',
+    'Star_Dep_Current' : '>u2',
+    'Zenith_Current' : '>u2',
+    #Charon
+    '###############################\r\n'
+    'Charon Interfacing Board\r\n'+
+    '###############################\r\n'+
+    'gps_crc' : '>u2',
+    'charon_temp1' : '>b',
+    'charon_temp2' : '>b',
+    'charon_temp3' : '>b',
+    'charon_temp4' : '>b',
+    'charon_temp5' : '>b',
+    'charon_temp6' : '>b',
+    'charon_temp7' : '>b',
+    'charon_temp8' : '>b',
+    #DFGM
+    '###############################\r\n'
+    'DFGM Board\r\n'+
+    '###############################\r\n'+
+    'Core_Voltage': '>u2',
+    'Sensor_Temperature': '>u2',
+    'Reference_Temperature': '>u2',
+    'Board_Temperature': '>u2',
+    'Positive_Rail_Voltage': '>u2',
+    'Input_Voltage': '>u2',
+    'Reference_Voltage': '>u2',
+    'Input_Current': '>u2',
+    'Reserved_1': '>u2',
+    'Reserved_2': '>u2',
+    'Reserved_3': '>u2',
+    'Reserved_4': '>u2',
+    #Northern SPIRIT Payloads
+    '###############################\r\n'
+    'Northern SPIRIT\r\n'+
+    '###############################\r\n'+
+    'ns_temp0': '>i2',
+    'ns_temp1': '>i2',
+    'ns_temp2': '>i2',
+    'ns_temp3': '>i2',
+    'eNIM0_lux': '>i2',
+    'eNIM1_lux': '>i2',
+    'eNIM2_lux': '>i2',
+    'eNIM3_lux': '>i2',
+    'ram_avail': '>i2',
+    'lowest_img_num': '>i2',
+    'first_blank_img_num': '>i2',
+    #IRIS
+    '###############################\r\n'
+    'Iris Board\r\n'+
+    '###############################\r\n'+
+    'VIS_Temperature': '>f4',
+    'NIR_Temperature': '>f4',
+    'Flash_Temperature': '>f4',
+    'Gate_Temperature': '>f4',
+    'Image_number': '>u1',
+    'Software_Version': '>u1',
+    'Error_number': '>u1',
+    'MAX_5V_voltage': '>u2',
+    'MAX_5V_power': '>u2',
+    'MAX_3V_voltage': '>u2',
+    'MAX_3V_power': '>u2',
+    'MIN_5V_voltage': '>u2',
+    'MIN_3V_voltage': '>u2',
+}
+
+service = {
+    'supports' : ("OBC",),
+    'port': 17,
+    'subservice': {
+        'GET_HK': {
+            'what': 'Fetch system-wide housekeeping. Input: limit, before_id, before_time',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': {
+                    "Limit" : '>u2',
+                    "Before_id" : '>u2',
+                    "Before_time" : '>u4'
+                },
+                'returns' : obc_housekeeping
+            }
+        },
+        'SET_MAX_FILES': {
+            'what': 'Set max number of hk entries to store',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': {
+                    "Max" : '<u2'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'GET_MAX_FILES': {
+            'what': 'Get max number of hk entries to store',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'max': '>u2'
+                }
+            }
+        },
+        'GET_INSTANT_HK': {
+            'what': 'Fetch system-wide housekeeping right now',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': obc_housekeeping
+            }
+        },
+        'GET_LATEST_HK': {
+            'what' : "Fetch latest system-wide housekeeping",
+            'subPort': 4,
+            'inoutInfo': {
+                'args': None,
+                'returns': obc_housekeeping
+            }
+        }
+    }
+}
@@ -0,0 +1,148 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/iris.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 23,
+    'subservice': {
+        'IRIS_POWER_ON': {
+            'what': "Send command to OBC to tell EPS to turn on power",
+            'subPort': 0,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'IRIS_POWER_OFF': {
+            'what': "Send command to OBC to tell EPS to turn off power",
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'IRIS_TURN_SENSORS_ON': {
+            'what': "Send command to OBC to tell Iris to turn on image sensors",
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'IRIS_TURN_SENSORS_OFF': {
+            'what': "Send command to OBC to tell Iris to turn off image sensors",
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'IRIS_TAKE_IMAGE': {
+            'what': "Tell Iris to take a picture",
+            'subPort': 4,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'IRIS_DELIVER_IMAGE': {
+            'what': "Tell OBC to perform image transfer from Iris and store those images into SD card",
+            'subPort': 5,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'IRIS_COUNT_IMAGES': {
+            'what': "Tell Iris to send number of images stored in SD card",
+            'subPort': 6,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'IRIS_PROGRAM_FLASH': {
+            'what': "Tell OBC to start programming Iris using provided binary file on the SD card",
+            'subPort': 7,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'Number of Images': '>u',
+                }
+            }
+        },
+        'IRIS_GET_HK': {
+            'what': "Tell Iris to send housekeeping data",
+            'subPort': 8,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'VIS_Temperature': '>f4',
+                    'NIR_Temperature': '>f4',
+                    'Flash_Temperature': '>f4',
+                    'Gate_Temperature': '>f4',
+                    'Image_number': '>u1',
+                    'Software_Version': '>u1',
+                    'Error_number': '>u1',
+                    'MAX_5V_voltage': '>u2',
+                    'MAX_5V_power': '>u2',
+                    'MAX_3V_voltage': '>u2',
+                    'MAX_3V_power': '>u2',
+                    'MIN_5V_voltage': '>u2',
+                    'MIN_3V_voltage': '>u2',
+                }
+            }
+        },
+        'IRIS_DELIVER_LOG': {
+            'what': "Tell OBC to perform log transfer from Iris and store it into SD card",
+            'subPort': 9,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'IRIS_SET_TIME': {
+            'what': "Initialize Iris RTC from ground station via OBC",
+            'subPort': 10,
+            'inoutInfo': {
+                'args': {"new_iris_time": '>u4'},
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        }
+    },
+}
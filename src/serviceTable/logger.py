@@ -0,0 +1,69 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/logger.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 13,
+    'subservice': {
+        'GET_FILE': {
+            'what': 'Get contents of log file',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'log': '>S500',
+                }
+            }
+        },
+        'GET_OLD_FILE': {
+            'what': 'Get contents of old log file',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'log': '>S500',
+                }
+            }
+        },
+        'SET_FILE_SIZE': {
+            'what': 'Set the size of the logger files.',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': {
+                    "Size" : '>u4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'GET_FILE_SIZE': {
+            'what': 'Get the size of the logger files.',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'size': '>u4'
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,181 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/ns_payload.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 22,
+    'subservice': {
+        'UPLOAD_ARTWORK': {
+            'what': 'Send artwork from the OBC to the payload. Input: file name, limited to 7 chars!',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': {
+                    "FIlename" : '>S10'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'CAPTURE_IMAGE': {
+            'what': 'Tell the payload to display artwork and capture an image.',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'confirmation_err': '>B'
+                }
+            }
+        },
+        'CONFIRM_DOWNLINK': {
+            'what': 'Let the payload know that the last image it took was received by the ground and can be deleted.',
+            'subPort': 2,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+
+        'GET_HEARTBEAT': {
+            'what': 'Receive a ping (char h) from the payload',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'heartbeat': '>S1'
+                }
+            }
+        },
+        'GET_FLAG': {
+            'what': 'Get the status of a payload flag. Input: flag/subcode decimal value. flag/subcode BYTE! Do not use a char',
+            'subPort': 4,
+            'inoutInfo': {
+                'args': {
+                    "Flag" : '>B'
+                },
+                'returns': {
+                    'err': '>b',
+                    'flag_stat': '>B'
+                }
+            }
+        },
+        'GET_FILENAME': {
+            'what': 'Get a desired image/artwork file name. Input: subcode demimal value. subcode BYTE! Do not use a char',
+            'subPort': 5,
+            'inoutInfo': {
+                'args': {
+                    "Subcode" : '>B'
+                },
+                'returns': {
+                    'err': '>b',
+                    'filename': '>S11'
+                }
+            }
+        },
+        'GET_TELEMETRY': {
+            'what': 'Get telemetry data from the payload',
+            'subPort': 6,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'temp0': '>i2',
+                    'temp1': '>i2',
+                    'temp2': '>i2',
+                    'temp3': '>i2',
+                    'eNIM0_lux': '>i2',
+                    'eNIM1_lux': '>i2',
+                    'eNIM2_lux': '>i2',
+                    'eNIM3_lux': '>i2',
+                    'ram_avail': '>i2',
+                    'lowest_img_num': '>i2',
+                    'first_blank_img_num': '>i2'
+                }
+            }
+        },
+        'GET_SW_VERSION': {
+            'what': 'Get payload software version.',
+            'subPort': 7,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'version': '>S7'
+                }
+            }
+        },
+        'DOWNLOAD_IMAGE': {
+            'what': 'Download payload image to OBC',
+            'subPort': 8,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        }, 
+        'CLEAR_SD_CARD': {
+            'what': 'Clear NIM\'s sd card',
+            'subPort': 9,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'RESET_MCU': {
+            'what': 'Reset NIM\'s MCU',
+            'subPort': 10,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'NV_START': {
+            'what': 'Start transmitting voice data from filename. Blocksize should be a multiple of the blocksize of the codec and reasonably large (max 512)',
+            'subPort': 11,
+            'inoutInfo': {
+                'args': {
+                    "Repeats": '>u2',
+                    "Blocksize": '>u2',
+                    "Filename" : '>S128'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+        'NV_STOP': {
+            'what': 'Stop transmitting voice data',
+            'subPort': 12,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        },
+    },
+}
@@ -0,0 +1,39 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/reboot.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("EPS",),
+    'port': 4,  # As per EPS CSP docs
+    # EPS soft reset
+    # no subPort (command ID) needed.
+    'subservice':{
+        'SOFT': {
+            'what': 'Does a soft reset on EPS (reboot) Not recommended to use by the operator. Key value is 491527 or 2147975175',
+            'subPort': 128,
+            'inoutInfo': {
+                'args': {
+                    "Key" : '<u4'
+                },
+                'returns': {
+                    'err': '>b',
+                }
+            }
+        }
+    }
+    # magic number 0x80078007 must be sent with csp port 4 and no subPort number
+}
@@ -0,0 +1,59 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/scheduler.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 25,
+    # TODO: these need a error response value
+    'subservice': {
+        'SET_SCHEDULE': {
+            'what': 'Returns 0 and number of cmds left in the schedule on success. Refer for schedule.h for calloc error code. Refer to rederrno.h for reliance edge error codes',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': None,  # All scheduled commands should be stored in schedule.txt
+                'returns': {
+                    'err': '>b',
+                    'count': '>b'  # Returns -1 if an error occurred.
+                }
+            }
+        },
+        'DELETE_SCHEDULE': {
+            'what': 'Returns 0 on success. Refer for schedule.h for calloc error code. Refer to rederrno.h for reliance edge error codes',
+            'subPort': 3,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'red_errno': '>b'  # RED errno if I/O error occurred
+                }
+            }
+        },
+        'GET_SCHEDULE': {
+            'what': 'Returns 0 and number of cmds left in the schedule on success. Refer for schedule.h for calloc error code. Refer to rederrno.h for reliance edge error codes',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'count': '>b',
+                    'cmds': 'var'
+                }
+            }
+        },
+    }
+}
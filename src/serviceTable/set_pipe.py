@@ -0,0 +1,35 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/set_pipe.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports': ("OBC",),
+    'port': 0,
+    'subservice' : {
+        'UHF_GS_PIPE': {
+            'what': 'Testing function to put an EndurSat radio being used as the ground station radio into PIPE mode',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': None,  # test
+                'returns': {
+                    'err': '>b'  # err
+                }
+            }
+        }
+    }
+
+}
@@ -0,0 +1,47 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/time_management.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 8,
+    'subservice': {
+        'GET_TIME': {
+            'what': 'Get the current unix time on the OBC',
+            'subPort': 10,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    'err': '>b',
+                    'timestamp': '>u4'
+                }
+            }
+        },
+        'SET_TIME': {
+        'what': 'Set the current unix time on the OBC. Set parameter to 0 to use local unix time',
+            'subPort': 11,
+            'inoutInfo': {
+                'args': {
+                    "Time" : '>u4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+    }
+}
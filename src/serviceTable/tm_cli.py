@@ -0,0 +1,206 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/tm_cli.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("EPS",),
+    'port': 7,  # EPS remote CLI uses port 13 unless Otherwise specified #TODO: Does 7 mean otherwise specified?
+    'subservice': {
+        'GENERAL_TELEMETRY': {
+            'what': 'Gets the general housekeeping telemetry data',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    # When fetched via eps CPS command, these values are LE
+                    'status': '>b',
+                    'timestamp': '<f8',
+                    'uptimeInS': '<u4',
+                    'bootCnt': '<u4',
+                    'gs_wdt_time_left_s': '<u4',
+                    'counter_wdt_gs': '<u4',
+                    'mpptConverterVoltage1_mV': '<u2',
+                    'mpptConverterVoltage2_mV': '<u2',
+                    'mpptConverterVoltage3_mV': '<u2',
+                    'mpptConverterVoltage4_mV': '<u2',
+                    'curSolarPanels1_mA': '<u2',
+                    'curSolarPanels2_mA': '<u2',
+                    'curSolarPanels3_mA': '<u2',
+                    'curSolarPanels4_mA': '<u2',
+                    'curSolarPanels5_mA': '<u2',
+                    'curSolarPanels6_mA': '<u2',
+                    'curSolarPanels7_mA': '<u2',
+                    'curSolarPanels8_mA': '<u2',
+                    'vBatt_mV': '<u2',
+                    'curSolar_mA': '<u2',
+                    'curBattIn_mA': '<u2',
+                    'curBattOut_mA': '<u2',
+                    'curOutput1_mA': '<u2',
+                    'curOutput2_mA': '<u2',
+                    'curOutput3_mA': '<u2',
+                    'curOutput4_mA': '<u2',
+                    'curOutput5_mA': '<u2',
+                    'curOutput6_mA': '<u2',
+                    'curOutput7_mA': '<u2',
+                    'curOutput8_mA': '<u2',
+                    'curOutput9_mA': '<u2',
+                    'curOutput10_mA': '<u2',
+                    'curOutput11_mA': '<u2',
+                    'curOutput12_mA': '<u2',
+                    'curOutput13_mA': '<u2',
+                    'curOutput14_mA': '<u2',
+                    'curOutput15_mA': '<u2',
+                    'curOutput16_mA': '<u2',
+                    'curOutput17_mA': '<u2',
+                    'curOutput18_mA': '<u2',
+                    'AOcurOutput1_mA': '<u2',
+                    'AOcurOutput2_mA': '<u2',
+                    'outputConverterVoltage1': '<u2',
+                    'outputConverterVoltage2': '<u2',
+                    'outputConverterVoltage3': '<u2',
+                    'outputConverterVoltage4': '<u2',
+                    'outputConverterVoltage5': '<u2',
+                    'outputConverterVoltage6': '<u2',
+                    'outputConverterVoltage7': '<u2',
+                    'outputConverterVoltage8': '<u2',
+                    'outputConverterState': '<B',  # 4 bits!
+                    'outputStatus': '<u4',
+                    'outputFaultStatus': '<u4',
+                    'protectedOutputAccessCnt': '<u2',
+                    'outputOnDelta1': '<u2',
+                    'outputOnDelta2': '<u2',
+                    'outputOnDelta3': '<u2',
+                    'outputOnDelta4': '<u2',
+                    'outputOnDelta5': '<u2',
+                    'outputOnDelta6': '<u2',
+                    'outputOnDelta7': '<u2',
+                    'outputOnDelta8': '<u2',
+                    'outputOnDelta9': '<u2',
+                    'outputOnDelta10': '<u2',
+                    'outputOnDelta11': '<u2',
+                    'outputOnDelta12': '<u2',
+                    'outputOnDelta13': '<u2',
+                    'outputOnDelta14': '<u2',
+                    'outputOnDelta15': '<u2',
+                    'outputOnDelta16': '<u2',
+                    'outputOnDelta17': '<u2',
+                    'outputOnDelta18': '<u2',
+                    'outputOffDelta1': '<u2',
+                    'outputOffDelta2': '<u2',
+                    'outputOffDelta3': '<u2',
+                    'outputOffDelta4': '<u2',
+                    'outputOffDelta5': '<u2',
+                    'outputOffDelta6': '<u2',
+                    'outputOffDelta7': '<u2',
+                    'outputOffDelta8': '<u2',
+                    'outputOffDelta9': '<u2',
+                    'outputOffDelta10': '<u2',
+                    'outputOffDelta11': '<u2',
+                    'outputOffDelta12': '<u2',
+                    'outputOffDelta13': '<u2',
+                    'outputOffDelta14': '<u2',
+                    'outputOffDelta15': '<u2',
+                    'outputOffDelta16': '<u2',
+                    'outputOffDelta17': '<u2',
+                    'outputOffDelta18': '<u2',
+                    'outputFaultCount1': '<B',
+                    'outputFaultCount2': '<B',
+                    'outputFaultCount3': '<B',
+                    'outputFaultCount4': '<B',
+                    'outputFaultCount5': '<B',
+                    'outputFaultCount6': '<B',
+                    'outputFaultCount7': '<B',
+                    'outputFaultCount8': '<B',
+                    'outputFaultCount9': '<B',
+                    'outputFaultCount10': '<B',
+                    'outputFaultCount11': '<B',
+                    'outputFaultCount12': '<B',
+                    'outputFaultCount13': '<B',
+                    'outputFaultCount14': '<B',
+                    'outputFaultCount15': '<B',
+                    'outputFaultCount16': '<B',
+                    'outputFaultCount17': '<B',
+                    'outputFaultCount18': '<B',
+                    'temp1_c': '<b',
+                    'temp2_c': '<b',
+                    'temp3_c': '<b',
+                    'temp4_c': '<b',
+                    'temp5_c': '<b',
+                    'temp6_c': '<b',
+                    'temp7_c': '<b',
+                    'temp8_c': '<b',
+                    'temp9_c': '<b',
+                    'temp10_c': '<b',
+                    'temp11_c': '<b',
+                    'temp12_c': '<b',
+                    'temp13_c': '<b',
+                    'temp14_c': '<b',
+                    'battMode': '<B',
+                    'mpptMode': '<B',
+                    'battHeaterMode': '<B',
+                    'battHeaterState': '<B',
+                    'PingWdt_toggles': '<u2',
+                    'PingWdt_turnOffs': '<B'
+                }
+            }
+        },
+        # ALL the EPS CLI commands:
+        'SET_TELEMETERY_PERIOD': {
+            'what': 'Set telemetery collection period on EPS. Magicword is in the docs',
+            'subPort': 255,
+            'inoutInfo': {
+                'args': {
+                    "Magicword" : '<u4',
+                    "Telem_ID" : '<B',
+                    "Period" : '<u4',
+                    "Duration" : '<u4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        # EPS Startup Telemetry
+        'STARTUP_TELEMETRY': {
+            'what': 'Get the startup telemetry from the EPS',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': None,
+                'returns': {
+                    # When fetched via eps CPS command, these values are LE
+                    #'cmd': '>b',
+                    'status': '>b',
+                    'timestamp': '<f8',
+                    'last_reset_reason_reg': '<u4',
+                    'bootCnt': '<u4',
+                    'FallbackConfigUsed': '<B',
+                    'rtcInit': '<B',
+                    'rtcClkSourceLSE': '<B',
+                    'Fram4kPartitionInit': '>b',
+                    'Fram520kPartitionInit': '>b',
+                    'intFlashPartitionInit': '>b',
+                    'FSInit': '>b',
+                    'FTInit': '>b',
+                    'supervisorInit': '>b',
+                    'uart1App': '<B',
+                    'uart2App': '<B',
+                    'tmp107Init': '>b'
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,94 @@
+'''
+ * Copyright (C) 2022  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file serviceTable/updater.py
+ * @date 2026-10-18
+'''
+
+service = {
+    'supports' : ("OBC",),
+    'port': 12,
+    'subservice': {
+        'INITIALIZE_UPDATE': {
+            'what' : 'Start update procedure. Provide address, size, crc. Not intended for operator use. Use updater program',
+            'subPort': 0,
+            'inoutInfo': {
+                'args': {
+                    "Address" : '>u4',
+                    "Size" : '>u4',
+                    "CRC" : '>u2'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'PROGRAM_BLOCK': {
+            'what' : 'Program a single block of data. Not intended for operator use. Use updater program',
+            'subPort': 1,
+            'inoutInfo': {
+                'args': { #TODO: Better names
+                    "Arg1" : '>u4',
+                    "Arg2" : '>u4'
+                },
+                'returns': {
+                    'err': '>b'
+                }
+            }
+        },
+        'GET_PROGRESS' : {
+            'what' : 'Get update progress. Not intended for operator use. Use updater program',
+            'subPort' : 2,
+            'inoutInfo' : {
+                'args' : None,
+                'returns' : {
+                    'err' : '>b',
+                    'start_addr' : '>u4',
+                    'next_addr' : ">u4",
+                    'crc' : '>u2'
+                }
+            }
+        },
+        'ERASE_APP' : {
+            'what' : 'Erase working image. Not intended for operator use. Use updater program',
+            'subPort' : 3,
+            'inoutInfo' : {
+                'args' : None,
+                'returns' : {
+                    'err' : '>b'
+                }
+            }
+        },
+        'VERIFY_APP' : {
+            'what' : 'Verify crc of working image. Not intended for operator use. Use updater program',
+            'subPort' : 4,
+            'inoutInfo' : {
+                'args' : None,
+                'returns' : {
+                    'err' : '>b'
+                }
+            }
+        },
+        'VERIFY_GOLDEN' : {
+            'what' : 'Verify crc of golden image',
+            'subPort' : 5,
+            'inoutInfo' : {
+                'args' : None,
+                'returns' : {
+                    'err' : '>b'
+                }
+            }
+        }
+    }
+}
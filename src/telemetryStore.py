@@ -0,0 +1,216 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file telemetryStore.py
+ * @date 2026-10-18
+'''
+
+import os
+import struct
+import threading
+import time
+import numpy as np
+
+from receiveParser import ReceiveParser
+from system import schema
+
+# Every record in a segment log is this header followed by the raw reply
+RECORD_HEADER = struct.Struct('<dBBBI') # time, src, dport, subPort, length
+
+# Each segment has a .idx file of these, one per record in the log
+INDEX_DTYPE = np.dtype([
+    ('time', '<f8'),
+    ('src', 'u1'),
+    ('dport', 'u1'),
+    ('subPort', 'u1'),
+    ('offset', '<u8'),
+    ('length', '<u4'),
+])
+
+NO_SUBPORT = 0xff # subPort stored for empty replies
+
+class TelemetryRecord:
+    """One archived reply. The raw bytes are only read, and decoded, on request"""
+
+    def __init__(self, store, segment, entry):
+        self.store = store
+        self.segment = segment
+        self.time = float(entry['time'])
+        self.src = int(entry['src'])
+        self.dport = int(entry['dport'])
+        self.subPort = int(entry['subPort'])
+        self.offset = int(entry['offset'])
+        self.length = int(entry['length'])
+
+    def getRaw(self):
+        return self.store.readRaw(self.segment, self.offset, self.length)
+
+    def decode(self):
+        return self.store.receiveParse.parseReturnValue(self.src, self.dport, self.getRaw())
+
+class TelemetryStore:
+    """Append-only archive of every reply received, with a time and port index
+
+    Replies are appended to segment files ('<n>.log') in the store directory,
+    starting a new segment once one reaches segmentSize bytes. Next to each
+    log is an index ('<n>.idx') of fixed size entries, which is all that is
+    read to answer a query; the replies themselves are read and decoded
+    through the system.py schema only when asked for.
+    """
+
+    def __init__(self, directory, segmentSize=16 * 1024 * 1024):
+        self.directory = directory
+        self.segmentSize = segmentSize
+        self.receiveParse = ReceiveParser()
+        self.lock = threading.Lock()
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+        self.indexes = dict() # segment number -> index array, for closed segments
+        segments = sorted(int(name[:-4]) for name in os.listdir(self.directory) if name.endswith(".log"))
+        for segment in segments:
+            self.indexes[segment] = self._loadIndex(segment)
+
+        self.activeSegment = segments[-1] if segments else 0
+        self.activeEntries = list(self.indexes.pop(self.activeSegment, np.zeros(0, INDEX_DTYPE)).tolist())
+        self._openActive()
+
+    def _path(self, segment, ext):
+        return os.path.join(self.directory, "{:06d}.{}".format(segment, ext))
+
+    def _openActive(self):
+        self.logFile = open(self._path(self.activeSegment, "log"), "ab")
+        self.idxFile = open(self._path(self.activeSegment, "idx"), "ab")
+
+    def _loadIndex(self, segment):
+        logSize = os.path.getsize(self._path(segment, "log"))
+        idxPath = self._path(segment, "idx")
+        if os.path.exists(idxPath):
+            index = np.fromfile(idxPath, dtype=INDEX_DTYPE, count=os.path.getsize(idxPath) // INDEX_DTYPE.itemsize)
+            if len(index) == 0 and logSize == 0:
+                return index
+            if len(index) > 0 and int(index[-1]['offset']) + int(index[-1]['length']) == logSize:
+                return index
+        # Missing or out of step with the log (e.g. killed mid append): rebuild
+        index = self._scanLog(segment)
+        index.tofile(idxPath)
+        return index
+
+    def _scanLog(self, segment):
+        entries = []
+        with open(self._path(segment, "log"), "rb") as f:
+            data = f.read()
+        pos = 0
+        while pos + RECORD_HEADER.size <= len(data):
+            timestamp, src, dport, subPort, length = RECORD_HEADER.unpack_from(data, pos)
+            if pos + RECORD_HEADER.size + length > len(data):
+                break # Partial record at the end
+            entries.append((timestamp, src, dport, subPort, pos + RECORD_HEADER.size, length))
+            pos += RECORD_HEADER.size + length
+        if pos != len(data):
+            with open(self._path(segment, "log"), "r+b") as f:
+                f.truncate(pos)
+        return np.array(entries, dtype=INDEX_DTYPE)
+
+    def append(self, src, dport, data, timestamp=None):
+        """Archives one raw reply as received from (src, dport)"""
+        if timestamp is None:
+            timestamp = time.time()
+        subPort = data[0] if len(data) > 0 else NO_SUBPORT
+        with self.lock:
+            if self.logFile.tell() >= self.segmentSize:
+                self._rollSegment()
+            offset = self.logFile.tell() + RECORD_HEADER.size
+            self.logFile.write(RECORD_HEADER.pack(timestamp, src, dport, subPort, len(data)))
+            self.logFile.write(data)
+            self.logFile.flush()
+            entry = (timestamp, src, dport, subPort, offset, len(data))
+            self.idxFile.write(np.array([entry], dtype=INDEX_DTYPE).tobytes())
+            self.idxFile.flush()
+            self.activeEntries.append(entry)
+
+    def _rollSegment(self):
+        self.logFile.close()
+        self.idxFile.close()
+        self.indexes[self.activeSegment] = np.array(self.activeEntries, dtype=INDEX_DTYPE)
+        self.activeSegment += 1
+        self.activeEntries = list()
+        self._openActive()
+
+    def readRaw(self, segment, offset, length):
+        with open(self._path(segment, "log"), "rb") as f:
+            f.seek(offset)
+            return bytearray(f.read(length))
+
+    def _resolve(self, node, service, subservice):
+        """Turns names into sets of acceptable src, dport and subPort values (None = any)"""
+        nodes = [n for n in schema.nodesByAddr.values() if node is None or node in (n[0], n[1])]
+        if not nodes:
+            raise ValueError("No such node {}".format(node))
+        srcs = None if node is None else {n[2] for n in nodes}
+        if service is None:
+            if subservice is not None:
+                raise ValueError("A subservice needs a service")
+            return srcs, None, None
+
+        ports = set()
+        subPorts = set()
+        for nodeType in {n[0] for n in nodes}:
+            serv = schema.getService(nodeType, service)
+            if serv is None:
+                continue
+            ports.add(serv['port'])
+            if subservice is not None:
+                sub = schema.getSubservice(nodeType, service, subservice)
+                if sub is not None:
+                    subPorts.add(sub['subPort'])
+        if not ports or (subservice is not None and not subPorts):
+            raise ValueError("No such service {}.{}".format(service, subservice))
+        return srcs, ports, subPorts if subservice is not None else None
+
+    def query(self, node=None, service=None, subservice=None, start=None, end=None):
+        """Archived replies matching all the filters given, oldest first
+
+        node can be a node name ("EX2_EPS") or type ("EPS"), service and
+        subservice are names from system.py, start and end are unix times.
+        e.g. query("EPS", "TM_CLI", "GENERAL_TELEMETRY", t1, t2)
+        """
+        srcs, ports, subPorts = self._resolve(node, service, subservice)
+        with self.lock:
+            segments = list(self.indexes.items())
+            segments.append((self.activeSegment, np.array(self.activeEntries, dtype=INDEX_DTYPE)))
+
+        records = []
+        for segment, index in segments:
+            if len(index) == 0:
+                continue
+            mask = np.ones(len(index), dtype=bool)
+            if start is not None:
+                mask &= index['time'] >= start
+            if end is not None:
+                mask &= index['time'] <= end
+            if srcs is not None:
+                mask &= np.isin(index['src'], list(srcs))
+            if ports is not None:
+                mask &= np.isin(index['dport'], list(ports))
+            if subPorts is not None:
+                mask &= np.isin(index['subPort'], list(subPorts))
+            records.extend(TelemetryRecord(self, segment, entry) for entry in index[mask])
+        records.sort(key=lambda record: record.time)
+        return records
+
+    def close(self):
+        with self.lock:
+            self.logFile.close()
+            self.idxFile.close()
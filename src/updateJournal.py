@@ -0,0 +1,119 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file updateJournal.py
+ * @date 2026-10-18
+'''
+
+import json
+import os
+
+class UpdateJournal:
+    """Local record of a firmware update in progress, kept across passes
+
+    The first line is a JSON header describing the image being sent, then
+    there is one "<offset> <length>" line per block the satellite has
+    acknowledged. Lines are appended and flushed as acks come in, so a
+    dropped link or a killed process loses at most the line being written,
+    which is ignored when the journal is read back.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.header = None
+        self.acked = list() # merged [start, end) byte ranges of the image
+        self.file = None
+        if os.path.exists(self.path):
+            self._load()
+
+    def _load(self):
+        with open(self.path, "r") as f:
+            lines = f.read().split("\n")
+        try:
+            self.header = json.loads(lines[0])
+        except ValueError:
+            return
+        # The last element is whatever follows the final newline: empty, or
+        # a line cut short by whatever stopped the last pass
+        for line in lines[1:-1]:
+            fields = line.split()
+            if len(fields) != 2:
+                continue
+            offset, length = int(fields[0]), int(fields[1])
+            self._merge(offset, offset + length)
+
+    def matches(self, satellite, start_addr, size, sha256):
+        """True if the journal is for this image going to this satellite and address"""
+        return self.header is not None and self.header.get('satellite') == satellite and \
+            self.header.get('start_addr') == start_addr and self.header.get('size') == size and \
+            self.header.get('sha256') == sha256
+
+    def begin(self, satellite, start_addr, size, crc, sha256):
+        """Starts the journal over for a new update"""
+        self.close()
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self.header = {
+            'satellite': satellite,
+            'start_addr': start_addr,
+            'size': size,
+            'crc': crc,
+            'sha256': sha256,
+        }
+        self.acked = list()
+        self.file = open(self.path, "w")
+        self.file.write(json.dumps(self.header) + "\n")
+        self.file.flush()
+
+    def ack(self, offset, length):
+        self._merge(offset, offset + length)
+        if self.file is None:
+            self.file = open(self.path, "a")
+        self.file.write("{} {}\n".format(offset, length))
+        self.file.flush()
+
+    def _merge(self, start, end):
+        merged = list()
+        for rangeStart, rangeEnd in self.acked:
+            if rangeEnd < start or rangeStart > end:
+                merged.append([rangeStart, rangeEnd])
+            else:
+                start = min(start, rangeStart)
+                end = max(end, rangeEnd)
+        merged.append([start, end])
+        self.acked = sorted(merged)
+
+    def nextOffset(self):
+        """Offset the satellite should be expecting next
+
+        The satellite programs blocks in address order, so only the acked
+        range starting at the beginning of the image counts.
+        """
+        if self.acked and self.acked[0][0] == 0:
+            return self.acked[0][1]
+        return 0
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def finish(self):
+        """The update went through, nothing left to resume"""
+        self.close()
+        self.header = None
+        self.acked = list()
+        if os.path.exists(self.path):
+            os.remove(self.path)
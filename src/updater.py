@@ -20,11 +20,17 @@
 from groundStation import GroundStation
 from options import optionsFactory
 import binascii
+import hashlib
+import mmap
 import os
+import struct
 
 from inputParser import InputParser
 from receiveParser import ReceiveParser
 from system import services
+from windowedSender import WindowedSender
+from firmwareManifest import FirmwareManifest, DeltaPlan
+from updateJournal import UpdateJournal
 from enum import Enum
 
 class updater_failuretype(Enum): # Same values as updater program on satellite
@@ -39,6 +45,30 @@ class updater_failuretype(Enum): # Same values as updater program on satellite
     UPDATE_VERIFYFAILED = 8
     UPDATE_NOSUBSERVICE = 9
 
+# PROGRAM_BLOCK request: subPort, address, length, crc, then the data
+BLOCK_HEADER = struct.Struct('>BIHH')
+
+# Minimum time in ms to wait for these replies however quick the RTT estimate
+# says the link is, since the satellite erases, writes or reads back its flash
+# first. A timeout ends a serial upload, so even a block write gets a few
+# seconds in case one takes longer than usual.
+slowSubservices = {
+    'PROGRAM_BLOCK': 5000,
+    'GET_PROGRESS': 5000,
+    'INITIALIZE_UPDATE': 40000,
+    'ERASE_APP': 40000,
+    'VERIFY_APP': 10000,
+    'VERIFY_GOLDEN': 10000,
+}
+
+class OutOfOrder(Exception):
+    """The satellite expects a different address than the one sent"""
+    pass
+
+class NoUpdateInProgress(Exception):
+    """The satellite isn't expecting any blocks, e.g. it rebooted since INITIALIZE_UPDATE"""
+    pass
+
 class updater(GroundStation):
     #TODO: Better object orientation, maybe a common class with FTP?
     def __init__(self, opts):
@@ -49,27 +79,99 @@ class updater(GroundStation):
         self.blocksize = opts.blocksize
         if self.blocksize % 32 != 0:
             raise ValueError("Blocksize must be a multiple of 32")
+        self.address = opts.address
+        self.start_addr = opts.address
         self.setFile(opts.file)
         self.doresume = opts.resume
-        self.address = opts.address
+        self.window = opts.window
+        self.delta = opts.delta
+        self.planOnly = opts.plan
+        self.manifest = FirmwareManifest(opts.manifest)
+        self.journal = UpdateJournal(os.path.join(opts.journal, "{}.journal".format(self.satellite)))
+        self.from_journal = False
         self.skip = 0
         self.current_block = 0
         self.total_blocks = 0
 
     def setFile(self, filename):
+        """Maps the image and prepares every block's CRC and PROGRAM_BLOCK header
+
+        This is the only pass over the file; the whole image CRC is carried
+        along from block to block rather than computed separately.
+        """
         print(filename)
         self.filename = filename
         self.file = open(self.filename, "rb")
-        self.filesize = os.path.getsize(self.filename)
+        self.filesize = os.fstat(self.file.fileno()).st_size
         if self.filesize == 0:
             raise ValueError("File size is null")
-        self.file_crc = self._crc(self.file.read())
+        self.image = memoryview(mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ))
+        self.port = self.services.get('UPDATER').get('port')
+        subservices = self.services.get('UPDATER').get('subservice')
+        self.program_block = subservices.get('PROGRAM_BLOCK').get('subPort')
+        self.min_timeouts = {subservices.get(name).get('subPort'): timeout for name, timeout in slowSubservices.items()}
+
+        crc = 0
+        sha256 = hashlib.sha256()
+        self.block_crcs = list()
+        for offset in range(0, self.filesize, self.blocksize):
+            block = self.image[offset:offset + self.blocksize]
+            self.block_crcs.append(binascii.crc_hqx(block, 0))
+            crc = binascii.crc_hqx(block, crc)
+            sha256.update(block)
+        self.file_crc = crc
+        self.file_sha256 = sha256.hexdigest()
+        self._build_block_headers()
 
-        self.file.seek(0)
+    def _build_block_headers(self):
+        # Depends on the start address, so is redone if a resume moves it
+        self.header_addr = self.start_addr
+        self.block_headers = [
+            BLOCK_HEADER.pack(self.program_block, self.start_addr + i * self.blocksize,
+                              min(self.blocksize, self.filesize - i * self.blocksize), crc)
+            for i, crc in enumerate(self.block_crcs)
+        ]
 
     def run(self):
+        if self.delta or self.planOnly:
+            plan = self.planDelta()
+            print(plan.format())
+            if self.planOnly:
+                return
+            if plan.unchanged and not self.doresume:
+                print("Image is already on the satellite, nothing to upload")
+                return
         self._init_update()
-        self._send_update()
+        try:
+            self._send()
+        except NoUpdateInProgress:
+            if not self.from_journal:
+                raise
+            # The journal is stale, the satellite lost the update it described
+            print("Satellite has no update in progress, starting over")
+            self.journal.finish()
+            self.doresume = False
+            self.address = self.start_addr
+            self.skip = 0
+            self._init_update()
+            self._send()
+        self.journal.finish()
+        self._record_manifest()
+
+    def _send(self):
+        if self.window > 1:
+            self._send_update_windowed()
+        else:
+            self._send_update()
+
+    def planDelta(self):
+        """Compares the image against the last one programmed to this satellite and address"""
+        previous = self.manifest.get(self.satellite, self.address)
+        return DeltaPlan(self.blocksize, self.filesize, self.block_crcs, previous, self.file_crc)
+
+    def _record_manifest(self):
+        self.manifest.record(self.satellite, self.start_addr, self.filesize,
+                             self.file_crc, self.blocksize, self.block_crcs)
 
     def _transaction(self, command : dict):
         #TODO: This should share an interface with ftp
@@ -77,8 +179,11 @@ class updater(GroundStation):
         dport = command['dport']
         data = command['args']
         try:
+            # Anything still queued is a late reply to an earlier request
+            self.networkManager.flush(dest, dport)
             self.networkManager.send(dest, dport, data)
-            response = self.networkManager.receive(dest, dport, 10000)
+            timeout = self.networkManager.rtt.getTimeout(dest, dport, self.min_timeouts.get(data[0], 0))
+            response = self.networkManager.receive(dest, dport, timeout, subPort=data[0])
             return self.receiveParse.parseReturnValue(dest, dport, response)
         except Exception as e:
             print(e)
@@ -97,38 +202,66 @@ class updater(GroundStation):
         command = self.inParse.parseInput("{}.updater.INITIALIZE_UPDATE({},{},{})".format(self.satellite, self.address, self.filesize, self.file_crc))
         return command
 
-    def _get_block_update_packet(self, data):
-        #TODO: Simplify this
-        subservice = self.services.get('UPDATER').get('subservice').get('PROGRAM_BLOCK').get('subPort')
-        out = bytearray()
-        out.extend(subservice.to_bytes(1, byteorder='big'))
-        out.extend(self.address.to_bytes(4, byteorder='big'))
-        out.extend(len(data).to_bytes(2, byteorder='big'))
-        out.extend(self._crc(data).to_bytes(2, byteorder='big'))
-        out.extend(data)
-
-        command = self.inParse.parseInput("{}.updater.PROGRAM_BLOCK({},{})".format(self.satellite, self.address, len(data)))
-        command['args'] = out
-        return command
+    def _get_block_packet(self, offset):
+        """PROGRAM_BLOCK request for the block at 'offset' in the image"""
+        data = self.image[offset:offset + self.blocksize]
+        if offset % self.blocksize == 0:
+            if self.header_addr != self.start_addr:
+                self._build_block_headers()
+            header = self.block_headers[offset // self.blocksize]
+        else:
+            # Resuming an update that was sent with a different blocksize
+            header = BLOCK_HEADER.pack(self.program_block, self.start_addr + offset, len(data), self._crc(data))
+        return header + data
+
+    def _get_block_update_packet(self, offset):
+        return {'dst': self.satelliteAddr, 'dport': self.port, 'args': self._get_block_packet(offset)}
 
     def _init_update(self):
-        if self.doresume:
+        self.from_journal = self._resume_from_journal()
+        if self.from_journal:
+            print("Resuming from journal at {:#x} ({}/{} bytes sent)".format(self.address, self.skip, self.filesize))
+        elif self.doresume:
             self._setResume()
         else:
             init_packet = self._get_init_packet()
             data = self._transaction(init_packet)
             if data['err'] < 0:
                 err = data['err']
-                if err == -updater_failuretype.UPDATE_INVALIDADDR:
+                if err == -updater_failuretype.UPDATE_INVALIDADDR.value:
                     raise Exception("Invalid application address")
-                elif err == -updater_failuretype.UPDATE_ERASEFAILED:
+                elif err == -updater_failuretype.UPDATE_ERASEFAILED.value:
                     raise Exception("Satellite failed to erase flash")
                 else:
                     raise Exception("Unknown init error {}".format(err))
+            self.start_addr = self.address
+            self._begin_journal()
         self.total_blocks = self.filesize // self.blocksize
         self.current_block = self.skip // self.blocksize
-    def _sendblock(self, data):
-        update_packet = self._get_block_update_packet(data)
+
+    def _resume_from_journal(self):
+        """Picks up where the journal says the last pass stopped, without asking the satellite
+
+        If the satellite disagrees, the first block comes back out of order
+        and the usual resync asks it where it actually is.
+        """
+        if not self.journal.matches(self.satellite, self.address, self.filesize, self.file_sha256):
+            return False
+        offset = self.journal.nextOffset()
+        if offset == 0 or offset >= self.filesize:
+            return False
+        self.start_addr = self.address
+        self.skip = offset
+        self.address = self.start_addr + offset
+        return True
+
+    def _begin_journal(self):
+        self.journal.begin(self.satellite, self.start_addr, self.filesize, self.file_crc, self.file_sha256)
+        if self.skip > 0:
+            self.journal.ack(0, self.skip)
+
+    def _sendblock(self, offset):
+        update_packet = self._get_block_update_packet(offset)
         data = self._transaction(update_packet)
         return data['err']
 
@@ -142,43 +275,90 @@ class updater(GroundStation):
         data = self._transaction(resume_packet);
         if data['err'] < 0:
             err = data['err']
-            if err == -updater_failuretype.UPDATE_NOINIT:
+            if err == -updater_failuretype.UPDATE_NOINIT.value:
                 raise Exception("Cannot resume, no update in progress")
             else:
                 raise Exception("Unknown resume error {}".format(err))
         d = data
         if self.file_crc != d['crc'] :
             raise Exception("Crc of input file differs from CRC of file the satellite is expecting")
+        self.start_addr = int(d['start_addr'])
         self.address = int(d['next_addr'])
         self.skip = int(d['next_addr'] - d['start_addr']);
         print("Skip: {}".format(self.skip))
-        self.file.seek(self.skip) # move the filepointer ahead by the size already sent
+        self._begin_journal()
 
     def _send_update(self):
-        b = bytearray()
-        while True:
-            b = self.file.read(self.blocksize)
-            if len(b) == 0:
-                break
+        offset = self.skip
+        while offset < self.filesize:
+            length = min(self.blocksize, self.filesize - offset)
             print("Sending block {}/{}".format(self.current_block, self.total_blocks));
-            err = self._sendblock(b)
+            err = self._sendblock(offset)
             if err < 0:
-                if err == -updater_failuretype.UPDATE_NOINIT:
-                    raise Exception("No update in progress")
-                elif err == -updater_failuretype.UPDATE_OUTOFORDER:
+                if err == -updater_failuretype.UPDATE_NOINIT.value:
+                    raise NoUpdateInProgress("No update in progress")
+                elif err == -updater_failuretype.UPDATE_OUTOFORDER.value:
                     self._resync()
+                    offset = self.skip
                     continue
-                elif err == -updater_failuretype.UPDATE_CRCMISMATCH:
-                    self.file.seek(-self.blocksize, 1)
+                elif err == -updater_failuretype.UPDATE_CRCMISMATCH.value:
                     continue # Keep trying until CRC is successful
-                elif err == -updater_failuretype.UPDATE_WRITEFAILED:
+                elif err == -updater_failuretype.UPDATE_WRITEFAILED.value:
                     raise Exception("Satellite failed to write to flash")
                 else:
                     raise Exception("Unknown block update error {}".format(err))
+            self.journal.ack(offset, length)
             self.current_block += 1;
-            self.address += len(b)
+            self.address += length
+            offset += length
         return True
-    
+
+    def _send_update_windowed(self):
+        """Sends the image with up to self.window PROGRAM_BLOCKs in flight
+
+        The satellite only programs the block for its next address, so on a
+        CRC mismatch everything from that block on is sent again. A block
+        rejected as out of order means the satellite's next address isn't
+        the one we think it is, so the progress is read back and sending
+        carries on from there.
+        """
+        while True:
+            try:
+                self._send_blocks_windowed()
+                return True
+            except OutOfOrder as e:
+                print(e)
+                self._resync()
+
+    def _send_blocks_windowed(self):
+        # Blocks are named by their offset in the file
+        start_addr = self.start_addr
+
+        def checkReply(offset, data):
+            err = data['err']
+            if err >= 0:
+                self.journal.ack(offset, min(self.blocksize, self.filesize - offset))
+                self.current_block = offset // self.blocksize + 1
+                print("Programmed block {}/{}".format(self.current_block, self.total_blocks))
+                return WindowedSender.ACK
+            if err == -updater_failuretype.UPDATE_CRCMISMATCH.value:
+                return WindowedSender.REWIND # Keep trying until CRC is successful
+            elif err == -updater_failuretype.UPDATE_OUTOFORDER.value:
+                raise OutOfOrder("Block at {:#x} out of order, resyncing".format(start_addr + offset))
+            elif err == -updater_failuretype.UPDATE_NOINIT.value:
+                raise NoUpdateInProgress("No update in progress")
+            elif err == -updater_failuretype.UPDATE_WRITEFAILED.value:
+                raise Exception("Satellite failed to write to flash")
+            else:
+                raise Exception("Unknown block update error {}".format(err))
+
+        sender = WindowedSender(self.networkManager, self.satelliteAddr, self.port, self.window)
+        sender.sendBlocks(range(self.skip, self.filesize, self.blocksize), self._get_block_packet, checkReply)
+        self.address = start_addr + self.filesize
+        self.skip = self.filesize
+        print("Sent {} packets for {} bytes ({} retransmitted)".format(
+            sender.packetsSent, self.filesize, sender.retransmits))
+
 if __name__ == "__main__":
     opts = optionsFactory("updater")
     updaterRunner =  updater(opts.getOptions())
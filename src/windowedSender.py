@@ -0,0 +1,134 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file windowedSender.py
+ * @date 2026-10-18
+'''
+
+from collections import deque
+from receiveParser import ReceiveParser
+
+class WindowedSender:
+    """Sends a sequence of blocks to one port with several requests outstanding
+
+    Replies on a connection come back in the order the requests were sent and
+    carry no block id, so the n'th reply is matched to the n'th outstanding
+    block. For each reply, checkReply(block, reply) returns one of:
+
+        ACK     - block done
+        RETRY   - resend just this block, the others in flight are unaffected
+        REWIND  - the receiver dropped this and everything after it; the
+                  remaining replies in flight are drained and sending restarts
+                  from this block
+
+    or raises to abort, in which case the replies still in flight are drained
+    first. A reply timeout is handled like a REWIND, except the timed out
+    reply is drained as well: it may only be late, and must not be matched
+    to the block resent in its place. Whatever is left on the port after a
+    drain is flushed.
+    """
+    ACK = 0
+    RETRY = 1
+    REWIND = 2
+
+    def __init__(self, networkHandler, dst, dport, window, timeout=None, maxRetries=5):
+        if window < 1:
+            raise ValueError("Window must be at least 1")
+        self.networkHandler = networkHandler
+        self.receiveParse = ReceiveParser()
+        self.dst = dst
+        self.dport = dport
+        self.window = window
+        self.timeout = timeout
+        self.maxRetries = maxRetries
+        self.packetsSent = 0
+        self.retransmits = 0
+        self.timeouts = 0
+
+    def sendBlocks(self, blocks, makePacket, checkReply, holdLast=False):
+        """Sends every block in 'blocks' until each one has been acknowledged
+
+        makePacket(block) builds the request for a block. If holdLast is set,
+        the final block is only sent once all the others have been acked, for
+        receivers that treat it as the end of the transfer.
+        Returns the list of blocks in the order they were acknowledged.
+        """
+        pending = deque(blocks)
+        last = pending.pop() if holdLast and len(pending) > 0 else None
+        inflight = deque()
+        retries = dict()
+        acked = list()
+        sentOnce = set()
+        # Anything still queued is a late reply to an earlier request
+        self.networkHandler.flush(self.dst, self.dport)
+
+        while pending or inflight or last is not None:
+            if not pending and not inflight:
+                pending.append(last)
+                last = None
+            while pending and len(inflight) < self.window:
+                block = pending.popleft()
+                self.networkHandler.send(self.dst, self.dport, makePacket(block))
+                self.packetsSent += 1
+                if block in sentOnce:
+                    self.retransmits += 1
+                sentOnce.add(block)
+                inflight.append(block)
+
+            block = inflight.popleft()
+            try:
+                raw = self.networkHandler.receive(self.dst, self.dport, self.timeout)
+            except Exception:
+                self.timeouts += 1
+                self._countRetry(retries, block)
+                self._drain(len(inflight) + 1)
+                pending.extendleft(reversed([block] + list(inflight)))
+                inflight.clear()
+                continue
+
+            reply = self.receiveParse.parseReturnValue(self.dst, self.dport, raw)
+            try:
+                action = checkReply(block, reply)
+            except Exception:
+                # Aborting: don't leave replies behind for whoever talks to this port next
+                self._drain(len(inflight))
+                raise
+            if action == self.ACK:
+                acked.append(block)
+            elif action == self.RETRY:
+                self._countRetry(retries, block)
+                pending.appendleft(block)
+            elif action == self.REWIND:
+                self._countRetry(retries, block)
+                self._drain(len(inflight))
+                pending.extendleft(reversed([block] + list(inflight)))
+                inflight.clear()
+            else:
+                raise ValueError("Unknown reply action {}".format(action))
+        return acked
+
+    def _countRetry(self, retries, block):
+        retries[block] = retries.get(block, 0) + 1
+        if retries[block] > self.maxRetries:
+            raise Exception("Block {} failed after {} retries".format(block, self.maxRetries))
+
+    def _drain(self, count):
+        # Replies to requests sent after a rewind point are meaningless. Stop
+        # at the first timeout: the rest are most likely lost as well
+        for i in range(count):
+            try:
+                self.networkHandler.receive(self.dst, self.dport, self.timeout)
+            except Exception:
+                break
+        self.networkHandler.flush(self.dst, self.dport)
@@ -0,0 +1,71 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_asyncCSPHandler.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_asyncCSPHandler.py '''
+
+import asyncio
+import pytest
+import time
+
+from asyncCSPHandler import AsyncCSPHandler
+from dummyUtils import LoopbackHandler
+
+def echo(server, port, buf):
+    return [buf]
+
+def test_transact_echo():
+    handler = AsyncCSPHandler(LoopbackHandler(echo))
+    reply = asyncio.run(handler.transact(1, 8, bytearray(b'\x0a'), 1000))
+    assert reply == bytearray(b'\x0a')
+    handler.close()
+
+def test_different_ports_overlap():
+    handler = AsyncCSPHandler(LoopbackHandler(echo, latency=0.2))
+
+    async def run():
+        return await asyncio.gather(
+            handler.transact(1, 8, bytearray(b'\x0a'), 1000),
+            handler.transact(1, 17, bytearray(b'\x03'), 1000),
+            handler.transact(4, 14, bytearray(b'\x00'), 1000))
+
+    start = time.monotonic()
+    replies = asyncio.run(run())
+    assert replies == [bytearray(b'\x0a'), bytearray(b'\x03'), bytearray(b'\x00')]
+    assert time.monotonic() - start < 0.5
+    handler.close()
+
+def test_same_port_serialized():
+    loopback = LoopbackHandler(lambda server, port, buf: [buf], latency=0.1)
+    handler = AsyncCSPHandler(loopback)
+
+    async def run():
+        return await asyncio.gather(
+            handler.transact(1, 8, bytearray(b'\x01'), 1000),
+            handler.transact(1, 8, bytearray(b'\x02'), 1000))
+
+    start = time.monotonic()
+    replies = asyncio.run(run())
+    assert replies == [bytearray(b'\x01'), bytearray(b'\x02')]
+    assert time.monotonic() - start >= 0.2
+    handler.close()
+
+def test_timeout():
+    handler = AsyncCSPHandler(LoopbackHandler(lambda server, port, buf: None))
+    with pytest.raises(Exception, match="No packet received"):
+        asyncio.run(handler.transact(1, 8, bytearray(b'\x0a'), 100))
+    handler.close()
@@ -0,0 +1,90 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_cli.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_cli.py '''
+
+import io
+import json
+import pytest
+
+pytest.importorskip("libcsp_py3")
+
+import numpy as np
+from cli import cli, jsonValue
+from dummyUtils import LoopbackHandler
+from interactiveHandler import InteractiveHandler
+
+batch = """
+# pass 1
+ex2.time_management.get_time
+ex2.general.get_switch_status
+ex2.time_management.set_time(1598436918)
+"""
+
+def makeCli(networkManager=None, dummy=True):
+    runner = cli.__new__(cli) # skip GroundStation setup, no radio here
+    runner.networkManager = networkManager
+    runner.interactive = InteractiveHandler(dummy)
+    return runner
+
+def test_invalid_lines_reported():
+    commands, errors = makeCli().loadBatch(batch.splitlines() + ["ex2.time_management.nope", "garbage"])
+    assert [c[0] for c in commands] == [3, 4, 5]
+    assert [e[0] for e in errors] == [6, 7]
+
+def test_results_in_file_order():
+    runner = makeCli()
+    commands, errors = runner.loadBatch(batch.splitlines())
+    out = io.StringIO()
+    records = runner.runBatch(commands, out)
+    lines = [json.loads(l) for l in out.getvalue().splitlines()]
+    assert [l['line'] for l in lines] == [3, 4, 5]
+    assert all(l['ok'] and l['latency_ms'] >= 0 for l in lines)
+    assert len(records) == 3
+
+def test_parallel_keeps_port_order():
+    sent = list()
+    def responder(server, port, buf):
+        sent.append((port, bytes(buf)))
+        return [bytearray([buf[0], 0]) + bytearray(8)]
+    runner = makeCli(LoopbackHandler(responder, latency=0.05), dummy=False)
+    lines = ["ex2.time_management.get_time"] * 3 + ["ex2.general.get_switch_status"] * 3
+    commands, errors = runner.loadBatch(lines)
+    out = io.StringIO()
+    records = runner.runBatch(commands, out, parallel=2)
+    assert all(r['ok'] for r in records)
+    assert sorted(r['line'] for r in records) == list(range(1, 7))
+    # Both ports overlap, so this takes about half as long as running in order
+    assert max(r['latency_ms'] for r in records) < 1000
+    for port in (8, 11):
+        lineOrder = [r['line'] for r in records if r['dport'] == port]
+        assert lineOrder == sorted(lineOrder)
+
+def test_stop_on_error():
+    def responder(server, port, buf):
+        return None
+    runner = makeCli(LoopbackHandler(responder), dummy=False)
+    commands, errors = runner.loadBatch(["ex2.time_management.get_time"] * 3)
+    for transactObj in (c[2] for c in commands):
+        transactObj.timeout = 10
+    records = runner.runBatch(commands, io.StringIO(), stopOnError=True)
+    assert len(records) == 1 and not records[0]['ok']
+
+def test_json_values():
+    ret = {'err': np.int8(0), 'data': np.arange(3, dtype='>u2'), 'name': np.bytes_(b'abc\x00'), 'bad': float('nan')}
+    assert json.loads(json.dumps(jsonValue(ret))) == {'err': 0, 'data': [0, 1, 2], 'name': 'abc', 'bad': None}
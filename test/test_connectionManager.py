@@ -0,0 +1,113 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_connectionManager.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_connectionManager.py '''
+
+import pytest
+
+pytest.importorskip("libcsp_py3")
+
+import connectionManager
+from connectionManager import ConnectionManager
+
+class FakeCSP:
+    """Just enough of libcsp for the pool: connections are ints, packets bytes"""
+    def __init__(self, monkeypatch):
+        self.connects = list()
+        self.closed = list()
+        self.failConnect = False
+        self.inbox = list()
+        self.freed = 0
+        for name in ('connect', 'close', 'send', 'read', 'buffer_free', 'packet_get_data'):
+            monkeypatch.setattr(connectionManager.libcsp, name, getattr(self, name))
+        monkeypatch.setattr(connectionManager.packetUtils, 'makePacket', bytes)
+
+    def connect(self, prio, server, port, timeout, opts):
+        if self.failConnect:
+            return None
+        self.connects.append((server, port, timeout))
+        return len(self.connects)
+
+    def close(self, conn):
+        self.closed.append(conn)
+
+    def send(self, conn, packet):
+        pass
+
+    def read(self, conn, timeout):
+        return self.inbox.pop(0) if self.inbox else None
+
+    def buffer_free(self, packet):
+        self.freed += 1
+
+    def packet_get_data(self, packet):
+        return packet
+
+def test_options_by_node_type(monkeypatch):
+    csp = FakeCSP(monkeypatch)
+    manager = ConnectionManager(options={6: dict(connectionManager.connectionOptions['default'], timeout=5)})
+    manager.getConn(4, 8)  # EX2_EPS
+    manager.getConn(1, 8)  # EX2 OBC
+    manager.getConn(6, 8)  # YKS_EPS, overridden by address
+    assert [c[2] for c in csp.connects] == [1000, 1000000000, 5]
+
+def test_stats(monkeypatch):
+    csp = FakeCSP(monkeypatch)
+    manager = ConnectionManager()
+    manager.send(1, 8, b'abc')
+    csp.inbox.append(b'12345')
+    assert manager.read(1, 8) == b'12345'
+    assert manager.read(1, 8) is None
+    assert csp.freed == 2 # the sent packet and the received one
+    stats = manager.getStats()[(1, 8)]
+    assert (stats['packetsSent'], stats['bytesSent']) == (1, 3)
+    assert (stats['packetsReceived'], stats['bytesReceived']) == (1, 5)
+    assert manager.getConnections() == [(1, 8)]
+
+def test_reconnect_after_timeouts(monkeypatch):
+    csp = FakeCSP(monkeypatch)
+    manager = ConnectionManager(maxTimeouts=2)
+    first = manager.getConn(1, 8)
+    manager.timedOut(1, 8)
+    assert manager.getConn(1, 8) == first
+    manager.timedOut(1, 8)
+    assert csp.closed == [first]
+    assert manager.getConnections() == []
+    assert manager.getConn(1, 8) != first
+    assert manager.getStats()[(1, 8)]['reconnects'] == 1
+
+def test_connect_failure_backs_off(monkeypatch):
+    csp = FakeCSP(monkeypatch)
+    manager = ConnectionManager(minBackoff=60)
+    csp.failConnect = True
+    with pytest.raises(ConnectionError):
+        manager.getConn(1, 8)
+    csp.failConnect = False
+    with pytest.raises(ConnectionError, match="retrying"):
+        manager.send(1, 8, b'x')
+    manager.pool[(1, 8)].retryAt = 0
+    assert manager.getConn(1, 8) is not None
+
+def test_idle_connections_evicted(monkeypatch):
+    csp = FakeCSP(monkeypatch)
+    manager = ConnectionManager(idleTimeout=10)
+    conn = manager.getConn(1, 8)
+    manager.pool[(1, 8)].lastUsed -= 11
+    manager.lastEviction -= 11
+    assert manager.getConnections() == []
+    assert csp.closed == [conn]
@@ -0,0 +1,88 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_embedCSP.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_embedCSP.py '''
+
+import pytest
+
+from embedCSP import EmbedPacket, ScheduleCompiler, SCHEDULE_ENTRY
+from inputParser import InputParser
+
+HEADER = bytes([0]) # SET_SCHEDULE subPort
+COMMANDS = ["ex2.time_management.get_time()", "ex2.time_management.set_time(1598385718)", "ex2.housekeeping.get_hk(1, 0, 0)"]
+
+def makeSchedule(count):
+    return ["0 {} {} 7 4 5 2030 {}\n".format(i % 60, i // 60, COMMANDS[i % len(COMMANDS)]) for i in range(count)]
+
+def splitEntries(data):
+    entries = list()
+    while data:
+        length = SCHEDULE_ENTRY.unpack_from(data)[-1]
+        end = SCHEDULE_ENTRY.size + length
+        entries.append(bytes(data[:end]))
+        data = data[end:]
+    return entries
+
+def testEntryLayout():
+    entry = ScheduleCompiler().encodeEntry("0 50 1 7 4 5 2030 ex2.time_management.get_time()")
+    command = InputParser().parseInput("ex2.time_management.get_time()")
+    first, repeat, last, dst, dport, length = SCHEDULE_ENTRY.unpack_from(entry)
+    assert (repeat, last, dst, dport, length) == (0, 0, command['dst'], command['dport'], len(command['args']))
+    assert entry[SCHEDULE_ENTRY.size:] == bytes(command['args'])
+
+def testLargeScheduleIsSplit():
+    lines = makeSchedule(200)
+    compiler = ScheduleCompiler()
+    packets = compiler.compile(lines, HEADER, split=True)
+    assert len(packets) > 1
+    entries = list()
+    largest = max(len(entry) for entry in splitEntries(EmbedPacket(lines, bytearray()).embedCSP()))
+    for packet in packets:
+        assert len(packet) <= compiler.maxLength
+        if packet is not packets[-1]:
+            # Only closed once the next entry didn't fit
+            assert len(packet) + largest > compiler.maxLength
+        assert packet[:1] == HEADER
+        entries.extend(splitEntries(packet[1:]))
+    # Same entries, in the same order, as embedding them all in one packet
+    single = EmbedPacket(lines, bytearray(HEADER)).embedCSP()
+    assert entries == splitEntries(single[1:])
+
+    stats = compiler.getStats()
+    assert stats['entries'] == 200
+    assert stats['uniqueCommands'] == len(COMMANDS)
+    assert stats['packets'] == len(packets)
+    assert stats['bytes'] == sum(len(packet) for packet in packets)
+    assert 0 < stats['packingEfficiency'] <= 1
+
+def testLargeScheduleRefusedWithoutSplit():
+    # Until SET_SCHEDULE is known to add to the schedule rather than replace it
+    with pytest.raises(ValueError, match="SET_SCHEDULE packets"):
+        ScheduleCompiler().compile(makeSchedule(200), HEADER)
+
+def testSmallScheduleFitsOnePacket():
+    packets = ScheduleCompiler().compile(makeSchedule(3) + ["\n"], HEADER)
+    assert len(packets) == 1
+    assert len(splitEntries(packets[0][1:])) == 3
+
+def testEmptySchedule():
+    assert ScheduleCompiler().compile([], HEADER) == [bytearray(HEADER)]
+
+def testOversizeEntryRejected():
+    with pytest.raises(ValueError):
+        ScheduleCompiler(maxLength=SCHEDULE_ENTRY.size).compile(makeSchedule(1), HEADER)
@@ -0,0 +1,84 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_firmwareManifest.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_firmwareManifest.py '''
+
+import binascii
+import os
+
+from firmwareManifest import FirmwareManifest, DeltaPlan, blockCrcs
+
+BLOCKSIZE = 32
+
+def testBlockCrcsMatchPerBlockCrc():
+    data = os.urandom(BLOCKSIZE * 3 + 5)
+    crcs = blockCrcs(data, BLOCKSIZE)
+    assert len(crcs) == 4
+    assert crcs[3] == binascii.crc_hqx(data[BLOCKSIZE * 3:], 0)
+
+def testManifestRoundTrip(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    FirmwareManifest(path).record("EX2", 0x200000, 100, 1234, BLOCKSIZE, [1, 2, 3, 4])
+    entry = FirmwareManifest(path).get("EX2", 0x200000)
+    assert entry == {'size': 100, 'crc': 1234, 'blocksize': BLOCKSIZE, 'blocks': [1, 2, 3, 4]}
+    assert FirmwareManifest(path).get("YKS", 0x200000) is None
+
+def testPlanMergesAdjacentChangedBlocks():
+    old = bytearray(os.urandom(BLOCKSIZE * 10))
+    new = bytearray(old)
+    for block in (2, 3, 7):
+        new[block * BLOCKSIZE] ^= 0xff
+    previous = {'blocksize': BLOCKSIZE, 'blocks': blockCrcs(old, BLOCKSIZE)}
+    plan = DeltaPlan(BLOCKSIZE, len(new), blockCrcs(new, BLOCKSIZE), previous)
+    assert plan.changed == [2, 3, 7]
+    assert plan.getRanges() == [(2 * BLOCKSIZE, 2 * BLOCKSIZE), (7 * BLOCKSIZE, BLOCKSIZE)]
+    report = plan.getReport()
+    assert report['bytesChanged'] == 3 * BLOCKSIZE
+    # The update erases the application, so changed ranges save nothing
+    assert report['bytesToSend'] == len(new)
+    assert report['bytesSaved'] == 0
+    assert "saved" not in plan.format()
+
+def testPlanForUnchangedImageSendsNothing():
+    data = os.urandom(BLOCKSIZE * 4 + 3)
+    crcs = blockCrcs(data, BLOCKSIZE)
+    previous = {'blocksize': BLOCKSIZE, 'blocks': crcs, 'crc': binascii.crc_hqx(data, 0)}
+    plan = DeltaPlan(BLOCKSIZE, len(data), crcs, previous, binascii.crc_hqx(data, 0))
+    assert plan.unchanged
+    assert plan.getBytesToSend() == 0
+    assert plan.getReport()['bytesSaved'] == len(data)
+    assert not DeltaPlan(BLOCKSIZE, len(data), crcs, previous, 1234).unchanged
+
+def testPlanWithoutHistorySendsEverything():
+    data = os.urandom(BLOCKSIZE * 4 + 1)
+    plan = DeltaPlan(BLOCKSIZE, len(data), blockCrcs(data, BLOCKSIZE))
+    assert plan.getBytesToSend() == len(data)
+    assert plan.getRanges() == [(0, len(data))]
+
+def testPlanAfterBlocksizeChangeSendsEverything():
+    data = os.urandom(BLOCKSIZE * 4)
+    previous = {'blocksize': BLOCKSIZE * 2, 'blocks': blockCrcs(data, BLOCKSIZE * 2)}
+    plan = DeltaPlan(BLOCKSIZE, len(data), blockCrcs(data, BLOCKSIZE), previous)
+    assert plan.getBytesToSend() == len(data)
+
+def testPlanForShorterImage():
+    old = os.urandom(BLOCKSIZE * 4)
+    new = old[:BLOCKSIZE * 2]
+    previous = {'blocksize': BLOCKSIZE, 'blocks': blockCrcs(old, BLOCKSIZE)}
+    plan = DeltaPlan(BLOCKSIZE, len(new), blockCrcs(new, BLOCKSIZE), previous)
+    assert plan.changed == [1]
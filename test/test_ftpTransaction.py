@@ -0,0 +1,144 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_ftpTransaction.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_ftpTransaction.py '''
+
+
+import os
+import pytest
+import numpy as np
+
+pytest.importorskip("libcsp_py3")
+from ftp import ftpTransaction, FTPData, planBurstRequests, ftpMetrics, ProgressLine
+
+def makeBlock(reqId, blocknum, size=512):
+    return FTPData(reqId, blocknum, np.full(size, blocknum % 128, dtype='b'))
+
+def test_missing_ranges(tmp_path):
+    transaction = ftpTransaction(7, 10, "in", str(tmp_path / "out"))
+    for blocknum in [0, 1, 4, 5, 9]:
+        assert transaction.receiveData(makeBlock(7, blocknum))
+    assert transaction.missingRanges() == [(2, 2), (6, 3)]
+    assert transaction.listMissing() == [2, 3, 6, 7, 8]
+    assert not transaction.isDone()
+
+def test_duplicates_ignored(tmp_path):
+    transaction = ftpTransaction(7, 2, "in", str(tmp_path / "out"))
+    assert transaction.receiveData(makeBlock(7, 1))
+    assert not transaction.receiveData(makeBlock(7, 1))
+    assert transaction.listMissing() == [0]
+
+def test_wrong_id_or_block(tmp_path):
+    transaction = ftpTransaction(7, 2, "in", str(tmp_path / "out"))
+    with pytest.raises(ValueError):
+        transaction.receiveData(makeBlock(8, 0))
+    with pytest.raises(ValueError):
+        transaction.receiveData(makeBlock(7, 2))
+
+def test_end_writes_file(tmp_path):
+    outfile = str(tmp_path / "out.bin")
+    transaction = ftpTransaction(7, 3, "in", outfile, 512, 1124)
+    for blocknum in [2, 0, 1]:
+        transaction.receiveData(makeBlock(7, blocknum, 100 if blocknum == 2 else 512))
+    assert transaction.isDone()
+    assert transaction.missingRanges() == []
+    transaction.end()
+    with open(outfile, "rb") as f:
+        data = f.read()
+    assert data == bytes(512) + bytes([1] * 512) + bytes([2] * 100)
+
+def test_block_offset_past_64k(tmp_path):
+    outfile = str(tmp_path / "out.bin")
+    transaction = ftpTransaction(7, 200, "in", outfile)
+    # The parser hands block numbers over as numpy uint16
+    assert transaction.receiveData(FTPData(7, np.uint16(150), np.full(512, 22, dtype='b')))
+    transaction.outFile.flush()
+    with open(outfile, "rb") as f:
+        data = f.read()
+    assert data[150 * 512:151 * 512] == bytes([22] * 512)
+
+def test_output_preallocated(tmp_path):
+    outfile = str(tmp_path / "out.bin")
+    transaction = ftpTransaction(7, 3, "in", outfile, 512, 1124)
+    transaction.receiveData(makeBlock(7, 1))
+    transaction.outFile.flush()
+    with open(outfile, "rb") as f:
+        data = f.read()
+    assert len(data) == 1124
+    assert data[512:1024] == bytes([1] * 512)
+
+def test_save_and_resume(tmp_path, monkeypatch):
+    monkeypatch.setattr(ftpTransaction, "stateDir", str(tmp_path / "state"))
+    outfile = str(tmp_path / "out.bin")
+    transaction = ftpTransaction(7, 20, "in", outfile, 512, 20 * 512)
+    for blocknum in [0, 3, 4, 19]:
+        transaction.receiveData(makeBlock(7, blocknum))
+    transaction.save()
+
+    resumed = ftpTransaction.load(7)
+    assert resumed.missingRanges() == transaction.missingRanges()
+    for blocknum in resumed.listMissing():
+        resumed.receiveData(makeBlock(7, blocknum))
+    assert resumed.isDone()
+    resumed.end()
+    assert not os.path.exists(ftpTransaction.statePath(7))
+    with open(outfile, "rb") as f:
+        data = f.read()
+    assert data == b"".join(bytes([i] * 512) for i in range(20))
+
+def test_plan_single_range():
+    assert planBurstRequests([(0, 250)], 100, 4) == [(0, 100), (100, 100), (200, 50)]
+    assert planBurstRequests([(0, 250)], 100, 2) == [(0, 100), (100, 100)]
+
+def test_plan_scattered_gaps():
+    gaps = [(3, 1), (10, 2), (40, 1), (90, 5)]
+    assert planBurstRequests(gaps, 100, 4) == gaps
+    assert planBurstRequests(gaps, 100, 2) == gaps[:2]
+
+def test_plan_coalesces_nearby_gaps():
+    gaps = [(3, 1), (5, 2), (9, 1), (40, 1)]
+    assert planBurstRequests(gaps, 100, 4, coalesceGap=2) == [(3, 7), (40, 1)]
+
+def test_transaction_counts_blocks(tmp_path):
+    transaction = ftpTransaction(7, 10, "in", str(tmp_path / "out"))
+    for blocknum in [0, 2, 1, 2, 3]:
+        transaction.receiveData(makeBlock(7, blocknum))
+    stats = transaction.metrics.getStats()
+    assert (stats['blocks'], stats['bytes']) == (4, 4 * 512)
+    assert (stats['duplicates'], stats['outOfOrder']) == (1, 1)
+
+def test_metrics_rates_and_eta():
+    now = [100.0]
+    metrics = ftpMetrics(100, alreadyReceived=20, clock=lambda: now[0])
+    seen = list()
+    metrics.subscribe(lambda m: seen.append(m.blocks))
+    metrics.blocksRequested([(20, 40)])
+    metrics.burstStarted()
+    for blocknum in range(20, 60, 2):
+        now[0] += 0.5
+        metrics.blockReceived(blocknum, 512, True)
+    metrics.burstEnded()
+    metrics.blocksRequested([(22, 10), (60, 10)])
+    stats = metrics.getStats()
+    assert stats['blocksPerSec'] == 2 and stats['bytesPerSec'] == 1024
+    assert stats['received'] == 40 and stats['eta'] == 30
+    assert stats['retransmitRatio'] == 10 / 60
+    assert stats['bursts'] == 1 and stats['meanBurstTime'] == 10
+    assert seen[-1] == 20 and len(seen) == 21
+    line = ProgressLine.format(stats)
+    assert line.startswith("40/100 blocks  40.0%") and line.endswith("ETA 00:30")
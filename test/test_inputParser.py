@@ -0,0 +1,109 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_inputParser.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_inputParser.py '''
+
+
+import pytest
+from inputParser import InputParser, ArgEncoder, LRUCache, encode, getEncoder, getCacheStats, _tokenCache, _commandCache
+
+parser = InputParser()
+
+def test_encode_matches_parse():
+    for cmd, args in [
+            ("EX2.TIME_MANAGEMENT.SET_TIME", (1598385718,)),
+            ("EX2.HOUSEKEEPING.GET_HK", (1, 0, 0)),
+            ("EX2_EPS.CONTROL.SINGLE_OUTPUT_CONTROL", (10, 1, 0)),
+            ("YKS.TIME_MANAGEMENT.GET_TIME", ())]:
+        argStr = "({})".format(",".join(str(a) for a in args)) if args else ""
+        command = parser.parseInput(cmd + argStr)
+        assert encode(*cmd.split("."), *args) == (command['dst'], command['dport'], command['args'])
+
+def test_encoder_is_cached():
+    assert getEncoder("OBC", "TIME_MANAGEMENT", "SET_TIME") is getEncoder("OBC", "TIME_MANAGEMENT", "SET_TIME")
+
+def test_string_argument():
+    encoder = ArgEncoder(3, {'name': '>S6', 'n': '>u2'})
+    assert encoder.pack("abc", 1) == bytearray(b'\x03abc\x00\x00\x00\x00\x01')
+    assert encoder.packTokens(["abc", "1"]) == encoder.pack(b"abc", 1)
+
+def test_mixed_byte_order_not_compiled():
+    with pytest.raises(ValueError):
+        ArgEncoder(0, {'a': '>u2', 'b': '<u2'})
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        encode("EX2", "TIME_MANAGEMENT", "SET_TIME")
+    with pytest.raises(ValueError):
+        encode("EX2", "TIME_MANAGEMENT", "SET_TIME", -1)
+    with pytest.raises(ValueError):
+        encode("NOPE", "TIME_MANAGEMENT", "SET_TIME", 1)
+
+def test_command_cache():
+    before = getCacheStats()['commands']
+    first = parser.parseInput("ex2.time_management.get_time")
+    first['args'].extend(b'\xff') # callers may modify what they get back
+    second = InputParser().parseInput("EX2.TIME_MANAGEMENT.GET_TIME ")
+    after = getCacheStats()['commands']
+    assert second['args'] == bytearray(b'\x0a')
+    assert after['hits'] >= before['hits'] + 1
+
+def test_lexer_cache_returns_copies():
+    tokens = parser.lexer("EX2.TIME_MANAGEMENT.SET_TIME(0)")
+    tokens[-2] = "1234"
+    assert parser.lexer("EX2.TIME_MANAGEMENT.SET_TIME(0)")[-2] == "0"
+
+def parseOrError(command):
+    try:
+        return parser.parseInput(command)
+    except Exception as e:
+        return type(e)
+
+def test_cache_matches_uncached_parse():
+    # Spellings that are, or nearly are, the same command. Each one must
+    # parse the same with the caches warm as it does with them cold
+    commands = [
+        "ex2.time_management.get_time",
+        "EX2.TIME_MANAGEMENT.GET_TIME ",
+        " ex2 .time_management.get_time",
+        "ex 2.time_management.get_time",
+        "ex2.time_management.set_time(1234)",
+        "ex2.time_management.set_time( 1234 )",
+        "ex2.time_management.set_time(1234) ",
+        "ex2.time_management.set_time(1234 )x",
+        "ex2.time_management.set_time(12 34)",
+        "ex2.cli.send_cmd(2, ls)",
+        "ex2.cli.send_cmd(2, LS)",
+    ]
+    cold = list()
+    for command in commands:
+        _tokenCache.clear()
+        _commandCache.clear()
+        cold.append(parseOrError(command))
+    warm = [parseOrError(command) for command in commands]
+    assert warm == cold
+
+def test_lru_eviction():
+    cache = LRUCache(maxSize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.getStats() == {'hits': 2, 'misses': 1, 'size': 2}
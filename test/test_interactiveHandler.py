@@ -0,0 +1,96 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_interactiveHandler.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_interactiveHandler.py '''
+
+import numpy as np
+import pytest
+
+pytest.importorskip("libcsp_py3")
+
+import interactiveHandler as ih
+from dummyUtils import LoopbackHandler
+from receiveParser import getDecoder
+
+def getClass(command, dummy=False):
+    return type(ih.InteractiveHandler(dummy=dummy).getTransactionObject(command, None))
+
+def test_dispatch_by_subservice():
+    assert getClass("ex2.housekeeping.get_hk(1, 0, 0)") is ih.getHKTransaction
+    assert getClass("ex2.time_management.set_time(0)") is ih.setTimeTransaction
+
+def test_dispatch_by_service():
+    assert getClass("ex2.cli.send_cmd(4, help)") is ih.satcliTransaction
+
+def test_deploy_deployables_only():
+    assert getClass("ex2.general.deploy_deployables(1)") is ih.longTimeoutTransaction
+    assert getClass("ex2.general.get_switch_status") is ih.baseTransaction
+
+def test_updater_flash_commands_wait_long():
+    assert getClass("ex2.updater.initialize_update(2097152, 1024, 0)") is ih.longTimeoutTransaction
+    assert getClass("ex2.updater.erase_app") is ih.longTimeoutTransaction
+    assert getClass("ex2.updater.get_progress") is ih.baseTransaction
+
+def test_dummy_dispatch():
+    handler = ih.InteractiveHandler(dummy=True)
+    first = handler.getTransactionObject("ex2.housekeeping.get_hk(1, 0, 0)", None)
+    second = handler.getTransactionObject("ex2.housekeeping.get_hk(1, 0, 0)", None)
+    assert type(first) is ih.dummyHKTransaction
+    assert second.fake_hk_id == first.fake_hk_id + 1
+    assert type(handler.getTransactionObject("ex2.general.get_switch_status", None)) is ih.dummyTransaction
+
+def test_big_schedule_needs_split(tmp_path):
+    schedule = tmp_path / "schedule.txt"
+    schedule.write_text("0 0 0 7 4 5 2030 ex2.time_management.get_time()\n" * 200)
+    command = "ex2.scheduler.set_schedule({})".format(schedule)
+    with pytest.raises(ValueError):
+        ih.InteractiveHandler(dummy=True).getTransactionObject(command, None).execute()
+    ret = ih.InteractiveHandler(dummy=True, splitSchedules=True).getTransactionObject(command, None).execute()
+    assert len(ret['args']) > 1
+
+def test_hk_table(tmp_path):
+    # Two packets with the 'final' flag set, then the last one
+    length = getDecoder(1, 17, 0).minLength
+    packets = [bytearray([0, 0, 1]) + bytearray(length - 3), bytearray([0, 0, 1]) + bytearray(length - 3),
+               bytearray([0, 0, 0]) + bytearray(length - 3)]
+    link = LoopbackHandler(lambda server, port, buf: packets)
+    handler = ih.InteractiveHandler(hkTable=str(tmp_path / "hk.npz"))
+    ret = handler.getTransactionObject("ex2.housekeeping.get_hk(1, 0, 0)", link).execute()
+    assert ret == "3 HK packet(s) saved to {}".format(tmp_path / "hk-0001.npz")
+    columns = np.load(str(tmp_path / "hk-0001.npz"))
+    assert list(columns['err']) == [0, 0, 0]
+    # A second pull, e.g. from the next run of the cli, doesn't overwrite the first
+    handler = ih.InteractiveHandler(hkTable=str(tmp_path / "hk.npz"))
+    ret = handler.getTransactionObject("ex2.housekeeping.get_hk(1, 0, 0)", link).execute()
+    assert ret.endswith(str(tmp_path / "hk-0002.npz"))
+    assert (tmp_path / "hk-0001.npz").exists()
+    assert len(ih.InteractiveHandler().getTransactionObject("ex2.housekeeping.get_hk(1, 0, 0)", link).execute()) == 3
+
+def test_timeout_floor():
+    link = LoopbackHandler(lambda server, port, buf: [bytearray([10, 0, 0, 0, 0, 0])])
+    timeouts = list()
+    receive = link.receive
+    def recordTimeout(server, port, timeout=None, subPort=None):
+        timeouts.append(timeout)
+        return receive(server, port, timeout, subPort)
+    link.receive = recordTimeout
+    for i in range(5):
+        ih.InteractiveHandler().getTransactionObject("ex2.time_management.get_time", link).execute()
+    # Quick replies bring the estimate down, but not the timeout below the floor
+    assert link.rtt.getTimeout(1, 8) < 5000
+    assert timeouts[-1] == 5000
@@ -0,0 +1,108 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_passScheduler.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_passScheduler.py '''
+
+from passScheduler import PassScheduler
+
+class FakeClock:
+    def __init__(self, now=0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+class Job:
+    """Stands in for a transaction that takes 'seconds' on the fake clock"""
+    def __init__(self, name, clock, seconds, fail=False):
+        self.command = name
+        self.clock = clock
+        self.seconds = seconds
+        self.fail = fail
+
+    def execute(self):
+        self.clock.sleep(self.seconds)
+        if self.fail:
+            raise Exception("No packet received")
+        return {'err': 0}
+
+def makeScheduler(clock):
+    return PassScheduler(None, None, clock=clock.time, sleep=clock.sleep)
+
+def names(commands):
+    return [q.command for q in commands]
+
+def test_priority_then_deadline():
+    clock = FakeClock()
+    scheduler = makeScheduler(clock)
+    scheduler.add(Job("hk", clock, 10), priority=1, duration=10)
+    scheduler.add(Job("set_time", clock, 5), priority=5, duration=5)
+    scheduler.add(Job("config", clock, 10), priority=1, deadline=115, duration=10)
+    scheduled, deferred = scheduler.plan(100, 200)
+    # config has to run first to make its deadline, the rest by priority
+    assert names(scheduled) == ["config", "set_time", "hk"]
+    assert deferred == []
+
+def test_low_priority_deferred_when_full():
+    clock = FakeClock()
+    scheduler = makeScheduler(clock)
+    scheduler.add(Job("ftp_chunk", clock, 40), priority=0, duration=40)
+    scheduler.add(Job("hk", clock, 30), priority=3, duration=30)
+    scheduler.add(Job("set_time", clock, 20), priority=5, duration=20)
+    scheduler.add(Job("late", clock, 5), priority=9, deadline=90, duration=5)
+    scheduler.add(Job("tight", clock, 10), priority=4, deadline=105, duration=10)
+    scheduled, deferred = scheduler.plan(100, 160)
+    assert names(scheduled) == ["set_time", "hk"]
+    reasons = {q.command: reason for q, reason in deferred}
+    assert reasons == {
+        "late": "deadline is before AOS",
+        "tight": "deadline too soon after AOS",
+        "ftp_chunk": "no room left before LOS",
+    }
+
+def test_deadline_conflict_defers_lower_priority():
+    clock = FakeClock()
+    scheduler = makeScheduler(clock)
+    scheduler.add(Job("a", clock, 10), priority=5, deadline=110, duration=10)
+    scheduler.add(Job("b", clock, 10), priority=1, deadline=115, duration=10)
+    scheduled, deferred = scheduler.plan(100, 200)
+    assert names(scheduled) == ["a"]
+    assert deferred[0][1] == "can't make its deadline around higher priority work"
+
+def test_run_reports_and_keeps_deferred():
+    clock = FakeClock(50)
+    scheduler = makeScheduler(clock)
+    scheduler.add(Job("hk", clock, 25), priority=5, duration=10) # overruns its estimate
+    scheduler.add(Job("bad", clock, 1, fail=True), priority=4, duration=1)
+    scheduler.add(Job("set_time", clock, 5), priority=3, duration=5)
+    scheduler.add(Job("ftp_chunk", clock, 40), priority=0, duration=40)
+    results = list()
+    report = scheduler.run(100, 130, onResult=lambda q, ok, value: results.append((q.command, ok)))
+    assert clock.now == 126
+    assert [c['command'] for c in report['completed']] == ["hk"]
+    assert report['completed'][0]['elapsed'] == 25
+    assert [c['command'] for c in report['failed']] == ["bad"]
+    assert {d['command']: d['reason'] for d in report['deferred']} == {
+        "ftp_chunk": "longer than the pass",
+        "set_time": "ran out of time in the pass",
+    }
+    assert results == [("hk", True), ("bad", False)]
+    assert names(scheduler.queue) == ["set_time", "ftp_chunk"]
@@ -0,0 +1,110 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_receiveDispatcher.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_receiveDispatcher.py '''
+
+import threading
+import time
+from collections import deque
+
+from receiveDispatcher import ReceiveDispatcher
+
+class FakeLink:
+    """Each (server, port) is a deque of packets, read pops one or returns None"""
+    def __init__(self):
+        self.conns = dict()
+
+    def add(self, server, port, *packets):
+        self.conns.setdefault((server, port), deque()).extend(packets)
+
+    def connections(self):
+        return list(self.conns)
+
+    def read(self, server, port):
+        conn = self.conns[(server, port)]
+        return conn.popleft() if conn else None
+
+def test_packets_are_queued_per_port():
+    link = FakeLink()
+    dispatcher = ReceiveDispatcher(link.connections, link.read)
+    link.add(1, 8, b'a', b'b')
+    link.add(1, 17, b'c')
+    assert dispatcher.poll() == 3
+    assert dispatcher.receive(1, 17, 0) == b'c'
+    assert dispatcher.receive(1, 8, 0) == b'a'
+    assert dispatcher.receive(1, 8, 0) == b'b'
+    assert dispatcher.receive(1, 8, 0) is None
+
+def test_late_reply_discarded_by_next_request():
+    link = FakeLink()
+    dispatcher = ReceiveDispatcher(link.connections, link.read, pollInterval=0.001)
+    dispatcher.start()
+    try:
+        assert dispatcher.receive(1, 8, 20) is None
+        link.add(1, 8, b'late')
+        time.sleep(0.05)
+        # The next request on the port flushes it before sending
+        assert dispatcher.flush(1, 8) == [b'late']
+        link.add(1, 8, b'reply')
+        assert dispatcher.receive(1, 8, 1000) == b'reply'
+        assert dispatcher.getStats()['stale'] == 1
+    finally:
+        dispatcher.stop()
+
+def test_receive_skips_other_subports():
+    link = FakeLink()
+    dispatcher = ReceiveDispatcher(link.connections, link.read)
+    link.add(1, 12, bytes([1, 0xfa]), bytes([2, 0, 1]))
+    dispatcher.poll()
+    assert dispatcher.receive(1, 12, 0, subPort=2) == bytes([2, 0, 1])
+    assert dispatcher.receive(1, 12, 0) is None
+    assert dispatcher.getStats()['stale'] == 1
+
+def test_receive_wakes_on_arrival():
+    link = FakeLink()
+    dispatcher = ReceiveDispatcher(link.connections, link.read)
+    threading.Timer(0.05, dispatcher.deliver, (1, 8, b'x')).start()
+    start = time.monotonic()
+    assert dispatcher.receive(1, 8, 5000) == b'x'
+    assert time.monotonic() - start < 1
+
+def test_subscribers():
+    link = FakeLink()
+    dispatcher = ReceiveDispatcher(link.connections, link.read)
+    seen = list()
+    dispatcher.subscribe(lambda server, port, data: seen.append((server, port, data)))
+    beacons = dispatcher.subscribe(lambda server, port, data: True, port=24)
+    link.add(1, 24, b'nv')
+    link.add(1, 8, b'reply')
+    dispatcher.poll()
+    assert seen == [(1, 24, b'nv'), (1, 8, b'reply')]
+    assert dispatcher.receive(1, 24, 0) is None
+    assert dispatcher.receive(1, 8, 0) == b'reply'
+    dispatcher.unsubscribe(beacons)
+    link.add(1, 24, b'nv2')
+    dispatcher.poll()
+    assert dispatcher.receive(1, 24, 0) == b'nv2'
+    assert dispatcher.getStats()['consumed'] == 1
+
+def test_full_queue_drops_oldest():
+    link = FakeLink()
+    dispatcher = ReceiveDispatcher(link.connections, link.read, maxQueued=2)
+    link.add(1, 8, b'1', b'2', b'3')
+    dispatcher.poll()
+    assert dispatcher.getStats()['dropped'] == 1
+    assert dispatcher.flush(1, 8) == [b'2', b'3']
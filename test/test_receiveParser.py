@@ -0,0 +1,81 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_receiveParser.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_receiveParser.py '''
+
+import numpy as np
+
+from receiveParser import ReceiveParser, compileDecoders, getDecoder, saveColumns
+
+parser = ReceiveParser()
+
+def randomBytes(count, seed=0):
+    # Seeded, so a failure can be reproduced
+    return bytearray(np.random.default_rng(seed).integers(0, 256, count, dtype=np.uint8).tobytes())
+
+def assertSameReturns(a, b):
+    assert list(a.keys()) == list(b.keys())
+    for key in a:
+        if isinstance(a[key], np.ndarray):
+            assert (a[key] == b[key]).all()
+        else:
+            assert type(a[key]) == type(b[key])
+            assert a[key] == b[key] or (a[key] != a[key] and b[key] != b[key]) # NaN
+
+def test_compiled_matches_field_by_field():
+    for (src, dport, subPort), decoder in compileDecoders().items():
+        if decoder is None:
+            continue
+        data = bytearray([subPort]) + randomBytes(decoder.minLength + 3, seed=subPort)
+        assertSameReturns(parser.parseReturnValue(src, dport, data),
+                          parser.parseReturnValueByField(src, dport, data))
+
+def test_get_time():
+    ret = parser.parseReturnValue(1, 8, bytearray(b'\x0a\x00\x5f\x46\x36\x36'))
+    assert ret == {'err': 0, 'timestamp': 1598436918}
+
+def test_memoryview_and_bytes_input():
+    data = bytearray(b'\x00') + randomBytes(getDecoder(1, 17, 0).minLength + 3)
+    expected = parser.parseReturnValue(1, 17, data)
+    assertSameReturns(parser.parseReturnValue(1, 17, memoryview(data)), expected)
+    assertSameReturns(parser.parseReturnValue(1, 17, bytes(data)), expected)
+    assertSameReturns(parser.parseReturnValueByField(1, 17, memoryview(data)), expected)
+    table = parser.parseReturnValues(1, 17, [memoryview(data), bytes(data)])
+    assert table[0].tobytes() == table[1].tobytes() # NaN fields never compare equal
+
+def test_short_packet_falls_back():
+    ret = parser.parseReturnValue(1, 8, bytearray(b'\x0a\x00'))
+    assert ret == {'err': 0, 'timestamp': None}
+
+def test_bulk_decode_matches_single():
+    hk = [bytearray(b'\x00') + randomBytes(getDecoder(1, 17, 0).minLength + 2, seed=i) for i in range(5)]
+    table = parser.parseReturnValues(1, 17, hk)
+    assert len(table) == 5
+    for row, data in zip(table, hk):
+        single = parser.parseReturnValue(1, 17, data)
+        for name in table.dtype.names:
+            assert row[name] == single[name] or row[name] != row[name]
+
+def test_save_columns(tmp_path):
+    data = [bytearray(b'\x0a\x00\x5f\x46\x36\x36'), bytearray(b'\x0a\x00\x5f\x46\x36\x37')]
+    table = parser.parseReturnValues(1, 8, data)
+    saveColumns(table, str(tmp_path / "time.npz"))
+    columns = np.load(str(tmp_path / "time.npz"))
+    assert list(columns['timestamp']) == [1598436918, 1598436919]
+    saveColumns(table, str(tmp_path / "time.npy"))
+    assert (np.load(str(tmp_path / "time.npy")) == table).all()
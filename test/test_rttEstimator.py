@@ -0,0 +1,70 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_rttEstimator.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_rttEstimator.py '''
+
+
+from dummyUtils import LoopbackHandler
+from rttEstimator import RTTEstimator, RTTTable
+
+def test_initial_timeout():
+    estimator = RTTEstimator(initialTimeout=10000)
+    assert estimator.getTimeout() == 10000
+    assert estimator.getStats()['samples'] == 0
+
+def test_converges_on_steady_link():
+    estimator = RTTEstimator(minTimeout=100)
+    for i in range(50):
+        estimator.addSample(300)
+    assert abs(estimator.srtt - 300) < 1
+    assert estimator.getTimeout() < 400
+
+def test_clamped():
+    estimator = RTTEstimator(minTimeout=1000, maxTimeout=60000)
+    estimator.addSample(10)
+    assert estimator.getTimeout() == 1000
+    for i in range(10):
+        estimator.timedOut()
+    assert estimator.getTimeout() == 60000
+    assert estimator.getStats()['timeouts'] == 10
+
+def test_table_per_port():
+    table = RTTTable(minTimeout=10)
+    table.sent(1, 8)
+    table.received(1, 8)
+    assert table.getStats()[(1, 8)]['samples'] == 1
+    assert table.getTimeout(1, 8) < 10000
+    assert table.getTimeout(1, 17) == 10000
+    assert table.getTimeout(1, 8, minimum=40000) == 40000
+
+def test_burst_counts_one_sample():
+    table = RTTTable()
+    table.sent(1, 20)
+    for i in range(10):
+        table.received(1, 20)
+    assert table.getStats()[(1, 20)]['samples'] == 1
+
+def test_loopback_uses_estimate():
+    link = LoopbackHandler(lambda server, port, buf: [buf], latency=0.05)
+    link.rtt.minTimeout = 10
+    for i in range(5):
+        link.send(1, 8, bytearray(b'\x0a'))
+        link.receive(1, 8)
+    stats = link.getRTTStats()[(1, 8)]
+    assert stats['samples'] == 5
+    assert 40 < stats['srtt'] < 100
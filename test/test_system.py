@@ -0,0 +1,72 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_system.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_system.py '''
+
+from system import schema, services, getServices, ServiceTable, SchemaIndex, SatelliteNodes, GroundNodes
+
+def test_node_lookup():
+    assert schema.getSatellite("EX2") == ("OBC", "EX2", 1)
+    assert schema.getSatellite("UHF") is None
+    assert schema.getNode("UHF") == ("GND", "UHF", 16)
+    assert schema.getNodeByAddr(4) == ("EPS", "EX2_EPS", 4)
+
+def test_service_lookup():
+    assert schema.getService("OBC", "HOUSEKEEPING") is services['HOUSEKEEPING']
+    assert schema.getService("EPS", "HOUSEKEEPING") is None
+    assert schema.getServiceByPort("OBC", 11)[0] == "GENERAL"
+    assert schema.getServiceByPort("EPS", 11)[0] == "EPS_FIRMWARE"
+
+def test_subservice_lookup():
+    name, subName, subservice = schema.getSubserviceByPort("OBC", 8, 10)
+    assert (name, subName) == ("TIME_MANAGEMENT", "GET_TIME")
+    assert subservice is schema.getSubservice("OBC", "TIME_MANAGEMENT", "GET_TIME")
+
+def test_get_services_matches_supports():
+    for nodeType in ("OBC", "EPS", "GND"):
+        expected = [s for s in services if nodeType in services[s]['supports']]
+        assert list(getServices(nodeType)) == expected
+
+def test_services_load_on_first_use():
+    table = ServiceTable(services.package, [("FTP_COMMAND", "ftp_command", 20, ("OBC",)), ("ADCS", "adcs", 18, ("OBC",))])
+    index = SchemaIndex(SatelliteNodes, GroundNodes, table)
+    assert list(table) == ["FTP_COMMAND", "ADCS"] and "ADCS" in table
+    assert index.getService("OBC", "FTP_COMMAND") == services["FTP_COMMAND"]
+    assert list(table.loaded) == ["FTP_COMMAND"]
+    assert index.getServiceByPort("OBC", services["ADCS"]["port"])[0] == "ADCS"
+    assert list(table.loaded) == ["FTP_COMMAND", "ADCS"]
+
+def test_reply_lookup_loads_one_service():
+    table = ServiceTable(services.package, [("CSP", "csp", 1, ("EPS", "OBC")),
+                                            ("TIME_MANAGEMENT", "time_management", 8, ("OBC",)),
+                                            ("ADCS", "adcs", 18, ("OBC",))])
+    index = SchemaIndex(SatelliteNodes, GroundNodes, table)
+    name, subName, subservice = index.getSubserviceByPort("OBC", 8, 10)
+    assert (name, subName) == ("TIME_MANAGEMENT", "GET_TIME")
+    assert list(table.loaded) == ["TIME_MANAGEMENT"]
+    assert index.getSubserviceByPort("OBC", 8, 200) is None
+    assert index.getServiceByPort("OBC", 99) is None
+
+def test_port_table_matches_services():
+    # system.py repeats each module's port and supports in the services table
+    for name in services:
+        for nodeType in services[name]['supports']:
+            assert (nodeType, services[name]['port']) in services.ports
+    assert {key: name for key, (name, service) in schema.servicesByPort.items()} == services.ports
+    for key, match in schema.subservicesByPort.items():
+        assert schema.getSubserviceByPort(*key) == match
@@ -0,0 +1,73 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_telemetryStore.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_telemetryStore.py '''
+
+
+import os
+import pytest
+from telemetryStore import TelemetryStore
+
+GET_TIME = bytearray(b'\x0a\x00\x5f\x46\x36\x36')
+EPS_TELEMETRY_PORT = 7
+
+def fillStore(store):
+    for i in range(10):
+        store.append(1, 8, GET_TIME, timestamp=1000 + i)
+        store.append(4, EPS_TELEMETRY_PORT, bytearray([0, 0]) + bytes(200), timestamp=1000 + i)
+
+def test_query_by_time_and_subservice(tmp_path):
+    store = TelemetryStore(str(tmp_path))
+    fillStore(store)
+    records = store.query("EX2", "TIME_MANAGEMENT", "GET_TIME", 1002, 1005)
+    assert [r.time for r in records] == [1002, 1003, 1004, 1005]
+    assert records[0].decode() == {'err': 0, 'timestamp': 1598436918}
+    assert len(store.query("EPS", start=1008)) == 2
+    assert len(store.query()) == 20
+    store.close()
+
+def test_segments_and_reopen(tmp_path):
+    store = TelemetryStore(str(tmp_path), segmentSize=500)
+    fillStore(store)
+    store.close()
+    assert len([name for name in os.listdir(str(tmp_path)) if name.endswith(".log")]) > 1
+
+    store = TelemetryStore(str(tmp_path), segmentSize=500)
+    store.append(1, 8, GET_TIME, timestamp=2000)
+    records = store.query("EX2", "TIME_MANAGEMENT", "GET_TIME")
+    assert len(records) == 11
+    assert all(r.getRaw() == GET_TIME for r in records)
+    store.close()
+
+def test_rebuilds_lost_index(tmp_path):
+    store = TelemetryStore(str(tmp_path))
+    fillStore(store)
+    store.close()
+    os.remove(str(tmp_path / "000000.idx"))
+    with open(str(tmp_path / "000000.log"), "ab") as f:
+        f.write(b'\x00\x01\x02') # torn write at the end
+    store = TelemetryStore(str(tmp_path))
+    assert len(store.query()) == 20
+    store.close()
+
+def test_unknown_names(tmp_path):
+    store = TelemetryStore(str(tmp_path))
+    for args in [("NOPE",), ("EX2", "NOPE"), ("EX2", "TIME_MANAGEMENT", "NOPE")]:
+        with pytest.raises(ValueError):
+            store.query(*args)
+    store.close()
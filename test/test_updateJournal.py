@@ -0,0 +1,65 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_updateJournal.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_updateJournal.py '''
+
+import os
+
+from updateJournal import UpdateJournal
+
+def makeJournal(tmp_path):
+    journal = UpdateJournal(str(tmp_path / "journals" / "EX2.journal"))
+    journal.begin("EX2", 0x200000, 1000, 1234, "abcd")
+    return journal
+
+def testAcksSurviveReload(tmp_path):
+    journal = makeJournal(tmp_path)
+    for offset in range(0, 512, 128):
+        journal.ack(offset, 128)
+    journal.close()
+
+    journal = UpdateJournal(journal.path)
+    assert journal.matches("EX2", 0x200000, 1000, "abcd")
+    assert not journal.matches("EX2", 0x200000, 1000, "ef01")
+    assert not journal.matches("YKS", 0x200000, 1000, "abcd")
+    assert journal.acked == [[0, 512]]
+    assert journal.nextOffset() == 512
+
+def testPartialLastLineIgnored(tmp_path):
+    journal = makeJournal(tmp_path)
+    journal.ack(0, 128)
+    journal.close()
+    with open(journal.path, "a") as f:
+        f.write("128 12")
+    assert UpdateJournal(journal.path).nextOffset() == 128
+
+def testOnlyLeadingRangeCounts(tmp_path):
+    journal = makeJournal(tmp_path)
+    journal.ack(256, 128)
+    assert journal.nextOffset() == 0
+    journal.ack(0, 128)
+    assert journal.acked == [[0, 128], [256, 384]]
+    journal.ack(128, 128)
+    assert journal.acked == [[0, 384]]
+
+def testFinishRemovesJournal(tmp_path):
+    journal = makeJournal(tmp_path)
+    journal.ack(0, 128)
+    journal.finish()
+    assert not os.path.exists(journal.path)
+    assert not UpdateJournal(journal.path).matches("EX2", 0x200000, 1000, "abcd")
@@ -0,0 +1,188 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_updaterWindowed.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_updaterWindowed.py '''
+
+import binascii
+import os
+import pytest
+pytest.importorskip("libcsp_py3")
+
+import groundStation
+from dummyUtils import LoopbackHandler, UpdaterSatellite
+from firmwareManifest import FirmwareManifest
+from options import optionsFactory
+from updater import updater
+
+ADDRESS = 0x00200000
+BLOCKSIZE = 64
+
+@pytest.fixture
+def makeUpdater(monkeypatch, tmp_path):
+    """Builds an updater from command line options, talking to 'satellite' over a LoopbackHandler"""
+    # GroundStation keeps its command history in the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "key.dat").write_bytes(bytes(16))
+
+    def make(filename, satellite, window, delta=False):
+        monkeypatch.setattr(groundStation, "getCSPHandler", lambda *args, **kwargs: LoopbackHandler(satellite))
+        argv = ["--hkeyfile", "key.dat", "--xkeyfile", "key.dat", "-s", "EX2", "-f", filename,
+                "-b", str(BLOCKSIZE), "-a", str(ADDRESS), "-w", str(window),
+                "--manifest", filename + ".manifest", "--journal", str(tmp_path / "journal")]
+        if delta:
+            argv.append("--delta")
+        return updater(optionsFactory("updater").getOptions(argv))
+    return make
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "image.bin"
+    path.write_bytes(os.urandom(BLOCKSIZE * 20 + 17))
+    return path
+
+@pytest.mark.parametrize("window", [1, 4, 16])
+def testWindowedUploadMatchesFile(image, window, makeUpdater):
+    satellite = UpdaterSatellite(corruptRate=0.1, seed=window)
+    up = makeUpdater(str(image), satellite, window)
+    up.run()
+    assert bytes(satellite.flash) == image.read_bytes()
+    assert satellite.nextAddr == ADDRESS + len(image.read_bytes())
+
+def testWindowedUploadResyncsAfterOutOfOrder(image, makeUpdater):
+    satellite = UpdaterSatellite()
+    up = makeUpdater(str(image), satellite, 8)
+    up._init_update()
+    # The satellite already has the first blocks, e.g. from a lost ack
+    data = image.read_bytes()
+    satellite.flash.extend(data[:BLOCKSIZE * 3])
+    satellite.nextAddr = ADDRESS + BLOCKSIZE * 3
+    satellite.crc = up.file_crc
+    up._send_update_windowed()
+    assert bytes(satellite.flash) == data
+
+def testWindowedUploadStopsOnError(image, makeUpdater):
+    satellite = UpdaterSatellite()
+    up = makeUpdater(str(image), satellite, 4)
+    # No INITIALIZE_UPDATE sent, so the satellite answers UPDATE_NOINIT
+    with pytest.raises(Exception, match="No update in progress"):
+        up._send_update_windowed()
+    assert len(up.networkManager.queues[(1, 12)].queue) == 0
+
+def testDeltaSkipsUnchangedImage(image, makeUpdater):
+    satellite = UpdaterSatellite()
+    makeUpdater(str(image), satellite, 4, delta=True).run()
+    sent = len(satellite.flash)
+
+    satellite = UpdaterSatellite()
+    up = makeUpdater(str(image), satellite, 4, delta=True)
+    up.run()
+    assert sent == len(image.read_bytes())
+    assert len(up.networkManager.sent) == 0
+
+def testDeltaUploadsChangedImage(image, makeUpdater):
+    makeUpdater(str(image), UpdaterSatellite(), 4, delta=True).run()
+    data = bytearray(image.read_bytes())
+    data[BLOCKSIZE * 5] ^= 0xff
+    image.write_bytes(bytes(data))
+
+    satellite = UpdaterSatellite()
+    up = makeUpdater(str(image), satellite, 4, delta=True)
+    assert up.planDelta().changed == [5]
+    up.run()
+    assert bytes(satellite.flash) == bytes(data)
+    assert FirmwareManifest(str(image) + ".manifest").get("EX2", ADDRESS)['crc'] == up.file_crc
+
+def testInitWaitsForErase(image, makeUpdater):
+    up = makeUpdater(str(image), UpdaterSatellite(), 1)
+    link = up.networkManager
+    timeouts = list()
+    receive = link.receive
+    def recordTimeout(server, port, timeout=None, subPort=None):
+        timeouts.append((subPort, timeout))
+        return receive(server, port, timeout, subPort)
+    link.receive = recordTimeout
+    up._init_update()
+    up._send_update()
+    # The flash erase gets its minimum, and so do block writes, even once
+    # the learned RTO is lower
+    assert timeouts[0] == (UpdaterSatellite.INITIALIZE_UPDATE, 40000)
+    assert timeouts[1] == (UpdaterSatellite.PROGRAM_BLOCK, 5000)
+    assert up.networkManager.rtt.getTimeout(1, 12) < 5000
+
+def testBlockPacketLayout(image, makeUpdater):
+    up = makeUpdater(str(image), UpdaterSatellite(), 1)
+    data = image.read_bytes()
+    offset = BLOCKSIZE * 20
+    block = data[offset:]
+    expected = bytearray([1]) + (ADDRESS + offset).to_bytes(4, byteorder='big')
+    expected += len(block).to_bytes(2, byteorder='big') + binascii.crc_hqx(block, 0).to_bytes(2, byteorder='big')
+    assert up._get_block_packet(offset) == expected + block
+    assert up.file_crc == binascii.crc_hqx(data, 0)
+
+def testBlockPacketAfterResumeMovesStart(image, makeUpdater):
+    up = makeUpdater(str(image), UpdaterSatellite(), 1)
+    up.start_addr = ADDRESS + 0x1000
+    # Unaligned offsets happen when resuming with a different blocksize
+    for offset in (BLOCKSIZE, BLOCKSIZE + 7):
+        packet = up._get_block_packet(offset)
+        assert int.from_bytes(packet[1:5], byteorder='big') == ADDRESS + 0x1000 + offset
+        assert int.from_bytes(packet[7:9], byteorder='big') == binascii.crc_hqx(packet[9:], 0)
+
+class LinkDrop(Exception):
+    pass
+
+class DroppingSatellite(UpdaterSatellite):
+    """Stops answering for good after 'blocks' PROGRAM_BLOCKs, like LOS mid-update"""
+    def __init__(self, blocks):
+        super().__init__()
+        self.blocks = blocks
+
+    def __call__(self, server, port, buf):
+        if buf[0] == self.PROGRAM_BLOCK:
+            if self.blocks == 0:
+                raise LinkDrop()
+            self.blocks -= 1
+        return super().__call__(server, port, buf)
+
+@pytest.mark.parametrize("window", [1, 4])
+def testResumeFromJournalSkipsProgressRequest(image, window, makeUpdater):
+    satellite = DroppingSatellite(7)
+    # The one-at-a-time path exits when the link goes
+    with pytest.raises((LinkDrop, SystemExit)):
+        makeUpdater(str(image), satellite, window).run()
+    satellite.blocks = -1
+
+    up = makeUpdater(str(image), satellite, window)
+    up.run()
+    assert bytes(satellite.flash) == image.read_bytes()
+    subPorts = [buf[0] for server, port, buf in up.networkManager.sent]
+    assert subPorts[0] == UpdaterSatellite.PROGRAM_BLOCK
+    assert UpdaterSatellite.INITIALIZE_UPDATE not in subPorts
+    # Blocks programmed but not acked before the drop cost one GET_PROGRESS
+    assert subPorts.count(UpdaterSatellite.GET_PROGRESS) <= 1
+    assert not os.path.exists(up.journal.path)
+
+def testStaleJournalStartsOver(image, makeUpdater):
+    with pytest.raises(LinkDrop):
+        makeUpdater(str(image), DroppingSatellite(5), 4).run()
+
+    # The satellite rebooted and lost the update in progress
+    satellite = UpdaterSatellite()
+    up = makeUpdater(str(image), satellite, 1)
+    up.run()
+    assert bytes(satellite.flash) == image.read_bytes()
@@ -0,0 +1,136 @@
+'''
+ * Copyright (C) 2026  University of Alberta
+ *
+ * This program is free software; you can redistribute it and/or
+ * modify it under the terms of the GNU General Public License
+ * as published by the Free Software Foundation; either version 2
+ * of the License, or (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+'''
+'''
+ * @file test_windowedSender.py
+ * @date 2026-10-18
+'''
+
+'''  to run > yarn pytest test/test_windowedSender.py '''
+
+
+import pytest
+import time
+
+from dummyUtils import LoopbackHandler
+from windowedSender import WindowedSender
+
+FTP_PORT = 20
+UPLOAD_SUBPORT = 4
+
+def makePacket(block):
+    return bytearray([UPLOAD_SUBPORT]) + block.to_bytes(4, byteorder='big')
+
+def checkReply(block, reply):
+    return WindowedSender.ACK if reply['err'] == 0 else WindowedSender.RETRY
+
+class FakeUploadTarget:
+    """Stores blocks by number and fails each block in 'failOnce' the first time"""
+    def __init__(self, failOnce=()):
+        self.failOnce = set(failOnce)
+        self.received = list()
+
+    def __call__(self, server, port, buf):
+        block = int.from_bytes(buf[1:5], byteorder='big')
+        if block in self.failOnce:
+            self.failOnce.remove(block)
+            return [bytearray([UPLOAD_SUBPORT, 0xff])]
+        self.received.append(block)
+        return [bytearray([UPLOAD_SUBPORT, 0])]
+
+class FakeInOrderTarget:
+    """Only accepts the next block in sequence, like the satellite updater"""
+    def __init__(self, failOnce=()):
+        self.failOnce = set(failOnce)
+        self.expected = 0
+
+    def __call__(self, server, port, buf):
+        block = int.from_bytes(buf[1:5], byteorder='big')
+        if block in self.failOnce:
+            self.failOnce.remove(block)
+            return [bytearray([UPLOAD_SUBPORT, 0xf9])] # -7 CRC mismatch
+        if block != self.expected:
+            return [bytearray([UPLOAD_SUBPORT, 0xfa])] # -6 out of order
+        self.expected += 1
+        return [bytearray([UPLOAD_SUBPORT, 0])]
+
+def test_all_blocks_acked():
+    target = FakeUploadTarget()
+    sender = WindowedSender(LoopbackHandler(target), 1, FTP_PORT, 8)
+    acked = sender.sendBlocks(range(20), makePacket, checkReply)
+    assert acked == list(range(20))
+    assert sender.packetsSent == 20
+
+def test_selective_retransmit():
+    target = FakeUploadTarget(failOnce=[3, 11])
+    sender = WindowedSender(LoopbackHandler(target), 1, FTP_PORT, 4)
+    acked = sender.sendBlocks(range(20), makePacket, checkReply)
+    assert sorted(acked) == list(range(20))
+    assert sorted(target.received) == list(range(20))
+    assert sender.retransmits == 2
+
+def test_hold_last():
+    target = FakeUploadTarget(failOnce=[2])
+    sender = WindowedSender(LoopbackHandler(target), 1, FTP_PORT, 4)
+    sender.sendBlocks(range(6), makePacket, checkReply, holdLast=True)
+    assert target.received[-1] == 5
+
+def test_rewind():
+    def rewindOnError(block, reply):
+        return WindowedSender.ACK if reply['err'] == 0 else WindowedSender.REWIND
+
+    target = FakeInOrderTarget(failOnce=[5])
+    sender = WindowedSender(LoopbackHandler(target), 1, FTP_PORT, 4)
+    acked = sender.sendBlocks(range(12), makePacket, rewindOnError)
+    assert acked == list(range(12))
+    assert target.expected == 12
+
+def test_timeout_resends():
+    dropped = set()
+    target = FakeUploadTarget()
+
+    def lossy(server, port, buf):
+        block = int.from_bytes(buf[1:5], byteorder='big')
+        if block == 4 and block not in dropped:
+            dropped.add(block)
+            return None
+        return target(server, port, buf)
+
+    sender = WindowedSender(LoopbackHandler(lossy), 1, FTP_PORT, 1, timeout=100)
+    acked = sender.sendBlocks(range(8), makePacket, checkReply)
+    assert acked == list(range(8))
+    assert sender.timeouts == 1
+
+def test_timeout_drains_late_reply():
+    # Block 3's reply turns up after the timeout but before the resend's
+    # reply. Without a drain every reply after it is matched to the wrong
+    # block, and the rejection of block 4 is taken for block 5
+    target = FakeUploadTarget(failOnce=[4])
+
+    class SlowLink(LoopbackHandler):
+        def send(self, server, port, buf):
+            if int.from_bytes(buf[1:5], byteorder='big') == 3 and 3 not in target.received:
+                self.linkFreeAt = time.monotonic() + 0.15
+            super().send(server, port, buf)
+
+    link = SlowLink(target)
+    sender = WindowedSender(link, 1, FTP_PORT, 1, timeout=100)
+    acked = sender.sendBlocks(range(8), makePacket, checkReply)
+    assert acked == list(range(8))
+    assert sorted(set(target.received)) == list(range(8))
+    assert sender.timeouts == 1
+
+def test_too_many_retries():
+    sender = WindowedSender(LoopbackHandler(lambda s, p, b: [bytearray([UPLOAD_SUBPORT, 0xff])]), 1, FTP_PORT, 2, maxRetries=2)
+    with pytest.raises(Exception, match="failed after 2 retries"):
+        sender.sendBlocks(range(4), makePacket, checkReply)